@@ -30,8 +30,12 @@ export default function ISSPage() {
     };
 
     fetchPosition();
-    const interval = setInterval(fetchPosition, 5000);
-    return () => clearInterval(interval);
+    return api.subscribePositions((snapshot) => {
+      if (snapshot.iss) {
+        setPosition(snapshot.iss);
+        setLastUpdate(new Date());
+      }
+    });
   }, []);
 
   return (
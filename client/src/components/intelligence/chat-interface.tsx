@@ -46,7 +46,14 @@ export function ChatInterface({ initialSuggestions = [] }: ChatInterfaceProps) {
 
     try {
       const history: ChatMessage[] = messages.map(({ role, content }) => ({ role, content }));
-      const response = await api.sendChatMessage(query, history);
+      const response = await api.streamChatMessage(query, history, (token) => {
+        setMessages((prev) => {
+          const newMessages = [...prev];
+          const last = newMessages[newMessages.length - 1];
+          newMessages[newMessages.length - 1] = { ...last, content: last.content + token, isLoading: false };
+          return newMessages;
+        });
+      });
 
       setMessages((prev) => {
         const newMessages = [...prev];
@@ -18,12 +18,10 @@ import {
 
 interface PositionTrackerProps {
   autoRefresh?: boolean;
-  refreshInterval?: number;
 }
 
 export function PositionTracker({
   autoRefresh = true,
-  refreshInterval = 30000,
 }: PositionTrackerProps) {
   const [status, setStatus] = useState<TelescopeStatus | null>(null);
   const [loading, setLoading] = useState(true);
@@ -45,10 +43,14 @@ export function PositionTracker({
     fetchStatus();
 
     if (autoRefresh) {
-      const interval = setInterval(fetchStatus, refreshInterval);
-      return () => clearInterval(interval);
+      return api.subscribePositions((snapshot) => {
+        if (snapshot.jwst) {
+          setStatus(snapshot.jwst);
+          setLastUpdate(new Date());
+        }
+      });
     }
-  }, [autoRefresh, refreshInterval]);
+  }, [autoRefresh]);
 
   const formatCoordinate = (value: number | undefined, type: "ra" | "dec") => {
     if (value === undefined || value === null) return "N/A";
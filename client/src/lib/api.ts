@@ -421,7 +421,7 @@ export interface SpaceNews {
   external_id: string;
   title: string;
   summary: string;
-  content: string;
+  content?: string; // omitted from list responses
   url: string;
   image_url: string | null;
   category: string;
@@ -429,6 +429,12 @@ export interface SpaceNews {
   created_at: string;
 }
 
+export interface NewsSearchResult extends SpaceNews {
+  score: number;
+  fts_rank: number | null;
+  vector_distance: number | null;
+}
+
 export interface Insight {
   id: string;
   type: "connection" | "trend" | "gap" | "anomaly";
@@ -437,7 +443,7 @@ export interface Insight {
   confidence_score: number;
   related_news_ids: string[];
   category: string;
-  evidence: string;
+  evidence?: string; // omitted from list responses
   generated_at: string;
   related_news?: SpaceNews[];
 }
@@ -477,6 +483,21 @@ export interface IntelligenceStats {
 }
 
 // API Functions
+export interface PositionSnapshot {
+  iss: ISSPosition | null;
+  jwst: TelescopeStatus | null;
+  timestamp: string;
+}
+
+// Subscribe to the shared ISS/JWST position stream; returns an unsubscribe function
+function subscribePositions(onSnapshot: (snapshot: PositionSnapshot) => void): () => void {
+  const source = new EventSource(`${API_BASE}/stream/positions`);
+  source.addEventListener("positions", (event) => {
+    onSnapshot(JSON.parse((event as MessageEvent).data));
+  });
+  return () => source.close();
+}
+
 export const api = {
   getLaunches: (limit = 10) =>
     fetcher<{ launches: Launch[] }>(`/launches?limit=${limit}`).then(r => r.launches),
@@ -524,6 +545,8 @@ export const api = {
   getJWSTStatus: () =>
     fetcher<TelescopeStatus>(`/telescopes/jwst/status`),
 
+  subscribePositions,
+
   getObservations: (telescope: "jwst" | "hubble", params?: { category?: string; limit?: number; offset?: number }) => {
     const searchParams = new URLSearchParams();
     if (params?.category) searchParams.set("category", params.category);
@@ -545,19 +568,32 @@ export const api = {
   getIntelligenceStats: () =>
     fetcher<IntelligenceStats>(`/intelligence/stats`),
 
-  getCollectedNews: (limit = 50) =>
-    fetcher<{ news: SpaceNews[]; count: number }>(`/intelligence/news?limit=${limit}`),
+  getCollectedNews: (limit = 50, cursor?: string) =>
+    fetcher<{ news: SpaceNews[]; count: number; next_cursor: string | null }>(
+      `/intelligence/news?limit=${limit}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "")
+    ),
+
+  searchNews: (query: string, params?: { limit?: number; since?: string; until?: string; source?: string; category?: string }) => {
+    const searchParams = new URLSearchParams({ q: query });
+    if (params?.limit) searchParams.set("limit", String(params.limit));
+    if (params?.since) searchParams.set("since", params.since);
+    if (params?.until) searchParams.set("until", params.until);
+    if (params?.source) searchParams.set("source", params.source);
+    if (params?.category) searchParams.set("category", params.category);
+    return fetcher<{ results: NewsSearchResult[]; count: number }>(`/intelligence/search?${searchParams}`);
+  },
 
   triggerNewsCollection: () =>
     fetch(`${API_BASE}/intelligence/collect`, { method: "POST" }).then(r => r.json()),
 
-  getInsights: (params?: { type?: string; category?: string; limit?: number }) => {
+  getInsights: (params?: { type?: string; category?: string; limit?: number; cursor?: string }) => {
     const searchParams = new URLSearchParams();
     if (params?.type) searchParams.set("type", params.type);
     if (params?.category) searchParams.set("category", params.category);
     if (params?.limit) searchParams.set("limit", String(params.limit));
+    if (params?.cursor) searchParams.set("cursor", params.cursor);
     const query = searchParams.toString();
-    return fetcher<{ insights: Insight[]; count: number }>(
+    return fetcher<{ insights: Insight[]; count: number; next_cursor: string | null }>(
       `/intelligence/insights${query ? `?${query}` : ""}`
     );
   },
@@ -568,9 +604,13 @@ export const api = {
   triggerPatternAnalysis: (days = 7) =>
     fetch(`${API_BASE}/intelligence/analyze?days=${days}`, { method: "POST" }).then(r => r.json()),
 
-  getAlerts: (unreadOnly = true, limit = 20) =>
-    fetcher<{ alerts: Alert[]; count: number }>(
-      `/intelligence/alerts?unread_only=${unreadOnly}&limit=${limit}`
+  getJob: (jobId: string) =>
+    fetch(`${API_BASE}/intelligence/jobs/${jobId}`, { cache: "no-store" }).then(r => r.json()),
+
+  getAlerts: (unreadOnly = true, limit = 20, cursor?: string) =>
+    fetcher<{ alerts: Alert[]; count: number; next_cursor: string | null }>(
+      `/intelligence/alerts?unread_only=${unreadOnly}&limit=${limit}` +
+        (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "")
     ),
 
   markAlertSeen: (alertId: string) =>
@@ -589,9 +629,58 @@ export const api = {
     return res.json() as Promise<ChatResponse>;
   },
 
-  getChatHistory: (limit = 20) =>
-    fetcher<{ conversations: Array<{ id: string; user_query: string; assistant_response: string; created_at: string }>; count: number }>(
-      `/intelligence/chat/history?limit=${limit}`
+  // Streams the reply as server-sent events, calling onToken as text arrives
+  streamChatMessage: async (
+    query: string,
+    conversationHistory: ChatMessage[] | undefined,
+    onToken: (text: string) => void,
+  ) => {
+    const res = await fetch(`${API_BASE}/intelligence/chat/stream`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({
+        query,
+        conversation_history: conversationHistory,
+      }),
+    });
+    if (!res.ok || !res.body) throw new Error(`API error: ${res.status}`);
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    let text = "";
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary = buffer.indexOf("\n\n");
+      while (boundary !== -1) {
+        const frame = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf("\n\n");
+
+        const data = frame.split("\n").find((line) => line.startsWith("data: "));
+        if (!data) continue;
+        const event = JSON.parse(data.slice(6));
+
+        if (event.type === "token") {
+          text += event.text;
+          onToken(event.text);
+        } else if (event.type === "done") {
+          return { response: text, sources: event.sources, conversation_id: event.conversation_id } as ChatResponse;
+        } else if (event.type === "error") {
+          throw new Error(event.detail);
+        }
+      }
+    }
+    throw new Error("Chat stream ended unexpectedly");
+  },
+
+  getChatHistory: (limit = 20, cursor?: string) =>
+    fetcher<{ conversations: Array<{ id: string; user_query: string; assistant_response: string; created_at: string }>; count: number; next_cursor: string | null }>(
+      `/intelligence/chat/history?limit=${limit}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : "")
     ),
 
   getChatSuggestions: () =>
@@ -1,8 +1,6 @@
-from db.session import SessionLocal
+from db.session import AsyncSessionLocal
 
-def get_db():
-    db = SessionLocal()
-    try:
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
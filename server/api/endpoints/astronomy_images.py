@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 import httpx
 from core.cache import get_cached, set_cache
 from core.config import settings
+from core.http_clients import get_http_client
 
 router = APIRouter()
 
@@ -20,16 +21,16 @@ async def get_astronomy_picture_of_the_day():
         return cached
 
     params = {"api_key": settings.NASA_API_KEY}
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        try:
-            response = await client.get(NASA_APOD_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+    client = get_http_client("nasa")
+    try:
+        response = await client.get(NASA_APOD_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
 
-            # Cache for 6 hours (APOD changes daily)
-            await set_cache(cache_key, data, expire=21600)
-            return data
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(status_code=exc.response.status_code, detail=f"Error response {exc.response.status_code} from NASA API.")
-        except httpx.RequestError as exc:
-            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
+        # Cache for 6 hours (APOD changes daily)
+        await set_cache(cache_key, data, expire=21600)
+        return data
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(status_code=exc.response.status_code, detail=f"Error response {exc.response.status_code} from NASA API.")
+    except httpx.RequestError as exc:
+        raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
@@ -1,13 +1,20 @@
 """API endpoints for the AI intelligence system."""
 
+import json
+from datetime import datetime
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from services import news_collector, intelligence_service, chat_service
+from core import job_queue
+from services import news_collector, intelligence_service, chat_service, search_service
 
 router = APIRouter()
 
+# Upper bound for list and search page sizes
+MAX_PAGE_SIZE = 100
+
 
 # Request/Response models
 class ChatRequest(BaseModel):
@@ -40,25 +47,49 @@ async def get_dashboard_stats():
 # =============================================================================
 
 @router.get("/intelligence/news")
-async def get_collected_news(limit: int = 50):
-    """Get recently collected news."""
+async def get_collected_news(limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
+    """Get recently collected news; pass next_cursor as cursor for the next page."""
+    try:
+        news, next_cursor = await news_collector.get_recent_news(limit, cursor)
+        return {"news": news, "count": len(news), "next_cursor": next_cursor}
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/intelligence/search")
+async def search_news(
+    q: str,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+):
+    """Search collected news by keywords and meaning (hybrid full-text + vector ranking)."""
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Query must not be empty")
     try:
-        news = await news_collector.get_recent_news(limit)
-        return {"news": news, "count": len(news)}
+        results = await search_service.search_news(
+            q,
+            limit=limit,
+            since=since,
+            until=until,
+            source=source,
+            category=category,
+        )
+        return {"results": results, "count": len(results)}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.post("/intelligence/collect")
-async def trigger_news_collection(background_tasks: BackgroundTasks):
-    """Manually trigger news collection (admin endpoint)."""
+async def trigger_news_collection():
+    """Queue a news collection run (admin endpoint); poll /intelligence/jobs/{job_id}."""
     try:
-        # Run collection in background
-        result = await news_collector.collect_all_news()
-        return {
-            "status": "completed",
-            "result": result,
-        }
+        job_id = await job_queue.enqueue("collect_news")
+        return {"status": "queued", "job_id": job_id}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -71,16 +102,20 @@ async def trigger_news_collection(background_tasks: BackgroundTasks):
 async def get_insights(
     type: Optional[str] = None,
     category: Optional[str] = None,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
 ):
-    """Get AI-detected insights."""
+    """Get AI-detected insights; pass next_cursor as cursor for the next page."""
     try:
-        insights = await intelligence_service.get_insights(
+        insights, next_cursor = await intelligence_service.get_insights(
             insight_type=type,
             category=category,
             limit=limit,
+            cursor=cursor,
         )
-        return {"insights": insights, "count": len(insights)}
+        return {"insights": insights, "count": len(insights), "next_cursor": next_cursor}
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -101,13 +136,38 @@ async def get_insight_detail(insight_id: str):
 
 @router.post("/intelligence/analyze")
 async def trigger_pattern_analysis(days: int = 7):
-    """Manually trigger pattern analysis (admin endpoint)."""
+    """Queue a pattern analysis run (admin endpoint); poll /intelligence/jobs/{job_id}."""
+    try:
+        job_id = await job_queue.enqueue("analyze_patterns", {"days": days})
+        return {"status": "queued", "job_id": job_id}
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+# =============================================================================
+# Jobs
+# =============================================================================
+
+@router.get("/intelligence/jobs")
+async def get_jobs(name: Optional[str] = None, limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE)):
+    """Get recent background job runs."""
+    try:
+        jobs = await job_queue.get_recent_jobs(name=name, limit=limit)
+        return {"jobs": jobs, "count": len(jobs)}
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/intelligence/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get status, progress and result of a background job."""
     try:
-        result = await intelligence_service.analyze_patterns(days)
-        return {
-            "status": "completed",
-            "result": result,
-        }
+        job = await job_queue.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+    except HTTPException:
+        raise
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -117,14 +177,24 @@ async def trigger_pattern_analysis(days: int = 7):
 # =============================================================================
 
 @router.get("/intelligence/alerts")
-async def get_alerts(unread_only: bool = True, limit: int = 20):
-    """Get alerts for significant patterns."""
+async def get_alerts(
+    unread_only: bool = True,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    """Get alerts for significant patterns, newest first.
+
+    Pass the returned next_cursor as cursor to fetch the following page.
+    """
     try:
-        alerts = await intelligence_service.get_alerts(
+        alerts, next_cursor = await intelligence_service.get_alerts(
             unread_only=unread_only,
             limit=limit,
+            cursor=cursor,
         )
-        return {"alerts": alerts, "count": len(alerts)}
+        return {"alerts": alerts, "count": len(alerts), "next_cursor": next_cursor}
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -160,12 +230,38 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post("/intelligence/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """Chat with the AI assistant, streaming the response as server-sent events."""
+
+    async def event_source():
+        try:
+            async for event in chat_service.chat_stream(
+                user_query=request.query,
+                conversation_history=request.conversation_history,
+            ):
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        except Exception as exc:
+            yield f"event: error\ndata: {json.dumps({'type': 'error', 'detail': str(exc)})}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/intelligence/chat/history")
-async def get_chat_history(limit: int = 20):
-    """Get chat conversation history."""
+async def get_chat_history(limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
+    """Get chat conversation history; pass next_cursor as cursor for the next page."""
     try:
-        history = await chat_service.get_chat_history(limit)
-        return {"conversations": history, "count": len(history)}
+        history, next_cursor = await chat_service.get_chat_history(limit, cursor)
+        return {"conversations": history, "count": len(history), "next_cursor": next_cursor}
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
@@ -1,21 +1,38 @@
 from fastapi import APIRouter, HTTPException
 import httpx
 
+from core.http_clients import get_http_client
+from services import iss_tracker
+
 router = APIRouter()
 
 ISS_API_URL = "https://api.wheretheiss.at/v1/satellites/25544"
 
 @router.get("/iss-tracking")
-async def get_iss_position():
+async def get_iss_position(track_points: int = 0, track_step: int = 60):
     """
-    Fetches the current position of the International Space Station.
+    Returns the current position of the International Space Station.
+
+    Positions are propagated locally with SGP4 from a periodically refreshed
+    TLE. Pass track_points to also get the ground track for that many future
+    positions, track_step seconds apart.
     """
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(ISS_API_URL)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as exc:
-            raise HTTPException(status_code=exc.response.status_code, detail=f"Error response {exc.response.status_code} from ISS API.")
-        except httpx.RequestError as exc:
-            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
+    if not iss_tracker.is_ready() and iss_tracker.should_retry():
+        await iss_tracker.refresh_tle()
+
+    if iss_tracker.is_ready():
+        position = iss_tracker.get_position()
+        if track_points > 0:
+            position["ground_track"] = iss_tracker.get_ground_track(track_points, max(track_step, 1))
+        return position
+
+    # No TLE available yet - fall back to the upstream API
+    client = get_http_client("iss")
+    try:
+        response = await client.get(ISS_API_URL)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as exc:
+        raise HTTPException(status_code=exc.response.status_code, detail=f"Error response {exc.response.status_code} from ISS API.")
+    except httpx.RequestError as exc:
+        raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
@@ -1,12 +1,11 @@
 import re
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from typing import Optional
 
+from fastapi import APIRouter, HTTPException
+
+from core import job_queue
 from services.launch_library import fetch_upcoming_launches, fetch_launch_by_id, fetch_launch_by_slug
-from services.enrichment_service import (
-    get_enrichment_for_launch,
-    trigger_enrichment,
-    run_daily_enrichment,
-)
+from services.enrichment_service import get_enrichment_for_launch
 
 router = APIRouter()
 
@@ -44,7 +43,8 @@ async def get_launch(launch_identifier: str):
         if launch_id:
             enrichment = await get_enrichment_for_launch(launch_id)
             if enrichment:
-                launch["enrichment"] = enrichment
+                # Copy rather than mutate the (possibly shared) cached dict
+                launch = {**launch, "enrichment": enrichment}
 
         return launch
     except HTTPException:
@@ -54,21 +54,23 @@ async def get_launch(launch_identifier: str):
 
 
 @router.post("/launches/{launch_id}/enrich")
-async def enrich_launch_endpoint(launch_id: str, background_tasks: BackgroundTasks):
-    """Trigger enrichment for a specific launch (runs in background)."""
+async def enrich_launch_endpoint(launch_id: str):
+    """Trigger enrichment for a specific launch (runs on the job worker)."""
     try:
-        # Run enrichment in background
-        background_tasks.add_task(trigger_enrichment, "launch", launch_id)
-        return {"status": "enrichment_started", "launch_id": launch_id}
+        job_id = await job_queue.enqueue(
+            "enrich_entity", {"entity_type": "launch", "entity_id": launch_id}
+        )
+        return {"status": "enrichment_started", "launch_id": launch_id, "job_id": job_id}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.post("/enrichment/run")
-async def run_enrichment_job(background_tasks: BackgroundTasks):
-    """Manually trigger the daily enrichment job."""
+async def run_enrichment_job(batch: Optional[bool] = None):
+    """Manually trigger the daily enrichment job (batch overrides ENRICHMENT_BATCH_MODE)."""
     try:
-        background_tasks.add_task(run_daily_enrichment)
-        return {"status": "enrichment_job_started"}
+        params = {"batch": batch} if batch is not None else {}
+        job_id = await job_queue.enqueue("daily_enrichment", params)
+        return {"status": "enrichment_job_started", "job_id": job_id}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -0,0 +1,29 @@
+"""Server-sent event streams for live positions."""
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from services import position_stream
+
+router = APIRouter()
+
+
+@router.get("/stream/positions")
+async def stream_positions():
+    """Stream ISS position and JWST status as server-sent events."""
+
+    async def event_source():
+        async for message in position_stream.subscribe():
+            if message is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: positions\ndata: {message}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -2,8 +2,8 @@
 
 from typing import Optional
 from fastapi import APIRouter, HTTPException
-import httpx
 from core.cache import get_cached, set_cache
+from core.http_clients import get_http_client
 from services.mast_service import (
     fetch_jwst_status,
     fetch_recent_observations_simple,
@@ -114,10 +114,10 @@ async def get_jwst_images(limit: int = 12):
             "year_start": "2022",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client("nasa_images")
+        response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         items = data.get("collection", {}).get("items", [])[:limit]
 
@@ -162,10 +162,10 @@ async def get_hubble_images(limit: int = 12):
             "year_start": "2020",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client("nasa_images")
+        response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         items = data.get("collection", {}).get("items", [])[:limit]
 
@@ -209,10 +209,10 @@ async def get_probe_images(probe: str = "voyager", limit: int = 12):
             "media_type": "image",
         }
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client("nasa_images")
+        response = await client.get(NASA_IMAGE_LIBRARY_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
 
         items = data.get("collection", {}).get("items", [])[:limit]
 
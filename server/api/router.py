@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from api.endpoints import celestial_objects, missions, iss_tracking, asteroids, astronomy_images, space_weather, launches, mars, analytics, telescopes, intelligence
+from api.endpoints import celestial_objects, missions, iss_tracking, asteroids, astronomy_images, space_weather, launches, mars, analytics, telescopes, intelligence, stream
 
 api_router = APIRouter()
 
@@ -15,3 +15,4 @@ api_router.include_router(mars.router, prefix="/api", tags=["mars"])
 api_router.include_router(analytics.router, prefix="/api", tags=["analytics"])
 api_router.include_router(telescopes.router, prefix="/api", tags=["telescopes"])
 api_router.include_router(intelligence.router, prefix="/api", tags=["intelligence"])
+api_router.include_router(stream.router, prefix="/api", tags=["stream"])
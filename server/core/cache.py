@@ -1,12 +1,92 @@
-"""Redis caching utilities."""
+"""Redis caching utilities.
 
+cached_fetch keeps a size-bounded in-process LRU tier in front of Redis.
+Writes and invalidations are broadcast over Redis pub/sub so every worker
+drops its local copy of a key that changed elsewhere.
+"""
+
+import asyncio
 import json
-from typing import Any, Optional
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 from redis import asyncio as aioredis
 from core.config import settings
 
 redis_client: Optional[aioredis.Redis] = None
 
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Identifies this worker's own invalidation messages
+WORKER_ID = uuid.uuid4().hex
+
+# How long a worker may hold the cross-worker load lock before it expires.
+# Must outlast the slowest loader (MAST: up to two 30s requests), or a
+# second worker starts a duplicate load while the first is still running.
+LOCK_TTL_MS = 75000
+LOCK_POLL_INTERVAL = 0.1
+
+# Release the lock only if we still own it (compare-and-delete)
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# In-flight loads per cache key within this process
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+_invalidation_task: Optional["asyncio.Task[None]"] = None
+
+# Hit/miss counters per tier for cached_fetch lookups
+_stats: Dict[str, Dict[str, int]] = {
+    "local": {"hits": 0, "misses": 0},
+    "redis": {"hits": 0, "misses": 0},
+}
+
+
+class LocalCache:
+    """Size-bounded in-process LRU of decoded entries with per-entry expiry.
+
+    Values are shared between callers, so they must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+local_cache = LocalCache(settings.CACHE_LOCAL_MAX_ENTRIES)
+
 
 async def get_redis() -> aioredis.Redis:
     """Get Redis client instance."""
@@ -39,3 +119,231 @@ async def set_cache(key: str, value: Any, expire: int = 300) -> None:
         await redis.setex(key, expire, json.dumps(value))
     except Exception:
         pass
+
+
+async def cached_fetch(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int = 300,
+    stale_ttl: int = 0,
+) -> Any:
+    """Return the cached value for key, loading it at most once on a miss.
+
+    Entries are fresh for ttl seconds. For a further stale_ttl seconds the
+    stale value is still returned immediately while a background refresh
+    is scheduled; after that the entry expires and callers wait for a load.
+
+    Concurrent misses for the same key share a single in-process load, and
+    a short Redis lock makes other workers wait for that load instead of
+    calling the upstream themselves. A loader result of None is returned
+    but not cached.
+    """
+    entry = await _get_entry(key)
+    if entry is not None:
+        if entry["fresh_until"] <= time.time():
+            _start_load(key, loader, ttl, stale_ttl, background=True)
+        return entry["v"]
+
+    task = _start_load(key, loader, ttl, stale_ttl)
+
+    # Shield so a cancelled caller doesn't abort the load for everyone else
+    return await asyncio.shield(task)
+
+
+async def _get_entry(key: str) -> Optional[Dict[str, Any]]:
+    """Get a cached_fetch entry, checking the local tier before Redis.
+
+    Entries look like {"v": value, "fresh_until": epoch, "expires_at": epoch}.
+    """
+    entry = local_cache.get(key)
+    if entry is not None:
+        _stats["local"]["hits"] += 1
+        return entry
+    _stats["local"]["misses"] += 1
+
+    entry = await get_cached(key)
+    if isinstance(entry, dict) and "fresh_until" in entry and "v" in entry:
+        _stats["redis"]["hits"] += 1
+        _set_local(key, entry)
+        return entry
+    _stats["redis"]["misses"] += 1
+    return None
+
+
+async def _set_entry(key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+    """Store a cached_fetch entry that expires once it is too stale to serve."""
+    now = time.time()
+    entry = {"v": value, "fresh_until": now + ttl, "expires_at": now + ttl + stale_ttl}
+    await set_cache(key, entry, expire=ttl + stale_ttl)
+    _set_local(key, entry)
+    await _publish_invalidation(key)
+
+
+def _set_local(key: str, entry: Dict[str, Any]) -> None:
+    """Keep an entry in the local tier, capped in case an invalidation is missed."""
+    expires_at = entry.get("expires_at", entry["fresh_until"])
+    local_cache.set(key, entry, min(expires_at, time.time() + settings.CACHE_LOCAL_MAX_TTL))
+
+
+async def invalidate(key: str) -> None:
+    """Remove a key from Redis and from the local tier of every worker."""
+    local_cache.delete(key)
+    try:
+        redis = await get_redis()
+        await redis.delete(key)
+    except Exception:
+        pass
+    await _publish_invalidation(key)
+
+
+async def _publish_invalidation(key: str) -> None:
+    """Tell other workers to drop their local copy of key."""
+    try:
+        redis = await get_redis()
+        await redis.publish(INVALIDATION_CHANNEL, json.dumps({"origin": WORKER_ID, "key": key}))
+    except Exception:
+        pass
+
+
+async def _listen_for_invalidations() -> None:
+    """Evict keys changed by other workers; reconnect on errors."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(INVALIDATION_CHANNEL)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != WORKER_ID:
+                        local_cache.delete(payload.get("key"))
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Cache] Invalidation listener error: {e}")
+        # Messages may have been missed while disconnected
+        local_cache.clear()
+        await asyncio.sleep(1)
+
+
+def start_invalidation_listener() -> None:
+    """Start the pub/sub listener that keeps the local tier coherent."""
+    global _invalidation_task
+    if _invalidation_task is None:
+        _invalidation_task = asyncio.ensure_future(_listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    """Stop the pub/sub listener."""
+    global _invalidation_task
+    if _invalidation_task is not None:
+        _invalidation_task.cancel()
+        try:
+            await _invalidation_task
+        except asyncio.CancelledError:
+            pass
+        _invalidation_task = None
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters per cache tier."""
+    return {
+        "local": {**_stats["local"], "size": len(local_cache), "max_entries": local_cache.max_entries},
+        "redis": dict(_stats["redis"]),
+        "inflight_loads": len(_inflight),
+    }
+
+
+def _start_load(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    background: bool = False,
+) -> "asyncio.Task[Any]":
+    """Return the in-flight load for key, starting one if none is running."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_load_once(key, loader, ttl, stale_ttl, background))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _finish_load(key, t))
+    return task
+
+
+def _finish_load(key: str, task: "asyncio.Task[Any]") -> None:
+    """Forget a finished load; background refresh failures are dropped."""
+    _inflight.pop(key, None)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _load_once(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    background: bool = False,
+) -> Any:
+    """Load a value under the cross-worker lock and cache it.
+
+    Background refreshes give up if another worker holds the lock, since
+    that worker is already refreshing the entry. Foreground callers wait
+    for the holder's result for as long as the lock exists, and load
+    themselves only once they take the lock over.
+    """
+    lock_key = f"lock:{key}"
+    token = uuid.uuid4().hex
+    redis = None
+    acquired = False
+
+    try:
+        redis = await get_redis()
+        acquired = bool(await redis.set(lock_key, token, nx=True, px=LOCK_TTL_MS))
+    except Exception:
+        redis = None
+
+    if redis is not None and not acquired:
+        if background:
+            entry = await _get_entry(key)
+            return entry["v"] if entry is not None else None
+
+        # Another worker is loading this key - wait for its result. If the
+        # lock goes away without a cached value (failed or None load), take
+        # it over so only one waiter retries the upstream.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LOCK_TTL_MS / 1000
+        while loop.time() < deadline:
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            entry = await _get_entry(key)
+            if entry is not None:
+                return entry["v"]
+            try:
+                acquired = bool(await redis.set(lock_key, token, nx=True, px=LOCK_TTL_MS))
+            except Exception:
+                break
+            if acquired:
+                # The holder may have cached its value just before releasing
+                entry = await _get_entry(key)
+                if entry is not None:
+                    try:
+                        await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                    except Exception:
+                        pass
+                    return entry["v"]
+                break
+
+    try:
+        value = await loader()
+        if value is not None:
+            await _set_entry(key, value, ttl, stale_ttl)
+        return value
+    finally:
+        if acquired:
+            try:
+                await redis.eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except Exception:
+                pass
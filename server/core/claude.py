@@ -0,0 +1,25 @@
+"""Shared async Anthropic client."""
+
+from typing import Optional
+
+import anthropic
+
+from core.config import settings
+
+claude_client: Optional[anthropic.AsyncAnthropic] = None
+
+
+def get_claude_client() -> anthropic.AsyncAnthropic:
+    """Get the shared Anthropic client (one connection pool per worker)."""
+    global claude_client
+    if claude_client is None:
+        claude_client = anthropic.AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY)
+    return claude_client
+
+
+async def close_claude_client() -> None:
+    """Close the shared Anthropic client."""
+    global claude_client
+    if claude_client is not None:
+        await claude_client.close()
+        claude_client = None
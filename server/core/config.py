@@ -7,6 +7,13 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     CHROMADB_HOST: str = "localhost"
     CHROMADB_PORT: int = 8000
+    CHROMA_WORKERS: int = 2
+    CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    CACHE_LOCAL_MAX_TTL: int = 300
+    JOB_WORKER_ENABLED: bool = True
+    JOB_WORKER_CONCURRENCY: int = 1
+    ENRICHMENT_BATCH_MODE: bool = False
+    LLM_BATCH_BACKEND: str = "anthropic"
 
     class Config:
         env_file = ".env"
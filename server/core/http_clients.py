@@ -0,0 +1,129 @@
+"""Shared pooled HTTP clients, one per upstream host.
+
+Clients are created in the app lifespan and reused by every service so
+requests to the same upstream share keep-alive connections instead of
+paying a TCP+TLS handshake per call.
+"""
+
+import importlib.util
+from typing import Any, Dict, Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Per-upstream pool settings; services may still pass a per-request timeout
+UPSTREAMS: Dict[str, Dict[str, Any]] = {
+    "nasa": {"timeout": 15.0, "max_connections": 20, "http2": True},
+    "nasa_images": {"timeout": 15.0, "max_connections": 20, "http2": True},
+    "launch_library": {"timeout": 15.0, "max_connections": 10, "http2": False},
+    "webb_tracker": {"timeout": 10.0, "max_connections": 5, "http2": False},
+    "mast": {"timeout": 30.0, "max_connections": 10, "http2": False},
+    "webbtelescope": {"timeout": 15.0, "max_connections": 5, "http2": False},
+    "hubblesite": {"timeout": 15.0, "max_connections": 5, "http2": False},
+    "iss": {"timeout": 10.0, "max_connections": 5, "http2": False},
+    "celestrak": {"timeout": 15.0, "max_connections": 2, "http2": False},
+    "duckduckgo": {"timeout": 15.0, "max_connections": 5, "http2": False},
+    "nasa_www": {"timeout": 15.0, "max_connections": 5, "http2": True},
+    "nasa_science": {"timeout": 15.0, "max_connections": 5, "http2": True},
+}
+
+DEFAULT_UPSTREAM: Dict[str, Any] = {"timeout": 15.0, "max_connections": 10, "http2": False}
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_EXPIRY = 30.0
+
+
+class HttpClientRegistry:
+    """Lazily created, pooled AsyncClient per upstream with reuse counters."""
+
+    def __init__(self, upstreams: Dict[str, Dict[str, Any]]):
+        self.upstreams = upstreams
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """Get the shared client for an upstream, creating it on first use."""
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            client = self._create(name)
+            self._clients[name] = client
+        return client
+
+    def _create(self, name: str) -> httpx.AsyncClient:
+        config = self.upstreams.get(name, DEFAULT_UPSTREAM)
+        stats = self._stats.setdefault(name, {"requests": 0, "connections_opened": 0})
+
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            if event == "connection.connect_tcp.complete":
+                stats["connections_opened"] += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats["requests"] += 1
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            timeout=config["timeout"],
+            limits=httpx.Limits(
+                max_connections=config["max_connections"],
+                max_keepalive_connections=config["max_connections"],
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            http2=config["http2"] and HTTP2_AVAILABLE,
+            event_hooks={"request": [on_request]},
+        )
+
+    async def aclose(self) -> None:
+        """Close every client and its connection pool."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests and new connections per upstream."""
+        result = {}
+        for name, stats in self._stats.items():
+            reused = max(stats["requests"] - stats["connections_opened"], 0)
+            result[name] = {
+                **stats,
+                "connections_reused": reused,
+                "reuse_ratio": round(reused / stats["requests"], 3) if stats["requests"] else None,
+            }
+        return result
+
+
+_registry: Optional[HttpClientRegistry] = None
+
+
+def init_http_clients() -> HttpClientRegistry:
+    """Create the registry and open a client for every known upstream."""
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry(UPSTREAMS)
+    for name in UPSTREAMS:
+        _registry.get(name)
+    return _registry
+
+
+async def close_http_clients() -> None:
+    """Close all pooled clients."""
+    global _registry
+    if _registry is not None:
+        await _registry.aclose()
+        _registry = None
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """Get the pooled client for an upstream (created lazily outside the app)."""
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry(UPSTREAMS)
+    return _registry.get(name)
+
+
+def get_http_stats() -> Dict[str, Any]:
+    """Connection reuse metrics per upstream."""
+    if _registry is None:
+        return {}
+    return _registry.stats()
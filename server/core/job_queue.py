@@ -0,0 +1,309 @@
+"""Redis-backed job queue with a per-process worker loop.
+
+Jobs are recorded in the job_runs table (status, progress, result,
+timings) and their ids pushed onto a Redis list. Any process running the
+worker claims ids and executes the registered handler, so HTTP handlers
+and the scheduler only enqueue and return.
+
+A claimed id is moved atomically into this worker's processing list and
+only removed once the run is recorded. Each worker keeps a heartbeat key
+alive; at startup and then periodically, jobs held by workers whose
+heartbeat expired are requeued (not yet started) or marked failed
+(interrupted mid-run).
+"""
+
+import asyncio
+import json
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select
+
+from core.cache import get_redis
+from core.config import settings
+from db.session import AsyncSessionLocal
+from db.models import JobRun
+
+QUEUE_KEY = "jobs:queue"
+WORKERS_KEY = "jobs:workers"
+
+# Identifies this process's processing list and heartbeat
+WORKER_ID = uuid.uuid4().hex
+
+# A worker whose heartbeat is older than this is considered dead
+HEARTBEAT_TTL = 30
+HEARTBEAT_INTERVAL = 10
+# How often each worker sweeps for jobs orphaned by a crashed worker
+REAP_INTERVAL = 60
+
+# Seconds a worker blocks on the queue before checking again
+POLL_TIMEOUT = 5
+
+JobHandler = Callable[..., Awaitable[Any]]
+
+_handlers: Dict[str, JobHandler] = {}
+_worker_tasks: List["asyncio.Task[None]"] = []
+
+# Id of the job running in the current task, for report_progress
+_current_job: ContextVar[Optional[uuid.UUID]] = ContextVar("current_job", default=None)
+
+
+def register_job(name: str, handler: JobHandler) -> None:
+    """Register a coroutine function as the handler for a job name."""
+    _handlers[name] = handler
+
+
+def is_registered(name: str) -> bool:
+    return name in _handlers
+
+
+async def enqueue(name: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Record a job run and queue it; returns the job id."""
+    if name not in _handlers:
+        raise ValueError(f"Unknown job: {name}")
+
+    async with AsyncSessionLocal() as db:
+        job = JobRun(name=name, params=params or {}, status="queued")
+        db.add(job)
+        await db.commit()
+
+        try:
+            redis = await get_redis()
+            await redis.lpush(QUEUE_KEY, str(job.id))
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"Could not queue job: {e}"
+            job.finished_at = datetime.utcnow()
+            await db.commit()
+            raise
+
+    return str(job.id)
+
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """Get a job run by id; None if there is none (or the id is malformed)."""
+    try:
+        job_uuid = uuid.UUID(job_id)
+    except ValueError:
+        return None
+    async with AsyncSessionLocal() as db:
+        job = await db.get(JobRun, job_uuid)
+        return job.to_dict() if job else None
+
+
+async def get_recent_jobs(name: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """Get the most recently enqueued job runs."""
+    async with AsyncSessionLocal() as db:
+        query = select(JobRun)
+        if name:
+            query = query.filter(JobRun.name == name)
+        result = await db.execute(query.order_by(JobRun.enqueued_at.desc()).limit(limit))
+        return [job.to_dict() for job in result.scalars().all()]
+
+
+async def report_progress(stage: str, **details: Any) -> None:
+    """Record progress for the job running in this task (no-op outside a job)."""
+    job_id = _current_job.get()
+    if job_id is None:
+        return
+    try:
+        async with AsyncSessionLocal() as db:
+            job = await db.get(JobRun, job_id)
+            if job:
+                job.progress = _to_json({"stage": stage, **details, "at": datetime.utcnow()})
+                await db.commit()
+    except Exception as e:
+        print(f"[Jobs] Could not record progress for {job_id}: {e}")
+
+
+async def run_job(job_id: uuid.UUID) -> None:
+    """Execute one job run and record its outcome."""
+    async with AsyncSessionLocal() as db:
+        job = await db.get(JobRun, job_id)
+        if job is None or job.status != "queued":
+            return
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        await db.commit()
+        name, params = job.name, job.params or {}
+
+    token = _current_job.set(job_id)
+    try:
+        handler = _handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown job: {name}")
+        result = await handler(**params)
+        status, error = "succeeded", None
+    except Exception as e:
+        print(f"[Jobs] {name} ({job_id}) failed: {e}")
+        result, status, error = None, "failed", str(e)
+    finally:
+        _current_job.reset(token)
+
+    async with AsyncSessionLocal() as db:
+        job = await db.get(JobRun, job_id)
+        job.status = status
+        job.result = _to_json(result)
+        job.error = error
+        job.finished_at = datetime.utcnow()
+        await db.commit()
+
+
+def _processing_key(worker_id: str) -> str:
+    return f"jobs:processing:{worker_id}"
+
+
+def _heartbeat_key(worker_id: str) -> str:
+    return f"jobs:heartbeat:{worker_id}"
+
+
+async def _heartbeat() -> None:
+    redis = await get_redis()
+    await redis.sadd(WORKERS_KEY, WORKER_ID)
+    await redis.set(_heartbeat_key(WORKER_ID), datetime.utcnow().isoformat(), ex=HEARTBEAT_TTL)
+
+
+async def _heartbeat_loop() -> None:
+    """Keep this worker's heartbeat alive and periodically reap stale jobs."""
+    loop = asyncio.get_running_loop()
+    next_reap = loop.time() + REAP_INTERVAL
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        try:
+            await _heartbeat()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Jobs] Heartbeat error: {e}")
+            continue
+
+        if loop.time() >= next_reap:
+            next_reap = loop.time() + REAP_INTERVAL
+            try:
+                await reap_stale_jobs()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Jobs] Reaper error: {e}")
+
+
+async def reap_stale_jobs() -> Dict[str, int]:
+    """Recover jobs claimed by workers that stopped without finishing them.
+
+    Not-yet-started jobs from dead workers are requeued; JobRun rows left
+    "running" that no live worker holds are marked failed.
+    """
+    started = datetime.utcnow()
+    redis = await get_redis()
+    live_ids = set()
+    requeued = 0
+
+    for worker_id in await redis.smembers(WORKERS_KEY):
+        processing = _processing_key(worker_id)
+        if await redis.exists(_heartbeat_key(worker_id)):
+            live_ids.update(await redis.lrange(processing, 0, -1))
+            continue
+
+        for job_id in await redis.lrange(processing, 0, -1):
+            # lrem is the claim, so concurrent reapers handle each id once
+            if not await redis.lrem(processing, 1, job_id):
+                continue
+            async with AsyncSessionLocal() as db:
+                job = await db.get(JobRun, uuid.UUID(job_id))
+                status = job.status if job else None
+            if status == "queued":
+                # Next in line for the workers, which pop from the right
+                await redis.rpush(QUEUE_KEY, job_id)
+                requeued += 1
+        if not await redis.llen(processing):
+            await redis.srem(WORKERS_KEY, worker_id)
+
+    # Rows started before this sweep began were claimed before the lists were read
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(JobRun).filter(JobRun.status == "running", JobRun.started_at < started)
+        )
+        failed = 0
+        for job in result.scalars().all():
+            if str(job.id) in live_ids:
+                continue
+            job.status = "failed"
+            job.error = "Worker stopped while the job was running"
+            job.finished_at = datetime.utcnow()
+            failed += 1
+        await db.commit()
+
+    if requeued or failed:
+        print(f"[Jobs] Reaped stale jobs: {requeued} requeued, {failed} marked failed")
+    return {"requeued": requeued, "failed": failed}
+
+
+async def _worker_loop() -> None:
+    """Claim job ids from Redis and run them one at a time."""
+    processing = _processing_key(WORKER_ID)
+    while True:
+        try:
+            redis = await get_redis()
+            job_id = await redis.blmove(QUEUE_KEY, processing, POLL_TIMEOUT, "RIGHT", "LEFT")
+            if job_id is None:
+                continue
+            await run_job(uuid.UUID(job_id))
+            # Only released once the outcome is recorded; a crash leaves it for the reaper
+            await redis.lrem(processing, 1, job_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Jobs] Worker error: {e}")
+            await asyncio.sleep(1)
+
+
+async def _run_worker() -> None:
+    """Register this worker, recover stale jobs, then run the worker loops."""
+    while True:
+        try:
+            # Register before claiming anything so other reapers see our list as live
+            await _heartbeat()
+            await reap_stale_jobs()
+            break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Jobs] Worker startup error: {e}")
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+    await asyncio.gather(
+        _heartbeat_loop(),
+        *(_worker_loop() for _ in range(settings.JOB_WORKER_CONCURRENCY)),
+    )
+
+
+def start_worker() -> None:
+    """Start the job worker for this process."""
+    if _worker_tasks or not settings.JOB_WORKER_ENABLED:
+        return
+    _worker_tasks.append(asyncio.ensure_future(_run_worker()))
+
+
+async def stop_worker() -> None:
+    """Stop the job worker; jobs it was running are recovered by the next reaper."""
+    for task in _worker_tasks:
+        task.cancel()
+    for task in _worker_tasks:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    if _worker_tasks:
+        try:
+            redis = await get_redis()
+            await redis.delete(_heartbeat_key(WORKER_ID))
+        except Exception:
+            pass
+    _worker_tasks.clear()
+
+
+def _to_json(value: Any) -> Any:
+    """Make a handler result safe for a JSONB column."""
+    return json.loads(json.dumps(value, default=str)) if value is not None else None
@@ -0,0 +1,147 @@
+"""Redis lease based leader election.
+
+Exactly one process across all workers and pods holds the lease and acts
+as leader (e.g. runs the scheduler). The leader renews the lease
+periodically; if it dies, the lease expires and another process takes
+over on its next attempt.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+from core.cache import get_redis
+
+# Renew the lease only if we still hold it
+_RENEW_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Release the lease only if we still hold it
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderElector:
+    """Holds or contends for a Redis lease and reports transitions.
+
+    on_elected / on_demoted are called when this process gains or loses
+    leadership.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        lease_ms: int = 30000,
+        renew_interval: float = 10.0,
+        on_elected: Optional[Callable[[], None]] = None,
+        on_demoted: Optional[Callable[[], None]] = None,
+    ):
+        self.key = key
+        self.lease_ms = lease_ms
+        self.renew_interval = renew_interval
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self._value: Optional[str] = None
+        self._lease_expires_at = 0.0
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def _campaign_once(self) -> None:
+        redis = await get_redis()
+        now = time.time()
+        if self.is_leader:
+            renewed = await redis.eval(_RENEW_SCRIPT, 1, self.key, self._value, self.lease_ms)
+            if renewed:
+                self._lease_expires_at = now + self.lease_ms / 1000
+            else:
+                self._demote()
+            return
+
+        value = json.dumps({"id": self.identity, "since": now})
+        if await redis.set(self.key, value, nx=True, px=self.lease_ms):
+            self._value = value
+            self._lease_expires_at = now + self.lease_ms / 1000
+            self.is_leader = True
+            print(f"[Leader] {self.identity} elected for {self.key}")
+            if self.on_elected:
+                self.on_elected()
+
+    def _demote(self) -> None:
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        self._value = None
+        print(f"[Leader] {self.identity} lost {self.key}")
+        if self.on_demoted:
+            self.on_demoted()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._campaign_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[Leader] Election error: {e}")
+                # Can't confirm the lease - step down once it would have expired
+                if self.is_leader and time.time() >= self._lease_expires_at:
+                    self._demote()
+            await asyncio.sleep(self.renew_interval)
+
+    def start(self) -> None:
+        """Start contending for leadership."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop contending and release the lease so another process takes over now."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.is_leader:
+            try:
+                redis = await get_redis()
+                await redis.eval(_RELEASE_SCRIPT, 1, self.key, self._value)
+            except Exception:
+                pass
+            self._demote()
+
+    async def status(self) -> Dict[str, Any]:
+        """Current leader identity and lease age as seen in Redis."""
+        result: Dict[str, Any] = {
+            "identity": self.identity,
+            "is_leader": self.is_leader,
+            "leader": None,
+            "leader_since": None,
+            "lease_age_seconds": None,
+            "lease_ttl_ms": None,
+        }
+        try:
+            redis = await get_redis()
+            value = await redis.get(self.key)
+            if value:
+                lease = json.loads(value)
+                result["leader"] = lease.get("id")
+                result["leader_since"] = lease.get("since")
+                result["lease_age_seconds"] = round(time.time() - lease.get("since", time.time()), 1)
+                result["lease_ttl_ms"] = await redis.pttl(self.key)
+        except Exception as e:
+            result["error"] = str(e)
+        return result
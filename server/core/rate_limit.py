@@ -0,0 +1,58 @@
+"""Per-upstream request rate limiting shared by every caller in the process."""
+
+import asyncio
+import time
+from typing import Dict, Tuple
+
+# Upstream name -> (requests per second, burst)
+RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "duckduckgo": (1.0, 2),
+}
+
+DEFAULT_RATE_LIMIT: Tuple[float, int] = (5.0, 5)
+
+
+class RateLimiter:
+    """Token bucket with an explicit backoff for upstream throttling signals."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def backoff(self, seconds: float) -> None:
+        """Hold all requests for this upstream for the given time (e.g. after a 429/202)."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """Get the shared limiter for an upstream."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        rate, burst = RATE_LIMITS.get(name, DEFAULT_RATE_LIMIT)
+        limiter = RateLimiter(rate, burst)
+        _limiters[name] = limiter
+    return limiter
@@ -1,19 +1,23 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.celestial_object import CelestialObject
 from schemas.celestial_object import CelestialObjectCreate
 
 
-def get(db: Session, id: int):
-    return db.query(CelestialObject).filter(CelestialObject.id == id).first()
+async def get(db: AsyncSession, id: int):
+    result = await db.execute(select(CelestialObject).filter(CelestialObject.id == id))
+    return result.scalars().first()
 
-def get_by_name(db: Session, name: str):
-    return db.query(CelestialObject).filter(CelestialObject.name == name).first()
+async def get_by_name(db: AsyncSession, name: str):
+    result = await db.execute(select(CelestialObject).filter(CelestialObject.name == name))
+    return result.scalars().first()
 
-def get_multi(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(CelestialObject).offset(skip).limit(limit).all()
+async def get_multi(db: AsyncSession, skip: int = 0, limit: int = 100):
+    result = await db.execute(select(CelestialObject).offset(skip).limit(limit))
+    return result.scalars().all()
 
-def create(db: Session, obj_in: CelestialObjectCreate):
+async def create(db: AsyncSession, obj_in: CelestialObjectCreate):
     db_obj = CelestialObject(
         name=obj_in.name,
         type=obj_in.type,
@@ -22,6 +26,6 @@ def create(db: Session, obj_in: CelestialObjectCreate):
         mass=obj_in.mass,
     )
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     return db_obj
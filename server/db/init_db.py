@@ -1,11 +1,127 @@
+from sqlalchemy import text
+
 from db.session import engine
 from db.base import Base
 from models.celestial_object import CelestialObject
-from db.models import SpaceNews, Insight, ChatConversation, Alert, EnrichedContent
+from db.models import (
+    SpaceNews, Insight, ChatConversation, Alert, EnrichedContent, SourceCursor, JobRun, EmbeddingCache, LLMBatch,
+    SPACE_NEWS_SEARCH_VECTOR,
+)
+
+# Idempotent DDL for tables that already existed before a model change
+# (create_all only creates missing tables, not new indexes or columns)
+SCHEMA_UPGRADES = [
+    # Remove duplicates left by the old check-then-insert path, then enforce uniqueness
+    """
+    DELETE FROM space_news a USING space_news b
+    WHERE a.source = b.source AND a.external_id = b.external_id
+      AND (a.created_at, a.id::text) > (b.created_at, b.id::text)
+      AND NOT EXISTS (
+          SELECT 1 FROM pg_indexes WHERE indexname = 'uq_space_news_source_external_id'
+      )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS uq_space_news_source_external_id ON space_news (source, external_id)",
+    # Incremental pattern analysis scans by ingestion time
+    "CREATE INDEX IF NOT EXISTS idx_space_news_created_at ON space_news (created_at)",
+    # Dashboard aggregates
+    "CREATE INDEX IF NOT EXISTS idx_space_news_category ON space_news (category)",
+    "CREATE INDEX IF NOT EXISTS idx_insights_type ON insights (type)",
+    "CREATE INDEX IF NOT EXISTS idx_alerts_seen ON alerts (seen)",
+    # Alerts reference their insight; orphans from before the constraint are dropped
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'alerts_insight_id_fkey') THEN
+            DELETE FROM alerts a
+            WHERE a.insight_id IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM insights i WHERE i.id = a.insight_id);
+            ALTER TABLE alerts ADD CONSTRAINT alerts_insight_id_fkey
+                FOREIGN KEY (insight_id) REFERENCES insights (id) ON DELETE CASCADE;
+        END IF;
+    END $$
+    """,
+    # Keyset pagination for the alerts panel; sort columns must be non-null
+    "UPDATE alerts SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL",
+    "ALTER TABLE alerts ALTER COLUMN created_at SET NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_alerts_created_id ON alerts (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_alerts_unseen_created_id ON alerts (created_at, id) WHERE seen = false",
+    # Keyset pagination for news, insights and chat history
+    "UPDATE space_news SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL",
+    "ALTER TABLE space_news ALTER COLUMN created_at SET NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_space_news_sort ON space_news (coalesce(published_at, created_at), id)",
+    # Keyset columns must be non-null for the row comparison to hold
+    "UPDATE insights SET confidence_score = 0.5 WHERE confidence_score IS NULL",
+    "UPDATE insights SET generated_at = now() AT TIME ZONE 'utc' WHERE generated_at IS NULL",
+    "ALTER TABLE insights ALTER COLUMN confidence_score SET NOT NULL",
+    "ALTER TABLE insights ALTER COLUMN generated_at SET NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_insights_confidence_generated ON insights (confidence_score, generated_at, id)",
+    "UPDATE chat_conversations SET created_at = now() AT TIME ZONE 'utc' WHERE created_at IS NULL",
+    "ALTER TABLE chat_conversations ALTER COLUMN created_at SET NOT NULL",
+    "CREATE INDEX IF NOT EXISTS idx_chat_conversations_created_id ON chat_conversations (created_at, id)",
+    # Full-text search over news
+    f"""
+    ALTER TABLE space_news ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS ({SPACE_NEWS_SEARCH_VECTOR}) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_space_news_search ON space_news USING gin (search_vector)",
+    # Cross-source duplicate detection
+    "ALTER TABLE space_news ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+    "CREATE INDEX IF NOT EXISTS idx_space_news_content_hash ON space_news (content_hash)",
+    # Rows whose Chroma embedding is still pending
+    "CREATE INDEX IF NOT EXISTS idx_space_news_unembedded ON space_news (created_at) WHERE embedding_id IS NULL",
+    # Pattern analysis marks rows instead of keeping a created_at watermark;
+    # rows at or below the old watermark count as analyzed
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'space_news' AND column_name = 'analyzed_at'
+        ) THEN
+            ALTER TABLE space_news ADD COLUMN analyzed_at TIMESTAMP;
+            UPDATE space_news n SET analyzed_at = c.updated_at
+            FROM source_cursors c
+            WHERE c.name = 'analysis:patterns' AND n.created_at <= c.watermark;
+        END IF;
+    END $$
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_space_news_unanalyzed ON space_news (created_at) WHERE analyzed_at IS NULL",
+    # Enrichments are embedded after commit; rows from before this column were embedded inline
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = 'enriched_content' AND column_name = 'embedding_id'
+        ) THEN
+            ALTER TABLE enriched_content ADD COLUMN embedding_id VARCHAR(255);
+            UPDATE enriched_content SET embedding_id = 'enriched_' || entity_id || '_' || content_type;
+        END IF;
+    END $$
+    """,
+    # Backfill hashes for rows collected before the column existed
+    # (same normalization as news_collector.generate_content_hash)
+    r"""
+    UPDATE space_news
+    SET content_hash = encode(sha256(convert_to(
+        btrim(regexp_replace(
+            regexp_replace(lower(title || E'\n' || coalesce(summary, '')), '[^\w\s]', '', 'g'),
+            '\s+', ' ', 'g'
+        )),
+        'UTF8'
+    )), 'hex')
+    WHERE content_hash IS NULL
+    """,
+]
 
 def init_db():
     # Create all tables
     Base.metadata.create_all(bind=engine)
 
+    # Apply schema upgrades
+    with engine.begin() as conn:
+        for statement in SCHEMA_UPGRADES:
+            conn.execute(text(statement))
+
 if __name__ == "__main__":
     init_db()
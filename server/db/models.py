@@ -2,12 +2,23 @@
 
 import uuid
 from datetime import datetime, timedelta
-from sqlalchemy import Column, String, Text, Float, Boolean, DateTime, ARRAY, Index
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import (
+    Column, Computed, String, Text, Float, Boolean, DateTime, Integer, LargeBinary, ARRAY, ForeignKey, Index, func, text,
+)
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 
 from db.base import Base
 
 
+# Title ranks above summary above body text
+SPACE_NEWS_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+
 class SpaceNews(Base):
     """Collected news and discoveries from NASA sources."""
     __tablename__ = "space_news"
@@ -23,7 +34,22 @@ class SpaceNews(Base):
     category = Column(String(50))  # exoplanets, galaxies, nebulae, etc.
     published_at = Column(DateTime)
     embedding_id = Column(String(255))  # Reference to ChromaDB
-    created_at = Column(DateTime, default=datetime.utcnow)
+    content_hash = Column(String(64))  # Normalized title + summary, for cross-source dedupe
+    analyzed_at = Column(DateTime)  # Set once included in a pattern analysis run
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # Weighted full-text document maintained by Postgres; deferred so row loads skip it
+    search_vector = deferred(Column(TSVECTOR, Computed(SPACE_NEWS_SEARCH_VECTOR, persisted=True)))
+
+    __table_args__ = (
+        Index('uq_space_news_source_external_id', 'source', 'external_id', unique=True),
+        Index('idx_space_news_created_at', 'created_at'),
+        Index('idx_space_news_category', 'category'),
+        Index('idx_space_news_sort', func.coalesce(published_at, created_at), 'id'),
+        Index('idx_space_news_search', 'search_vector', postgresql_using='gin'),
+        Index('idx_space_news_content_hash', 'content_hash'),
+        Index('idx_space_news_unembedded', 'created_at', postgresql_where=text('embedding_id IS NULL')),
+        Index('idx_space_news_unanalyzed', 'created_at', postgresql_where=text('analyzed_at IS NULL')),
+    )
 
     def to_dict(self):
         return {
@@ -49,11 +75,16 @@ class Insight(Base):
     type = Column(String(50), nullable=False)  # connection, trend, gap, anomaly
     title = Column(Text, nullable=False)
     description = Column(Text, nullable=False)
-    confidence_score = Column(Float)
+    confidence_score = Column(Float, nullable=False, default=0.5)  # Part of the list keyset
     related_news_ids = Column(ARRAY(UUID(as_uuid=True)))
     category = Column(String(50))
     evidence = Column(Text)  # Claude's reasoning
-    generated_at = Column(DateTime, default=datetime.utcnow)
+    generated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_insights_type', 'type'),
+        Index('idx_insights_confidence_generated', 'confidence_score', 'generated_at', 'id'),
+    )
 
     def to_dict(self):
         return {
@@ -77,7 +108,11 @@ class ChatConversation(Base):
     user_query = Column(Text, nullable=False)
     assistant_response = Column(Text, nullable=False)
     sources_used = Column(ARRAY(UUID(as_uuid=True)))
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_chat_conversations_created_id', 'created_at', 'id'),
+    )
 
     def to_dict(self):
         return {
@@ -94,10 +129,17 @@ class Alert(Base):
     __tablename__ = "alerts"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    insight_id = Column(UUID(as_uuid=True))
+    insight_id = Column(UUID(as_uuid=True), ForeignKey("insights.id", ondelete="CASCADE"))
     priority = Column(String(20), default="medium")  # high, medium, low
     seen = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_alerts_seen', 'seen'),
+        Index('idx_alerts_created_id', 'created_at', 'id'),
+        # Unread alerts panel: keyset scan over a small index
+        Index('idx_alerts_unseen_created_id', 'created_at', 'id', postgresql_where=text('seen = false')),
+    )
 
     def to_dict(self):
         return {
@@ -119,6 +161,7 @@ class EnrichedContent(Base):
     content_type = Column(String(100), nullable=False)  # crew_profile, mission_objectives, etc.
     content = Column(JSONB, nullable=False)  # Structured content block
     sources = Column(JSONB)  # List of source URLs used
+    embedding_id = Column(String(255))  # Reference to ChromaDB, set once embedded
     created_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)  # For cache invalidation
 
@@ -145,3 +188,94 @@ class EnrichedContent(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "expires_at": self.expires_at.isoformat() if self.expires_at else None,
         }
+
+
+class SourceCursor(Base):
+    """Incremental ingestion state per upstream source or feed."""
+    __tablename__ = "source_cursors"
+
+    name = Column(String(100), primary_key=True)  # e.g. news:apod, feed:stsci
+    watermark = Column(DateTime)  # Newest item timestamp already ingested
+    etag = Column(String(255))
+    last_modified = Column(String(100))
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class EmbeddingCache(Base):
+    """Embedding vectors by normalized text hash, so unchanged text is never re-embedded."""
+    __tablename__ = "embedding_cache"
+
+    model = Column(String(100), primary_key=True)
+    text_hash = Column(String(64), primary_key=True)  # sha256 of normalized text
+    dimensions = Column(Integer, nullable=False)
+    vector = Column(LargeBinary, nullable=False)  # float32 little-endian
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class LLMBatch(Base):
+    """A submitted LLM batch awaiting collection by a scheduled job."""
+    __tablename__ = "llm_batches"
+
+    id = Column(String(100), primary_key=True)  # Backend batch id
+    backend = Column(String(50), nullable=False)  # anthropic, local
+    purpose = Column(String(50), nullable=False)  # e.g. enrichment
+    status = Column(String(20), default="submitted")  # submitted, collecting, ended, failed
+    request_count = Column(Integer)
+    request_metadata = Column(JSONB)  # Caller data per custom_id
+    summary = Column(JSONB)
+    submitted_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index('idx_llm_batches_purpose_status', 'purpose', 'status'),
+    )
+
+
+class JobRun(Base):
+    """A queued or executed background job (news collection, analysis, enrichment)."""
+    __tablename__ = "job_runs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    name = Column(String(100), nullable=False)
+    params = Column(JSONB)
+    status = Column(String(20), default="queued")  # queued, running, succeeded, failed
+    progress = Column(JSONB)
+    result = Column(JSONB)
+    error = Column(Text)
+    enqueued_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index('idx_job_runs_name_enqueued', 'name', 'enqueued_at'),
+    )
+
+    def to_dict(self):
+        def ms_between(start, end):
+            return round((end - start).total_seconds() * 1000) if start and end else None
+
+        return {
+            "id": str(self.id),
+            "name": self.name,
+            "params": self.params or {},
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "enqueued_at": self.enqueued_at.isoformat() if self.enqueued_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "timings_ms": {
+                "queued": ms_between(self.enqueued_at, self.started_at),
+                "run": ms_between(self.started_at, self.finished_at),
+            },
+        }
@@ -0,0 +1,77 @@
+"""Keyset pagination.
+
+Pages are ordered by a list of sort columns, all descending, ending with
+a unique column (the primary key) as tie-breaker. The opaque cursor
+encodes the sort key of the last row on a page, and the next page
+continues strictly after it, so every page is an index range scan no
+matter how deep the client pages.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(value: Any, column: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return python_type(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque cursor for the sort key of the row a page ended on."""
+    raw = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_columns: Sequence[Any]) -> Tuple[Any, ...]:
+    """Inverse of encode_cursor; raises ValueError for a malformed cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != len(sort_columns):
+            raise ValueError("wrong number of values")
+        return tuple(_decode_value(value, column) for value, column in zip(values, sort_columns))
+    except (UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_page(query: Select, sort_columns: Sequence[Any], limit: int, cursor: Optional[str] = None) -> Select:
+    """Order query by sort_columns (descending) and restrict it to the page after cursor.
+
+    Fetches one extra row so next_cursor can tell whether another page exists.
+    Sort columns must be non-null for the row comparison to hold.
+    """
+    limit = max(limit, 0)
+    if cursor:
+        values = decode_cursor(cursor, sort_columns)
+        query = query.where(tuple_(*sort_columns) < tuple_(*values))
+    return query.order_by(*(column.desc() for column in sort_columns)).limit(limit + 1)
+
+
+def next_cursor(rows: Sequence[Any], limit: int, key: Any) -> Tuple[List[Any], Optional[str]]:
+    """Trim the extra row from a keyset_page result; returns (rows, next_cursor).
+
+    key maps a row to its sort key values, in sort_columns order.
+    """
+    if limit <= 0:
+        return [], None
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(*key(rows[-1]))
@@ -7,43 +7,94 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from api.router import api_router
+from core.cache import get_cache_stats, start_invalidation_listener, stop_invalidation_listener
+from core.claude import close_claude_client
+from core import job_queue
+from core.http_clients import close_http_clients, get_http_stats, init_http_clients
+from core.leader import LeaderElector
 from db.init_db import init_db
-from services.enrichment_service import run_daily_enrichment
+from services import chromadb_service, embedding_cache, iss_tracker, position_stream
+from services.jobs import register_jobs
+from services.llm_cache import get_llm_cache_stats
 
 
 # Scheduler for background jobs
 scheduler = AsyncIOScheduler()
 
+# Only the elected leader across all workers/pods runs scheduled jobs
+scheduler_leader = LeaderElector(
+    "scheduler:leader",
+    on_elected=scheduler.resume,
+    on_demoted=scheduler.pause,
+)
+
 
-async def scheduled_enrichment_job():
-    """Wrapper for the daily enrichment job."""
+async def scheduled_job(name: str):
+    """Queue a scheduled job for the job worker."""
     try:
-        print("[Scheduler] Running daily enrichment job...")
-        result = await run_daily_enrichment()
-        print(f"[Scheduler] Enrichment complete: {result}")
+        job_id = await job_queue.enqueue(name)
+        print(f"[Scheduler] Queued {name} job {job_id}")
     except Exception as e:
-        print(f"[Scheduler] Enrichment job failed: {e}")
+        print(f"[Scheduler] Could not queue {name} job: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     init_db()
-
-    # Schedule daily enrichment at 2 AM UTC
+    init_http_clients()
+    start_invalidation_listener()
+    iss_tracker.start_tle_refresh()
+    register_jobs()
+    job_queue.start_worker()
+
+    # Collect news every 6 hours, analyze patterns daily at 1 AM UTC,
+    # enrich notable launches daily at 2 AM UTC
+    scheduler.add_job(
+        scheduled_job,
+        CronTrigger(hour="*/6", minute=15),
+        args=["collect_news"],
+        id="collect_news",
+        replace_existing=True,
+    )
     scheduler.add_job(
-        scheduled_enrichment_job,
+        scheduled_job,
+        CronTrigger(hour=1, minute=0),
+        args=["analyze_patterns"],
+        id="analyze_patterns",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        scheduled_job,
         CronTrigger(hour=2, minute=0),
+        args=["daily_enrichment"],
         id="daily_enrichment",
         replace_existing=True,
     )
-    scheduler.start()
-    print("[Scheduler] Started daily enrichment job (2 AM UTC)")
+    # Store results of enrichment batches once they end
+    scheduler.add_job(
+        scheduled_job,
+        CronTrigger(minute="*/10"),
+        args=["finish_enrichment_batches"],
+        id="finish_enrichment_batches",
+        replace_existing=True,
+    )
+    scheduler.start(paused=True)
+    scheduler_leader.start()
+    print("[Scheduler] Started collect_news (every 6h), analyze_patterns (1 AM UTC) and daily_enrichment (2 AM UTC) jobs")
 
     yield
 
     # Shutdown
+    await scheduler_leader.stop()
     scheduler.shutdown()
+    await job_queue.stop_worker()
+    await position_stream.shutdown()
+    await iss_tracker.stop_tle_refresh()
+    await stop_invalidation_listener()
+    await close_http_clients()
+    await close_claude_client()
+    chromadb_service.shutdown_executor()
 
 
 app = FastAPI(
@@ -75,12 +126,49 @@ def health_check():
 
 
 @app.get("/scheduler/status")
-def scheduler_status():
-    """Check scheduler status and next run times."""
+async def scheduler_status():
+    """Check scheduler status, next run times and which process is the leader."""
     jobs = []
     for job in scheduler.get_jobs():
         jobs.append({
             "id": job.id,
             "next_run": job.next_run_time.isoformat() if job.next_run_time else None,
         })
-    return {"scheduler_running": scheduler.running, "jobs": jobs}
+    return {
+        "scheduler_running": scheduler.running,
+        "jobs": jobs,
+        "leader": await scheduler_leader.status(),
+    }
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Cache hit/miss counters per tier for this worker."""
+    return get_cache_stats()
+
+
+@app.get("/http/stats")
+def http_stats():
+    """Connection reuse per upstream HTTP client for this worker."""
+    return get_http_stats()
+
+
+@app.get("/llm/stats")
+def llm_stats():
+    """LLM response cache hits, misses and tokens saved per caller for this worker."""
+    return get_llm_cache_stats()
+
+
+@app.get("/stream/stats")
+def stream_stats():
+    """Position stream subscribers and producer lease for this worker."""
+    return position_stream.get_stream_stats()
+
+
+@app.get("/chroma/stats")
+def chroma_stats():
+    """Queue depth of the ChromaDB thread pool and embedding cache counters for this worker."""
+    return {
+        **chromadb_service.get_executor_stats(),
+        "embedding_cache": embedding_cache.get_embedding_cache_stats(),
+    }
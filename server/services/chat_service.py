@@ -1,17 +1,15 @@
 """Chat service - RAG-based Q&A using Claude and ChromaDB."""
 
-from typing import List, Dict, Any, Optional
-import anthropic
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from sqlalchemy import select
 
+from core.claude import get_claude_client
 from core.config import settings
-from db.session import SessionLocal
+from db.session import AsyncSessionLocal
 from db.models import SpaceNews, ChatConversation, Insight
+from db.pagination import keyset_page, next_cursor
 from services import chromadb_service
-
-
-def get_claude_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
-    return anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+from services.llm_cache import cached_completion
 
 
 CHAT_SYSTEM_PROMPT = """You are an expert space science assistant with access to recent NASA news, discoveries, and AI-detected patterns. Your role is to help users understand space science developments and find connections between discoveries.
@@ -29,6 +27,9 @@ When answering questions:
 
 If the user asks about something not covered in the provided context, you can use your general knowledge but make it clear you're going beyond the provided sources."""
 
+# Answers depend on retrieved context, so keep reuse short
+CHAT_LLM_CACHE_TTL = 3600
+
 
 async def chat(
     user_query: str,
@@ -41,6 +42,69 @@ async def chat(
             "sources": [],
         }
 
+    messages, source_ids = await _build_messages(user_query, conversation_history)
+
+    # Call Claude (repeat questions over the same context reuse the answer)
+    assistant_response = await cached_completion(
+        "chat",
+        lambda text: text,
+        model="claude-sonnet-4-20250514",
+        max_tokens=2048,
+        system=CHAT_SYSTEM_PROMPT,
+        messages=messages,
+        ttl=CHAT_LLM_CACHE_TTL,
+    )
+
+    conversation_id, sources = await _save_conversation(user_query, assistant_response, source_ids)
+
+    return {
+        "response": assistant_response,
+        "sources": sources,
+        "conversation_id": conversation_id,
+    }
+
+
+async def chat_stream(
+    user_query: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Process a chat query using RAG, yielding response text as it is generated.
+
+    Yields {"type": "token", "text": ...} events followed by a single
+    {"type": "done", "sources": [...], "conversation_id": ...} event.
+    """
+    if not settings.ANTHROPIC_API_KEY:
+        yield {"type": "token", "text": "Chat is not available. Please configure ANTHROPIC_API_KEY."}
+        yield {"type": "done", "sources": [], "conversation_id": None}
+        return
+
+    messages, source_ids = await _build_messages(user_query, conversation_history)
+
+    # Stream from Claude
+    client = get_claude_client()
+    chunks = []
+    async with client.messages.stream(
+        model="claude-sonnet-4-20250514",
+        max_tokens=2048,
+        system=CHAT_SYSTEM_PROMPT,
+        messages=messages,
+    ) as stream:
+        async for text in stream.text_stream:
+            chunks.append(text)
+            yield {"type": "token", "text": text}
+
+    assistant_response = "".join(chunks)
+
+    conversation_id, sources = await _save_conversation(user_query, assistant_response, source_ids)
+
+    yield {"type": "done", "sources": sources, "conversation_id": conversation_id}
+
+
+async def _build_messages(
+    user_query: str,
+    conversation_history: Optional[List[Dict[str, str]]],
+) -> Tuple[List[Dict[str, str]], List[str]]:
+    """Build the Claude messages with retrieved context; returns (messages, source_ids)."""
     # Search for relevant context in ChromaDB
     similar_docs = await chromadb_service.query_similar(
         query_text=user_query,
@@ -65,11 +129,13 @@ Content: {doc[:500]}...
 """)
 
     # Get recent insights for additional context
-    db = SessionLocal()
-    try:
-        recent_insights = db.query(Insight).filter(
-            Insight.confidence_score >= 0.6
-        ).order_by(Insight.generated_at.desc()).limit(5).all()
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(Insight).filter(
+                Insight.confidence_score >= 0.6
+            ).order_by(Insight.generated_at.desc()).limit(5)
+        )
+        recent_insights = result.scalars().all()
 
         if recent_insights:
             context_parts.append("\n--- AI-Detected Patterns ---\n")
@@ -79,8 +145,6 @@ Pattern ({insight.type}): {insight.title}
 {insight.description}
 Confidence: {insight.confidence_score:.0%}
 """)
-    finally:
-        db.close()
 
     context = "\n".join(context_parts)
 
@@ -103,43 +167,39 @@ Please provide a helpful, accurate response based on this context. If citing spe
 
     messages.append({"role": "user", "content": user_message})
 
-    # Call Claude
-    client = get_claude_client()
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=2048,
-        system=CHAT_SYSTEM_PROMPT,
-        messages=messages,
-    )
+    return messages, source_ids
 
-    assistant_response = response.content[0].text
 
+async def _save_conversation(
+    user_query: str,
+    assistant_response: str,
+    source_ids: List[str],
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """Store the conversation; returns (conversation_id, source details)."""
     # Store conversation
-    db = SessionLocal()
-    try:
-        conversation = ChatConversation(
-            user_query=user_query,
-            assistant_response=assistant_response,
-            sources_used=source_ids[:5] if source_ids else None,  # Store top 5 source IDs
-        )
-        db.add(conversation)
-        db.commit()
-
-        conversation_id = str(conversation.id)
-    except Exception as e:
-        db.rollback()
-        conversation_id = None
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            conversation = ChatConversation(
+                user_query=user_query,
+                assistant_response=assistant_response,
+                sources_used=source_ids[:5] if source_ids else None,  # Store top 5 source IDs
+            )
+            db.add(conversation)
+            await db.commit()
+
+            conversation_id = str(conversation.id)
+        except Exception as e:
+            await db.rollback()
+            conversation_id = None
 
     # Get source details
     sources = []
     if source_ids:
-        db = SessionLocal()
-        try:
-            news_items = db.query(SpaceNews).filter(
-                SpaceNews.id.in_(source_ids[:5])
-            ).all()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(SpaceNews).filter(SpaceNews.id.in_(source_ids[:5]))
+            )
+            news_items = result.scalars().all()
             sources = [
                 {
                     "id": str(n.id),
@@ -149,27 +209,32 @@ Please provide a helpful, accurate response based on this context. If citing spe
                 }
                 for n in news_items
             ]
-        finally:
-            db.close()
-
-    return {
-        "response": assistant_response,
-        "sources": sources,
-        "conversation_id": conversation_id,
-    }
-
 
-async def get_chat_history(limit: int = 20) -> List[Dict[str, Any]]:
-    """Get recent chat history."""
-    db = SessionLocal()
-    try:
-        conversations = db.query(ChatConversation).order_by(
-            ChatConversation.created_at.desc()
-        ).limit(limit).all()
+    return conversation_id, sources
+
+
+async def get_chat_history(
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get recent chat history, newest first; returns (conversations, next_cursor).
+
+    Raises ValueError for a malformed cursor.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            keyset_page(
+                select(ChatConversation),
+                [ChatConversation.created_at, ChatConversation.id],
+                limit,
+                cursor,
+            )
+        )
+        conversations, cursor = next_cursor(
+            result.scalars().all(), limit, lambda c: (c.created_at, c.id)
+        )
 
-        return [c.to_dict() for c in conversations]
-    finally:
-        db.close()
+        return [c.to_dict() for c in conversations], cursor
 
 
 async def get_suggested_questions() -> List[str]:
@@ -183,15 +248,14 @@ async def get_suggested_questions() -> List[str]:
     ]
 
     # Try to add dynamic suggestions based on recent insights
-    db = SessionLocal()
-    try:
-        recent_insight = db.query(Insight).filter(
-            Insight.confidence_score >= 0.7
-        ).order_by(Insight.generated_at.desc()).first()
+    async with AsyncSessionLocal() as db:
+        recent_insight = await db.scalar(
+            select(Insight).filter(
+                Insight.confidence_score >= 0.7
+            ).order_by(Insight.generated_at.desc()).limit(1)
+        )
 
         if recent_insight:
             suggestions.insert(0, f"Tell me more about: {recent_insight.title}")
-    finally:
-        db.close()
 
     return suggestions[:6]
@@ -1,55 +1,179 @@
-"""ChromaDB service for vector embeddings and semantic search."""
+"""ChromaDB service for vector embeddings and semantic search.
 
-from typing import List, Dict, Any, Optional
+The Chroma client and its embedding model are synchronous, so every
+operation runs on a small dedicated thread pool instead of the event loop.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 import chromadb
 from chromadb.config import Settings as ChromaSettings
+from chromadb.utils import embedding_functions
 
 from core.config import settings
 
+T = TypeVar("T")
+
 
 # Initialize ChromaDB client
 # Using persistent storage in a local directory
 _client: Optional[chromadb.PersistentClient] = None
+_collections: Dict[str, Any] = {}
+_client_lock = threading.Lock()
+_embedding_function: Optional[Any] = None
+
+# Chroma's default embedding model; part of every embedding cache key
+EMBEDDING_MODEL_ID = "chroma-default/all-MiniLM-L6-v2"
+
+
+class ChromaExecutor:
+    """Bounded thread pool for Chroma calls with queue-depth counters."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chroma")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run fn on the pool and await its result."""
+        with self._lock:
+            self.pending += 1
+
+        def call() -> T:
+            with self._lock:
+                self.pending -= 1
+                self.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        future = self._pool.submit(call)
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, future: Future) -> None:
+        # A call cancelled before it started never decremented pending
+        if future.cancelled():
+            with self._lock:
+                self.pending -= 1
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "pending": self.pending,
+                "running": self.running,
+                "completed": self.completed,
+            }
+
+
+_executor: Optional[ChromaExecutor] = None
+
+
+def get_executor() -> ChromaExecutor:
+    """Get or create the Chroma thread pool."""
+    global _executor
+    if _executor is None:
+        _executor = ChromaExecutor(settings.CHROMA_WORKERS)
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the Chroma thread pool, dropping queued calls."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+
+
+def get_executor_stats() -> Dict[str, int]:
+    """Queue depth and throughput of the Chroma thread pool."""
+    return get_executor().stats()
 
 
 def get_chromadb_client() -> chromadb.PersistentClient:
     """Get or create ChromaDB client."""
     global _client
-    if _client is None:
-        # Use persistent local storage with newer API
-        _client = chromadb.PersistentClient(
-            path="./chromadb_data",
-            settings=ChromaSettings(
-                anonymized_telemetry=False,
+    with _client_lock:
+        if _client is None:
+            # Use persistent local storage with newer API
+            _client = chromadb.PersistentClient(
+                path="./chromadb_data",
+                settings=ChromaSettings(
+                    anonymized_telemetry=False,
+                )
             )
-        )
     return _client
 
 
+def get_embedding_function():
+    """Shared embedding model used for collections and precomputed embeddings."""
+    global _embedding_function
+    with _client_lock:
+        if _embedding_function is None:
+            _embedding_function = embedding_functions.DefaultEmbeddingFunction()
+    return _embedding_function
+
+
+async def embed_texts(texts: List[str]) -> List[List[float]]:
+    """Embed texts with the collection's model on the Chroma pool."""
+    if not texts:
+        return []
+
+    def embed() -> List[List[float]]:
+        return [[float(x) for x in vector] for vector in get_embedding_function()(texts)]
+
+    return await get_executor().run(embed)
+
+
 def get_collection(name: str = "space_news"):
-    """Get or create a collection."""
-    client = get_chromadb_client()
-    return client.get_or_create_collection(
-        name=name,
-        metadata={"description": "Space news and discoveries for pattern analysis"}
-    )
+    """Get or create a collection (blocking; call from the Chroma pool)."""
+    collection = _collections.get(name)
+    if collection is None:
+        client = get_chromadb_client()
+        collection = client.get_or_create_collection(
+            name=name,
+            embedding_function=get_embedding_function(),
+            metadata={"description": "Space news and discoveries for pattern analysis"}
+        )
+        _collections[name] = collection
+    return collection
 
 
 async def add_documents(
     documents: List[str],
     metadatas: List[Dict[str, Any]],
     ids: List[str],
-    collection_name: str = "space_news"
+    collection_name: str = "space_news",
+    embeddings: Optional[List[List[float]]] = None,
 ) -> None:
-    """Add documents to the collection with embeddings."""
-    collection = get_collection(collection_name)
+    """Add documents to the collection.
+
+    Pass precomputed embeddings (see embedding_cache) to skip the model;
+    otherwise ChromaDB embeds the documents itself.
+    """
+
+    def add() -> None:
+        collection = get_collection(collection_name)
+        collection.add(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=embeddings,
+        )
 
-    # ChromaDB will generate embeddings automatically using its default model
-    collection.add(
-        documents=documents,
-        metadatas=metadatas,
-        ids=ids,
-    )
+    await get_executor().run(add)
 
 
 async def query_similar(
@@ -59,14 +183,17 @@ async def query_similar(
     where_filter: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """Query for similar documents."""
-    collection = get_collection(collection_name)
 
-    results = collection.query(
-        query_texts=[query_text],
-        n_results=n_results,
-        where=where_filter,
-        include=["documents", "metadatas", "distances"],
-    )
+    def query() -> Dict[str, Any]:
+        collection = get_collection(collection_name)
+        return collection.query(
+            query_texts=[query_text],
+            n_results=n_results,
+            where=where_filter,
+            include=["documents", "metadatas", "distances"],
+        )
+
+    results = await get_executor().run(query)
 
     return {
         "ids": results["ids"][0] if results["ids"] else [],
@@ -81,12 +208,15 @@ async def get_all_documents(
     limit: int = 100,
 ) -> Dict[str, Any]:
     """Get all documents from collection."""
-    collection = get_collection(collection_name)
 
-    results = collection.get(
-        limit=limit,
-        include=["documents", "metadatas"],
-    )
+    def get() -> Dict[str, Any]:
+        collection = get_collection(collection_name)
+        return collection.get(
+            limit=limit,
+            include=["documents", "metadatas"],
+        )
+
+    results = await get_executor().run(get)
 
     return {
         "ids": results["ids"],
@@ -100,14 +230,14 @@ async def delete_documents(
     collection_name: str = "space_news",
 ) -> None:
     """Delete documents by ID."""
-    collection = get_collection(collection_name)
-    collection.delete(ids=ids)
+    await get_executor().run(lambda: get_collection(collection_name).delete(ids=ids))
 
 
 async def get_collection_stats(collection_name: str = "space_news") -> Dict[str, Any]:
     """Get collection statistics."""
-    collection = get_collection(collection_name)
+    count = await get_executor().run(lambda: get_collection(collection_name).count())
     return {
         "name": collection_name,
-        "count": collection.count(),
+        "count": count,
+        "executor": get_executor_stats(),
     }
@@ -0,0 +1,121 @@
+"""Embedding cache keyed by normalized text and model.
+
+Vectors are stored in Postgres as float32 blobs. Before every Chroma add,
+callers ask for embeddings here: texts seen before (re-collected news,
+re-enriched launches with unchanged content) are read back instead of
+running the embedding model again.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from db.session import AsyncSessionLocal
+from db.models import EmbeddingCache
+from services import chromadb_service
+
+# Rows per lookup / INSERT statement
+BATCH_SIZE = 500
+
+# Counters for this worker
+_stats: Dict[str, int] = {"hits": 0, "misses": 0, "invalid": 0}
+
+_dimensions: Optional[int] = None
+
+
+def normalize_text(text: str) -> str:
+    """Unicode-normalized, lowercased text with collapsed whitespace.
+
+    The default model is uncased, so lowercasing does not change its output.
+    """
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", text)).strip().lower()
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def _encode(vector: List[float]) -> bytes:
+    return np.asarray(vector, dtype="<f4").tobytes()
+
+
+def _decode(blob: bytes) -> List[float]:
+    return np.frombuffer(blob, dtype="<f4").tolist()
+
+
+async def _model_dimensions() -> int:
+    """Output size of the embedding model, probed once per process."""
+    global _dimensions
+    if _dimensions is None:
+        _dimensions = len((await chromadb_service.embed_texts(["dimension probe"]))[0])
+    return _dimensions
+
+
+async def get_embeddings(texts: List[str]) -> List[List[float]]:
+    """Embeddings for texts in order, computing and storing only the ones not cached."""
+    if not texts:
+        return []
+
+    model = chromadb_service.EMBEDDING_MODEL_ID
+    hashes = [text_hash(text) for text in texts]
+    unique_hashes = list(dict.fromkeys(hashes))
+
+    dimensions = await _model_dimensions()
+
+    vectors: Dict[str, List[float]] = {}
+    async with AsyncSessionLocal() as db:
+        for i in range(0, len(unique_hashes), BATCH_SIZE):
+            result = await db.execute(
+                select(EmbeddingCache.text_hash, EmbeddingCache.vector).where(
+                    EmbeddingCache.model == model,
+                    EmbeddingCache.dimensions == dimensions,
+                    EmbeddingCache.text_hash.in_(unique_hashes[i:i + BATCH_SIZE]),
+                )
+            )
+            for row in result.all():
+                vector = _decode(row.vector)
+                # A truncated blob is treated as a miss and overwritten below
+                if len(vector) == dimensions:
+                    vectors[row.text_hash] = vector
+                else:
+                    _stats["invalid"] += 1
+
+        # Embed each missing text once, even if it repeats in the batch
+        missing = {}
+        for digest, text in zip(hashes, texts):
+            if digest not in vectors and digest not in missing:
+                missing[digest] = normalize_text(text)
+        _stats["hits"] += len(unique_hashes) - len(missing)
+        _stats["misses"] += len(missing)
+
+        if missing:
+            computed = await chromadb_service.embed_texts(list(missing.values()))
+            rows = []
+            for digest, vector in zip(missing, computed):
+                vectors[digest] = vector
+                rows.append({
+                    "model": model,
+                    "text_hash": digest,
+                    "dimensions": len(vector),
+                    "vector": _encode(vector),
+                })
+            # Entries cached with other dimensions (a different model build) are replaced
+            for i in range(0, len(rows), BATCH_SIZE):
+                stmt = pg_insert(EmbeddingCache).values(rows[i:i + BATCH_SIZE])
+                await db.execute(stmt.on_conflict_do_update(
+                    index_elements=["model", "text_hash"],
+                    set_={"dimensions": stmt.excluded.dimensions, "vector": stmt.excluded.vector},
+                ))
+            await db.commit()
+
+    return [vectors[digest] for digest in hashes]
+
+
+def get_embedding_cache_stats() -> Dict[str, int]:
+    """Cache hits, misses (texts embedded) and invalid entries recomputed for this worker."""
+    return dict(_stats)
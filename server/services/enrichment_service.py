@@ -1,22 +1,38 @@
 """Enrichment service - AI-powered content enhancement for launches and astronomical events."""
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 import json
-import httpx
-import anthropic
+from sqlalchemy import select, update
 
+from core.cache import get_cached, set_cache
 from core.config import settings
+from core.http_clients import get_http_client
+from core.job_queue import report_progress
+from core.rate_limit import get_rate_limiter
 
 # Set up logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-from db.session import SessionLocal
+from db.session import AsyncSessionLocal
 from db.models import EnrichedContent
-from services import chromadb_service
+from services import chromadb_service, embedding_cache
 from services.launch_library import fetch_upcoming_launches
+from services.llm_batch import (
+    collect_batch,
+    finish_batch,
+    get_in_flight_metadata,
+    get_pending_batches,
+    submit_batch,
+)
+from services import llm_cache
+from services.llm_cache import cached_completion
 
 
 # Notability scoring criteria (mirrors frontend)
@@ -38,10 +54,36 @@ NOTABILITY_SCORES = {
     "programs": 30,
 }
 
+# Pipeline limits: concurrent web searches and concurrent Claude syntheses
+SEARCH_CONCURRENCY = 4
+SYNTHESIS_CONCURRENCY = 3
+_search_semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+_synthesis_semaphore = asyncio.Semaphore(SYNTHESIS_CONCURRENCY)
 
-def get_claude_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
-    return anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+# Notable launches enriched per daily run
+DAILY_LAUNCH_LIMIT = 5
+
+# Base backoff when DuckDuckGo signals rate limiting (grows per attempt)
+SEARCH_BACKOFF_SECONDS = 2.0
+
+# Search cache: results are kept 7 days, empty results 6 hours
+SEARCH_CACHE_TTL = 7 * 86400
+SEARCH_NEGATIVE_CACHE_TTL = 6 * 3600
+# Results stored per query (callers take the first num_results)
+SEARCH_CACHE_RESULTS = 10
+
+# Previously failed enrichment embeddings retried per run
+EMBED_RETRY_LIMIT = 100
+
+# Synthesis model and response budget
+ENRICHMENT_MODEL = "claude-sonnet-4-20250514"
+ENRICHMENT_MAX_TOKENS = 2048
+
+# How long a synthesized result is reused for an identical prompt
+ENRICHMENT_LLM_CACHE_TTL = 7 * 24 * 3600
+
+_search_stats: Dict[str, int] = {"hits": 0, "negative_hits": 0, "misses": 0, "failures": 0}
+_inflight_searches: Dict[str, "asyncio.Task[Optional[List[Dict[str, str]]]]"] = {}
 
 
 def calculate_notability(launch: Dict[str, Any]) -> int:
@@ -84,64 +126,105 @@ def extract_mission_name(full_name: str) -> str:
 
 
 async def search_web(query: str, num_results: int = 5, retries: int = 3) -> List[Dict[str, str]]:
-    """Search the web using DuckDuckGo HTML search."""
-    import asyncio
-    import re
+    """Search the web using DuckDuckGo HTML search, through the shared search cache.
+
+    Queries that normalize to the same words share one cache entry and one
+    in-flight request. Empty results are cached for a shorter time; failed
+    (e.g. rate-limited) searches are not cached.
+    """
+    key = f"search:{hashlib.sha1(normalize_query(query).encode()).hexdigest()}"
+
+    cached = await get_cached(key)
+    if cached is not None:
+        _search_stats["negative_hits" if not cached else "hits"] += 1
+        return cached[:num_results]
+    _search_stats["misses"] += 1
+
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_search_duckduckgo(query, retries))
+        _inflight_searches[key] = task
+        task.add_done_callback(lambda _: _inflight_searches.pop(key, None))
+    results = await asyncio.shield(task)
+
+    if results is None:
+        _search_stats["failures"] += 1
+        return []
+
+    await set_cache(key, results, expire=SEARCH_CACHE_TTL if results else SEARCH_NEGATIVE_CACHE_TTL)
+    return results[:num_results]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercased, de-duplicated, sorted words so reordered queries share a cache entry."""
+    return " ".join(sorted(set(re.findall(r"\w+", query.lower()))))
+
+
+def get_search_stats() -> Dict[str, int]:
+    """Search cache counters for this process."""
+    return dict(_search_stats)
+
+
+async def _search_duckduckgo(query: str, retries: int = 3) -> Optional[List[Dict[str, str]]]:
+    """Query DuckDuckGo; returns None if every attempt failed or was rate limited."""
     import urllib.parse
 
     results = []
     logger.info(f"[WebSearch] Searching for: {query}")
+    limiter = get_rate_limiter("duckduckgo")
 
     for attempt in range(retries):
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Use DuckDuckGo HTML endpoint with a realistic user agent
-                response = await client.get(
-                    "https://html.duckduckgo.com/html/",
-                    params={"q": query},
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                        "Accept": "text/html,application/xhtml+xml",
-                        "Accept-Language": "en-US,en;q=0.9",
-                    }
-                )
+            await limiter.acquire()
+            client = get_http_client("duckduckgo")
+            # Use DuckDuckGo HTML endpoint with a realistic user agent
+            response = await client.get(
+                "https://html.duckduckgo.com/html/",
+                params={"q": query},
+                headers={
+                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    "Accept": "text/html,application/xhtml+xml",
+                    "Accept-Language": "en-US,en;q=0.9",
+                }
+            )
 
-                logger.info(f"[WebSearch] Response status: {response.status_code} (attempt {attempt + 1})")
+            logger.info(f"[WebSearch] Response status: {response.status_code} (attempt {attempt + 1})")
 
-                if response.status_code == 202:
-                    # Rate limited - wait and retry
-                    logger.info(f"[WebSearch] Rate limited, waiting 2 seconds...")
-                    await asyncio.sleep(2)
-                    continue
+            if response.status_code == 202:
+                # Rate limited - hold every DuckDuckGo request, then retry
+                logger.info(f"[WebSearch] Rate limited, backing off {SEARCH_BACKOFF_SECONDS * (attempt + 1)}s")
+                limiter.backoff(SEARCH_BACKOFF_SECONDS * (attempt + 1))
+                continue
 
-                if response.status_code == 200:
-                    # Simple parsing - extract titles and URLs from result links
-                    html = response.text
-                    # Find result blocks
-                    links = re.findall(r'<a rel="nofollow" class="result__a" href="([^"]+)"[^>]*>([^<]+)</a>', html)
-                    logger.info(f"[WebSearch] Found {len(links)} links")
-
-                    for url, title in links[:num_results]:
-                        # Clean up DuckDuckGo redirect URLs
-                        if "uddg=" in url:
-                            actual_url = url.split("uddg=")[-1].split("&")[0]
-                            actual_url = urllib.parse.unquote(actual_url)
-                        else:
-                            actual_url = url
-
-                        results.append({
-                            "title": title.strip(),
-                            "url": actual_url,
-                        })
-                    break  # Success, exit retry loop
+            if response.status_code == 200:
+                # Simple parsing - extract titles and URLs from result links
+                html = response.text
+                # Find result blocks
+                links = re.findall(r'<a rel="nofollow" class="result__a" href="([^"]+)"[^>]*>([^<]+)</a>', html)
+                logger.info(f"[WebSearch] Found {len(links)} links")
+
+                for url, title in links[:SEARCH_CACHE_RESULTS]:
+                    # Clean up DuckDuckGo redirect URLs
+                    if "uddg=" in url:
+                        actual_url = url.split("uddg=")[-1].split("&")[0]
+                        actual_url = urllib.parse.unquote(actual_url)
+                    else:
+                        actual_url = url
+
+                    results.append({
+                        "title": title.strip(),
+                        "url": actual_url,
+                    })
+                logger.info(f"[WebSearch] Returning {len(results)} results")
+                return results
 
         except Exception as e:
             logger.error(f"[WebSearch] Error: {e}")
             if attempt < retries - 1:
-                await asyncio.sleep(1)
+                limiter.backoff(1)
 
-    logger.info(f"[WebSearch] Returning {len(results)} results")
-    return results
+    logger.warning(f"[WebSearch] Giving up on: {query}")
+    return None
 
 
 ENRICHMENT_PROMPTS = {
@@ -428,10 +511,38 @@ JSON Response:""",
 async def research_and_synthesize(
     mission_name: str,
     content_type: str,
+    timings: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Any]:
     """Research a topic and synthesize content using Claude."""
-    import asyncio
+    research = await build_enrichment_prompt(mission_name, content_type, timings)
+    if "error" in research:
+        return research
+
+    started = time.perf_counter()
+    try:
+        async with _synthesis_semaphore:
+            content = await synthesize(research["prompt"], content_type)
+    except Exception as e:
+        print(f"Claude API error: {e}")
+        return {"error": str(e)}
+    finally:
+        _add_timing(timings, "synthesis", started)
 
+    return {
+        "content": content,
+        "sources": research["sources"],
+    }
+
+
+async def build_enrichment_prompt(
+    mission_name: str,
+    content_type: str,
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Run the web searches for a content type and render its Claude prompt.
+
+    Returns {"prompt", "sources"} or {"error"}.
+    """
     # Extract simple mission name for better search results
     simple_name = extract_mission_name(mission_name)
     logger.info(f"[Enrichment] Researching {content_type} for: {mission_name} (search term: {simple_name})")
@@ -440,16 +551,18 @@ async def research_and_synthesize(
         logger.error("[Enrichment] ANTHROPIC_API_KEY not configured")
         return {"error": "ANTHROPIC_API_KEY not configured"}
 
-    # Gather search results
-    all_results = []
-    queries = SEARCH_QUERIES.get(content_type, [])
+    # Gather search results concurrently (bounded, and paced by the DuckDuckGo rate limiter)
+    started = time.perf_counter()
+    queries = [template.format(mission=simple_name) for template in SEARCH_QUERIES.get(content_type, [])]
 
-    for query_template in queries:
-        query = query_template.format(mission=simple_name)
-        results = await search_web(query, num_results=3)
+    async def search(query: str) -> List[Dict[str, str]]:
+        async with _search_semaphore:
+            return await search_web(query, num_results=3)
+
+    all_results = []
+    for results in await asyncio.gather(*(search(query) for query in queries)):
         all_results.extend(results)
-        # Small delay between searches to avoid rate limiting
-        await asyncio.sleep(0.5)
+    _add_timing(timings, "search", started)
 
     # If no search results, use Claude's knowledge
     use_knowledge_only = len(all_results) == 0
@@ -478,46 +591,60 @@ async def research_and_synthesize(
             search_results=search_text,
         )
 
-    # Call Claude for synthesis
-    try:
-        logger.info(f"[Enrichment] Calling Claude API for {content_type}")
-        client = get_claude_client()
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
-        )
+    return {"prompt": prompt, "sources": sources}
 
-        response_text = message.content[0].text.strip()
-        logger.info(f"[Enrichment] Got Claude response ({len(response_text)} chars)")
 
-        # Extract JSON from response
-        try:
-            if "{" in response_text:
-                json_start = response_text.index("{")
-                json_end = response_text.rindex("}") + 1
-                json_str = response_text[json_start:json_end]
-                content = json.loads(json_str)
-                logger.info(f"[Enrichment] Parsed JSON successfully")
-            else:
-                content = {}
-                logger.warning("[Enrichment] No JSON found in response")
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.error(f"[Enrichment] Error parsing Claude response: {e}")
+async def synthesize(prompt: str, content_type: str) -> Dict[str, Any]:
+    """Call Claude with an enrichment prompt and parse the JSON it returns."""
+    logger.info(f"[Enrichment] Calling Claude API for {content_type}")
+    # Identical prompts (same mission, type and search results) reuse the cached result
+    return await cached_completion(
+        "enrichment",
+        parse_enrichment_response,
+        model=ENRICHMENT_MODEL,
+        max_tokens=ENRICHMENT_MAX_TOKENS,
+        messages=[{"role": "user", "content": prompt}],
+        ttl=ENRICHMENT_LLM_CACHE_TTL,
+    )
+
+
+def parse_enrichment_response(response_text: str) -> Dict[str, Any]:
+    """Extract the JSON object from a Claude enrichment response ({} if none)."""
+    try:
+        if "{" in response_text:
+            json_start = response_text.index("{")
+            json_end = response_text.rindex("}") + 1
+            json_str = response_text[json_start:json_end]
+            content = json.loads(json_str)
+            logger.info(f"[Enrichment] Parsed JSON successfully")
+        else:
             content = {}
+            logger.warning("[Enrichment] No JSON found in response")
+    except (json.JSONDecodeError, ValueError) as e:
+        logger.error(f"[Enrichment] Error parsing Claude response: {e}")
+        content = {}
+    return content
 
-        return {
-            "content": content,
-            "sources": sources,
-        }
 
-    except Exception as e:
-        print(f"Claude API error: {e}")
-        return {"error": str(e)}
+def _search_cache_report(before: Dict[str, int]) -> Dict[str, Any]:
+    """Search cache counters accumulated since the before snapshot, with hit rate."""
+    report = {name: count - before.get(name, 0) for name, count in get_search_stats().items()}
+    lookups = report["hits"] + report["negative_hits"] + report["misses"]
+    report["hit_rate"] = round((report["hits"] + report["negative_hits"]) / lookups, 3) if lookups else None
+    return report
+
 
+def _add_timing(timings: Optional[Dict[str, float]], stage: str, started: float) -> None:
+    """Accumulate elapsed milliseconds for a pipeline stage."""
+    if timings is not None:
+        timings[stage] = round(timings.get(stage, 0.0) + (time.perf_counter() - started) * 1000, 1)
 
-async def enrich_launch(launch: Dict[str, Any]) -> Dict[str, Any]:
-    """Enrich a launch with all content types."""
+
+async def enrich_launch(
+    launch: Dict[str, Any],
+    timings: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Enrich a launch with all content types (researched and synthesized concurrently)."""
     launch_id = launch.get("id")
     launch_name = launch.get("name", "")
     tags = get_notability_tags(launch)
@@ -525,176 +652,425 @@ async def enrich_launch(launch: Dict[str, Any]) -> Dict[str, Any]:
     logger.info(f"[Enrichment] Starting enrichment for: {launch_name} (ID: {launch_id})")
     logger.info(f"[Enrichment] Tags: {tags}")
 
-    results = {}
-    db = SessionLocal()
+    results, missing = await _plan_launch_enrichment(launch)
+
+    # Research and synthesize the missing content types concurrently
+    enrichments = await asyncio.gather(*(
+        research_and_synthesize(launch_name, content_type, timings) for content_type in missing
+    ))
+
+    created = []
+    for content_type, enrichment in zip(missing, enrichments):
+        if "error" in enrichment:
+            results[content_type] = {"status": "error", "error": enrichment["error"]}
+            continue
+
+        content = enrichment.get("content", {})
 
+        # Skip empty content
+        if not content:
+            continue
+
+        created.append({
+            "launch_id": launch_id,
+            "launch_name": launch_name,
+            "content_type": content_type,
+            "content": content,
+            "sources": enrichment.get("sources", []),
+        })
+        results[content_type] = {"status": "created", "content": content}
+
+    started = time.perf_counter()
     try:
-        # Determine which content types to generate
-        content_types = ["mission_objectives", "historical_context", "technical_details", "webcast_links"]
+        await store_enrichments(created)
+    except Exception as e:
+        logger.error(f"[Enrichment] Error enriching {launch_name}: {e}")
+        raise e
+    finally:
+        _add_timing(timings, "store", started)
 
-        # Only generate crew profiles for crewed missions
-        if "crewed" in tags:
-            content_types.insert(0, "crew_profiles")
+    logger.info(f"[Enrichment] Completed enrichment for: {launch_name}")
+    return results
+
+
+async def _plan_launch_enrichment(launch: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """Results for content types with recent enrichment, and the content types still missing."""
+    launch_id = launch.get("id")
+    tags = get_notability_tags(launch)
+    results = {}
+
+    # Determine which content types to generate
+    content_types = ["mission_objectives", "historical_context", "technical_details", "webcast_links"]
+
+    # Only generate crew profiles for crewed missions
+    if "crewed" in tags:
+        content_types.insert(0, "crew_profiles")
 
-        logger.info(f"[Enrichment] Content types to generate: {content_types}")
+    logger.info(f"[Enrichment] Content types to generate: {content_types}")
 
-        for content_type in content_types:
-            # Check if we already have recent enrichment
-            existing = db.query(EnrichedContent).filter(
+    # Check which content types already have recent enrichment
+    async with AsyncSessionLocal() as db:
+        existing = (await db.execute(
+            select(EnrichedContent).filter(
                 EnrichedContent.entity_type == "launch",
                 EnrichedContent.entity_id == launch_id,
-                EnrichedContent.content_type == content_type,
+                EnrichedContent.content_type.in_(content_types),
                 EnrichedContent.expires_at > datetime.utcnow(),
-            ).first()
-
-            if existing:
-                results[content_type] = {"status": "cached", "content": existing.content}
-                continue
+            )
+        )).scalars().all()
+    for enriched in existing:
+        results[enriched.content_type] = {"status": "cached", "content": enriched.content}
 
-            # Research and synthesize
-            enrichment = await research_and_synthesize(launch_name, content_type)
+    missing = [content_type for content_type in content_types if content_type not in results]
+    return results, missing
 
-            if "error" in enrichment:
-                results[content_type] = {"status": "error", "error": enrichment["error"]}
-                continue
 
-            content = enrichment.get("content", {})
-            sources = enrichment.get("sources", [])
+async def store_enrichments(items: List[Dict[str, Any]]) -> None:
+    """Write enrichment rows in one transaction, then embed them in one Chroma call.
 
-            # Skip empty content
-            if not content:
-                continue
+    Each item has launch_id, launch_name, content_type, content and sources.
+    Rows whose embedding fails keep a NULL embedding_id and are retried by
+    embed_pending_enrichments.
+    """
+    if not items:
+        return
 
+    async with AsyncSessionLocal() as db:
+        try:
             # Store in PostgreSQL
-            enriched = EnrichedContent(
-                entity_type="launch",
-                entity_id=launch_id,
-                content_type=content_type,
-                content=content,
-                sources=sources,
-            )
-            db.add(enriched)
+            rows = []
+            for item in items:
+                row = EnrichedContent(
+                    entity_type="launch",
+                    entity_id=item["launch_id"],
+                    content_type=item["content_type"],
+                    content=item["content"],
+                    sources=item["sources"],
+                )
+                db.add(row)
+                rows.append(row)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
 
-            # Store in ChromaDB for semantic search
-            doc_text = json.dumps(content, indent=2)
-            await chromadb_service.add_documents(
-                documents=[doc_text],
-                metadatas=[{
-                    "type": "enrichment",
-                    "entity_type": "launch",
-                    "entity_id": launch_id,
-                    "content_type": content_type,
-                    "mission_name": launch_name,
-                }],
-                ids=[f"enriched_{launch_id}_{content_type}"],
-                collection_name="space_news",  # Use existing collection
-            )
+    await embed_enrichments(rows, {item["launch_id"]: item["launch_name"] for item in items})
 
-            results[content_type] = {"status": "created", "content": content}
 
-        db.commit()
-        logger.info(f"[Enrichment] Completed enrichment for: {launch_name}")
+async def embed_enrichments(rows: List[EnrichedContent], mission_names: Optional[Dict[str, str]] = None) -> int:
+    """Add stored enrichment rows to ChromaDB and record their embedding_id.
 
+    Returns how many were embedded; a Chroma failure is logged and leaves
+    the rows pending.
+    """
+    if not rows:
+        return 0
+    mission_names = mission_names or {}
+    ids = [f"enriched_{row.entity_id}_{row.content_type}" for row in rows]
+
+    # Store in ChromaDB for semantic search (unchanged content reuses its cached embedding)
+    documents = [json.dumps(row.content, indent=2) for row in rows]
+    try:
+        await chromadb_service.add_documents(
+            documents=documents,
+            metadatas=[
+                {
+                    "type": "enrichment",
+                    "entity_type": row.entity_type,
+                    "entity_id": row.entity_id,
+                    "content_type": row.content_type,
+                    "mission_name": mission_names.get(row.entity_id, ""),
+                }
+                for row in rows
+            ],
+            ids=ids,
+            collection_name="space_news",  # Use existing collection
+            embeddings=await embedding_cache.get_embeddings(documents),
+        )
     except Exception as e:
-        logger.error(f"[Enrichment] Error enriching {launch_name}: {e}")
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+        logger.error(f"[Enrichment] Embedding {len(rows)} enrichments failed, will retry: {e}")
+        return 0
+
+    async with AsyncSessionLocal() as db:
+        for row, embedding_id in zip(rows, ids):
+            await db.execute(
+                update(EnrichedContent).where(EnrichedContent.id == row.id).values(embedding_id=embedding_id)
+            )
+        await db.commit()
+    return len(rows)
 
-    return results
+
+async def embed_pending_enrichments(limit: int = EMBED_RETRY_LIMIT) -> int:
+    """Embed stored enrichments whose earlier embedding failed; returns how many succeeded."""
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(EnrichedContent).filter(
+                EnrichedContent.embedding_id.is_(None)
+            ).order_by(EnrichedContent.created_at).limit(limit)
+        )).scalars().all()
+    return await embed_enrichments(rows)
 
 
 async def get_enrichment_for_launch(launch_id: str) -> Dict[str, Any]:
     """Get all enrichment data for a launch."""
-    db = SessionLocal()
-    try:
-        enrichments = db.query(EnrichedContent).filter(
-            EnrichedContent.entity_type == "launch",
-            EnrichedContent.entity_id == launch_id,
-            EnrichedContent.expires_at > datetime.utcnow(),
-        ).all()
+    async with AsyncSessionLocal() as db:
+        enrichments = (await db.execute(
+            select(EnrichedContent).filter(
+                EnrichedContent.entity_type == "launch",
+                EnrichedContent.entity_id == launch_id,
+                EnrichedContent.expires_at > datetime.utcnow(),
+            )
+        )).scalars().all()
 
         result = {}
         for e in enrichments:
             result[e.content_type] = e.content
 
         return result
-    finally:
-        db.close()
 
 
 async def has_recent_enrichment(entity_type: str, entity_id: str) -> bool:
     """Check if entity has recent (non-expired) enrichment."""
-    db = SessionLocal()
-    try:
-        exists = db.query(EnrichedContent).filter(
-            EnrichedContent.entity_type == entity_type,
-            EnrichedContent.entity_id == entity_id,
-            EnrichedContent.expires_at > datetime.utcnow(),
-        ).first() is not None
+    async with AsyncSessionLocal() as db:
+        exists = await db.scalar(
+            select(EnrichedContent.id).filter(
+                EnrichedContent.entity_type == entity_type,
+                EnrichedContent.entity_id == entity_id,
+                EnrichedContent.expires_at > datetime.utcnow(),
+            ).limit(1)
+        ) is not None
         return exists
-    finally:
-        db.close()
 
 
-async def run_daily_enrichment() -> Dict[str, Any]:
-    """Run daily enrichment job for notable items."""
-    logger.info("[DailyEnrichment] Starting daily enrichment job")
+async def run_daily_enrichment(batch: Optional[bool] = None) -> Dict[str, Any]:
+    """Run daily enrichment job for notable items.
+
+    In batch mode (default: ENRICHMENT_BATCH_MODE) all prompts for the run
+    are submitted as one LLM batch, which finish_enrichment_batches later
+    stores in one transaction; otherwise launches are enriched
+    concurrently one by one.
+    """
+    if batch is None:
+        batch = settings.ENRICHMENT_BATCH_MODE
+    logger.info(f"[DailyEnrichment] Starting daily enrichment job (batch={batch})")
+    started = time.perf_counter()
+    search_stats_before = get_search_stats()
+    # search/synthesis/store are summed across concurrent tasks; total is wall time
+    timings: Dict[str, float] = {}
     results = {
         "launches_processed": 0,
         "launches_enriched": 0,
         "errors": [],
+        "timings_ms": timings,
     }
 
     try:
         # Get upcoming launches
+        stage = time.perf_counter()
         launches = await fetch_upcoming_launches(limit=50)
+        _add_timing(timings, "fetch_launches", stage)
         logger.info(f"[DailyEnrichment] Fetched {len(launches)} launches")
 
         # Score and sort by notability
         notable_launches = []
         for launch in launches:
             score = calculate_notability(launch)
-            if score > 0:
+            if score > 0 and launch.get("id"):
                 notable_launches.append((score, launch))
 
         notable_launches.sort(key=lambda x: x[0], reverse=True)
         logger.info(f"[DailyEnrichment] Found {len(notable_launches)} notable launches")
 
-        # Process top 5 notable launches without recent enrichment
-        processed = 0
+        # Pick the top notable launches without recent enrichment, skipping
+        # launches still waiting in a submitted batch
+        stage = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            recent = set((await db.execute(
+                select(EnrichedContent.entity_id).filter(
+                    EnrichedContent.entity_type == "launch",
+                    EnrichedContent.entity_id.in_([launch["id"] for _, launch in notable_launches]),
+                    EnrichedContent.expires_at > datetime.utcnow(),
+                ).distinct()
+            )).scalars().all())
+        in_batch = {request["launch_id"] for request in await get_in_flight_metadata("enrichment")}
+        selected = []
         for score, launch in notable_launches:
-            if processed >= 5:
+            if launch["id"] in recent:
+                logger.info(f"[DailyEnrichment] Skipping {launch.get('name')} - already enriched")
+                continue
+            if launch["id"] in in_batch:
+                logger.info(f"[DailyEnrichment] Skipping {launch.get('name')} - enrichment batch pending")
+                continue
+            selected.append((score, launch))
+            if len(selected) >= DAILY_LAUNCH_LIMIT:
                 break
+        _add_timing(timings, "select", stage)
 
-            launch_id = launch.get("id")
-            if not launch_id:
-                continue
+        await report_progress("enriching", launches=len(selected))
 
-            if await has_recent_enrichment("launch", launch_id):
-                logger.info(f"[DailyEnrichment] Skipping {launch.get('name')} - already enriched")
-                continue
+        if batch:
+            # One LLM batch for every prompt in the run
+            await _enrich_launches_batch([launch for _, launch in selected], results, timings)
+        else:
+            async def enrich(score: int, launch: Dict[str, Any]) -> None:
+                try:
+                    logger.info(f"[DailyEnrichment] Enriching: {launch.get('name')} (score: {score})")
+                    await enrich_launch(launch, timings)
+                    results["launches_enriched"] += 1
+                except Exception as e:
+                    logger.error(f"[DailyEnrichment] Failed to enrich {launch.get('name')}: {e}")
+                    results["errors"].append(f"Failed to enrich {launch.get('name')}: {str(e)}")
 
-            try:
-                logger.info(f"[DailyEnrichment] Enriching: {launch.get('name')} (score: {score})")
-                await enrich_launch(launch)
-                results["launches_enriched"] += 1
-            except Exception as e:
-                logger.error(f"[DailyEnrichment] Failed to enrich {launch.get('name')}: {e}")
-                results["errors"].append(f"Failed to enrich {launch.get('name')}: {str(e)}")
+                results["launches_processed"] += 1
 
-            results["launches_processed"] += 1
-            processed += 1
+            # Launches run concurrently; search and synthesis limits bound the real load
+            await asyncio.gather(*(enrich(score, launch) for score, launch in selected))
 
     except Exception as e:
         logger.error(f"[DailyEnrichment] Job failed: {e}")
         results["errors"].append(f"Daily enrichment failed: {str(e)}")
 
+    _add_timing(timings, "total", started)
+    results["search_cache"] = _search_cache_report(search_stats_before)
     logger.info(f"[DailyEnrichment] Completed: {results}")
     return results
 
 
+async def _enrich_launches_batch(
+    launches: List[Dict[str, Any]],
+    results: Dict[str, Any],
+    timings: Dict[str, float],
+) -> None:
+    """Research every launch and submit all prompts as one LLM batch.
+
+    Prompts with a cached response are stored right away and left out of
+    the batch. The batch is collected and stored later by
+    finish_enrichment_batches, so the job doesn't hold a worker while it runs.
+    """
+    # Build every prompt for the run (searches still run concurrently)
+    planned = []
+    for launch in launches:
+        _, missing = await _plan_launch_enrichment(launch)
+        planned.extend((launch, content_type) for content_type in missing)
+
+    research = await asyncio.gather(*(
+        build_enrichment_prompt(launch.get("name", ""), content_type, timings)
+        for launch, content_type in planned
+    ))
+
+    requests = []
+    metadata = {}
+    cached_items = []
+    for index, ((launch, content_type), prompt) in enumerate(zip(planned, research)):
+        if "error" in prompt:
+            results["errors"].append(f"{launch.get('name')} {content_type}: {prompt['error']}")
+            continue
+
+        # Same key synthesize() would use, so both paths share cached responses
+        key = _synthesis_cache_key(prompt["prompt"])
+        content = await llm_cache.lookup("enrichment", key)
+        if content:
+            cached_items.append({
+                "launch_id": launch["id"],
+                "launch_name": launch.get("name", ""),
+                "content_type": content_type,
+                "content": content,
+                "sources": prompt["sources"],
+            })
+            continue
+
+        custom_id = f"req-{index}"
+        requests.append({
+            "custom_id": custom_id,
+            "prompt": prompt["prompt"],
+            "model": ENRICHMENT_MODEL,
+            "max_tokens": ENRICHMENT_MAX_TOKENS,
+        })
+        metadata[custom_id] = {
+            "launch_id": launch["id"],
+            "launch_name": launch.get("name", ""),
+            "content_type": content_type,
+            "sources": prompt["sources"],
+            "cache_key": key,
+        }
+
+    results["launches_processed"] += len(launches)
+    results["batch_requests"] = len(requests)
+    results["batch_cache_hits"] = len(cached_items)
+
+    if cached_items:
+        started = time.perf_counter()
+        await store_enrichments(cached_items)
+        _add_timing(timings, "store", started)
+    if not requests:
+        return
+
+    started = time.perf_counter()
+    await report_progress("submitting", requests=len(requests))
+    results["batch_id"] = await submit_batch("enrichment", requests, metadata)
+    _add_timing(timings, "submit", started)
+
+
+def _synthesis_cache_key(prompt: str) -> str:
+    return llm_cache.cache_key(
+        ENRICHMENT_MODEL,
+        [{"role": "user", "content": prompt}],
+        max_tokens=ENRICHMENT_MAX_TOKENS,
+    )
+
+
+async def finish_enrichment_batches() -> Dict[str, Any]:
+    """Collect ended enrichment batches and store their results (scheduled job)."""
+    summary = {"batches_collected": 0, "batches_pending": 0, "stored": 0, "errors": []}
+    summary["embedded_retried"] = await embed_pending_enrichments()
+
+    for batch in await get_pending_batches("enrichment"):
+        try:
+            responses = await collect_batch(batch)
+        except Exception as e:
+            logger.error(f"[EnrichmentBatch] Could not check batch {batch.id}: {e}")
+            summary["errors"].append(f"{batch.id}: {e}")
+            continue
+        if responses is None:
+            summary["batches_pending"] += 1
+            continue
+
+        try:
+            items = []
+            errors = []
+            for custom_id, request in (batch.request_metadata or {}).items():
+                response = responses.get(custom_id)
+                if response is None:
+                    errors.append(f"{request['launch_name']} {request['content_type']}: batch request failed")
+                    continue
+                content = parse_enrichment_response(response["text"].strip())
+                await llm_cache.store(
+                    "enrichment", request["cache_key"], content, response["tokens"], ENRICHMENT_LLM_CACHE_TTL
+                )
+                if content:
+                    items.append({
+                        "launch_id": request["launch_id"],
+                        "launch_name": request["launch_name"],
+                        "content_type": request["content_type"],
+                        "content": content,
+                        "sources": request["sources"],
+                    })
+
+            # All rows in one transaction
+            await store_enrichments(items)
+            await finish_batch(batch.id, "ended", {"stored": len(items), "errors": errors})
+            summary["batches_collected"] += 1
+            summary["stored"] += len(items)
+            summary["errors"].extend(errors)
+        except Exception as e:
+            # Back to submitted so the next run retries the store
+            logger.error(f"[EnrichmentBatch] Could not store batch {batch.id}: {e}")
+            await finish_batch(batch.id, "submitted")
+            summary["errors"].append(f"{batch.id}: {e}")
+
+    return summary
+
+
 async def trigger_enrichment(entity_type: str, entity_id: str) -> Dict[str, Any]:
     """Manually trigger enrichment for a specific entity."""
     logger.info(f"[TriggerEnrichment] Manual trigger for {entity_type}: {entity_id}")
@@ -0,0 +1,131 @@
+"""Feed ingestor - RSS/Atom feeds from STScI and NASA, normalized to SpaceNews items.
+
+Feeds are fetched with conditional requests against their source cursor
+and parsed with feedparser off the event loop. collect_all_news runs them
+alongside the API collectors and stores everything in one batch.
+"""
+
+import asyncio
+import html
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import feedparser
+
+from core.http_clients import get_http_client
+from services.news_items import COLLECT_TIMEOUT, categorize_content
+from services.mast_service import STSCI_NEWS_RSS
+from services.source_cursors import (
+    advance_watermark,
+    conditional_headers,
+    is_new,
+    update_validators,
+)
+
+# name -> feed URL, SpaceNews source and pooled HTTP client
+FEEDS: Dict[str, Dict[str, str]] = {
+    "stsci": {
+        "url": STSCI_NEWS_RSS,
+        "source": "stsci",
+        "client": "webbtelescope",
+    },
+    "nasa_news_releases": {
+        "url": "https://www.nasa.gov/news-release/feed/",
+        "source": "nasa_news",
+        "client": "nasa_www",
+    },
+    "nasa_image_of_the_day": {
+        "url": "https://www.nasa.gov/feeds/iotd-feed/",
+        "source": "nasa_iotd",
+        "client": "nasa_www",
+    },
+    "nasa_science": {
+        "url": "https://science.nasa.gov/feed/",
+        "source": "nasa_science",
+        "client": "nasa_science",
+    },
+}
+
+# Newest entries considered per feed per run
+MAX_ENTRIES_PER_FEED = 50
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+async def collect_feed(name: str, cursor: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Collect new entries from one configured feed."""
+    feed = FEEDS[name]
+    news_items = []
+
+    try:
+        client = get_http_client(feed["client"])
+        response = await client.get(
+            feed["url"],
+            headers=conditional_headers(cursor),
+            timeout=COLLECT_TIMEOUT,
+        )
+
+        if response.status_code == 200:
+            parsed = await asyncio.to_thread(feedparser.parse, response.content)
+            for entry in parsed.entries[:MAX_ENTRIES_PER_FEED]:
+                item = normalize_entry(entry, feed["source"])
+                if item and is_new(cursor, item["published_at"]):
+                    news_items.append(item)
+            update_validators(cursor, response)
+    except Exception as e:
+        # Re-raise so the feed is reported as failed and its cursor is not saved
+        print(f"Error collecting feed {name}: {e}")
+        raise
+
+    advance_watermark(cursor, news_items)
+    return news_items
+
+
+def normalize_entry(entry: Any, source: str) -> Optional[Dict[str, Any]]:
+    """Map a feedparser entry to the SpaceNews item shape."""
+    external_id = entry.get("id") or entry.get("link")
+    title = _clean_text(entry.get("title", ""))
+    if not external_id or not title:
+        return None
+
+    content = ""
+    if entry.get("content"):
+        content = _clean_text(entry["content"][0].get("value", ""))
+    summary = _clean_text(entry.get("summary", "")) or content
+    tags = [tag.get("term", "") for tag in entry.get("tags", []) if tag.get("term")]
+
+    return {
+        "source": source,
+        "external_id": external_id[:255],
+        "title": title,
+        "summary": summary[:500],
+        "content": content or summary,
+        "url": entry.get("link"),
+        "image_url": _entry_image(entry),
+        "category": categorize_content(title, summary, tags),
+        "published_at": _entry_date(entry),
+    }
+
+
+def _clean_text(value: str) -> str:
+    """Strip markup and collapse whitespace in feed text."""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", value or "")).split())
+
+
+def _entry_date(entry: Any) -> Optional[datetime]:
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    return datetime(*parsed[:6])
+
+
+def _entry_image(entry: Any) -> Optional[str]:
+    for key in ("media_content", "media_thumbnail"):
+        for media in entry.get(key, []):
+            if media.get("url"):
+                return media["url"]
+    for enclosure in entry.get("enclosures", []):
+        if enclosure.get("type", "").startswith("image/") and enclosure.get("href"):
+            return enclosure["href"]
+    return None
@@ -1,28 +1,57 @@
 """Intelligence service - Pattern analysis using Claude."""
 
+import asyncio
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import json
-import anthropic
+import uuid
+from sqlalchemy import func, select, update
 
+from core.cache import cached_fetch, invalidate
 from core.config import settings
-from db.session import SessionLocal
+from core.job_queue import report_progress
+from db.session import AsyncSessionLocal
 from db.models import SpaceNews, Insight, Alert
-from services import chromadb_service
-
-
-# Initialize Anthropic client
-def get_claude_client() -> anthropic.Anthropic:
-    """Get Anthropic client."""
-    return anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+from db.pagination import keyset_page, next_cursor
+from services.llm_cache import cached_completion
+
+# News items per Claude call and concurrent calls per run
+ANALYSIS_CHUNK_SIZE = 50
+ANALYSIS_CONCURRENCY = 3
+_analysis_semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+# Recent insights summarized into the prompt
+PRIOR_INSIGHTS_LIMIT = 30
+# Unanalyzed news sent per run, oldest first, so a backlog drains over several runs
+ANALYSIS_MAX_ITEMS = 500
+
+# Insight list: columns without evidence, ordered to match idx_insights_confidence_generated
+INSIGHT_LIST_COLUMNS = (
+    Insight.id,
+    Insight.type,
+    Insight.title,
+    Insight.description,
+    Insight.confidence_score,
+    Insight.related_news_ids,
+    Insight.category,
+    Insight.generated_at,
+)
+INSIGHT_SORT_COLUMNS = [Insight.confidence_score, Insight.generated_at, Insight.id]
+
+# Dashboard stats are invalidated on every write, the TTL is only a backstop
+DASHBOARD_STATS_KEY = "intelligence:dashboard_stats"
+DASHBOARD_STATS_TTL = 600
 
 
 ANALYSIS_PROMPT = """You are an expert space science analyst. Your task is to analyze recent space news and discoveries to identify meaningful patterns that could contribute to scientific understanding.
 
-Given the following news items from the past week:
+Given the following newly collected news items:
 
 {news_items}
 
+Patterns already identified from earlier news (do not report these again):
+
+{prior_insights}
+
 Analyze this data and identify:
 
 1. **CONNECTIONS**: Findings from different areas that relate to each other in non-obvious ways. Look for:
@@ -59,28 +88,27 @@ Return your analysis as a JSON array of pattern objects. Only include patterns y
 JSON Response:"""
 
 
-async def analyze_patterns(days: int = 7) -> Dict[str, Any]:
-    """Run pattern analysis on recent news using Claude."""
-    if not settings.ANTHROPIC_API_KEY:
-        return {"error": "ANTHROPIC_API_KEY not configured", "insights": []}
-
-    db = SessionLocal()
+def parse_patterns(response_text: str) -> List[Dict[str, Any]]:
+    """Extract the JSON array of patterns from Claude's response."""
     try:
-        # Get recent news
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        news_items = db.query(SpaceNews).filter(
-            SpaceNews.created_at >= cutoff_date
-        ).order_by(SpaceNews.published_at.desc()).limit(100).all()
-
-        if not news_items:
-            return {"message": "No news items to analyze", "insights": []}
-
-        # Format news for Claude
-        news_text = ""
-        news_id_map = {}
-        for i, news in enumerate(news_items):
-            news_id_map[i + 1] = str(news.id)
-            news_text += f"""
+        # Try to find JSON array in response
+        if "[" in response_text:
+            json_start = response_text.index("[")
+            json_end = response_text.rindex("]") + 1
+            json_str = response_text[json_start:json_end]
+            return json.loads(json_str)
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"Error parsing Claude response: {e}")
+    return []
+
+
+def _format_news(news_items: List[SpaceNews]) -> Tuple[str, Dict[int, str]]:
+    """Format news for Claude; returns (text, prompt ID -> news UUID)."""
+    news_text = ""
+    news_id_map = {}
+    for i, news in enumerate(news_items):
+        news_id_map[i + 1] = str(news.id)
+        news_text += f"""
 ---
 ID: {i + 1}
 Source: {news.source}
@@ -90,45 +118,131 @@ Date: {news.published_at.strftime('%Y-%m-%d') if news.published_at else 'Unknown
 Summary: {news.summary or news.content[:300] if news.content else 'No summary'}
 ---
 """
+    return news_text, news_id_map
+
 
-        # Call Claude for analysis
-        client = get_claude_client()
-        message = client.messages.create(
+async def _analyze_chunk(news_items: List[SpaceNews], prior_insights: str) -> List[Dict[str, Any]]:
+    """Analyze one chunk of news; related_news_ids are mapped back to UUIDs."""
+    news_text, news_id_map = _format_news(news_items)
+    async with _analysis_semaphore:
+        patterns = await cached_completion(
+            "analysis",
+            parse_patterns,
             model="claude-sonnet-4-20250514",
             max_tokens=4096,
             messages=[
                 {
                     "role": "user",
-                    "content": ANALYSIS_PROMPT.format(news_items=news_text)
+                    "content": ANALYSIS_PROMPT.format(news_items=news_text, prior_insights=prior_insights)
                 }
-            ]
+            ],
+        )
+
+    for pattern in patterns:
+        # Map news IDs back to UUIDs
+        pattern["related_news_ids"] = [
+            news_id_map[news_id]
+            for news_id in pattern.get("related_news_ids", [])
+            if isinstance(news_id, int) and news_id in news_id_map
+        ]
+    return patterns
+
+
+def _merge_patterns(
+    chunk_patterns: List[List[Dict[str, Any]]],
+    known_titles: set,
+) -> List[Dict[str, Any]]:
+    """Reduce chunk results: merge patterns with the same type and title, skip known ones."""
+    merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for patterns in chunk_patterns:
+        for pattern in patterns:
+            title = pattern.get("title", "Untitled Pattern")
+            key = (pattern.get("type", "connection"), title.strip().lower())
+            if key in known_titles:
+                continue
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = pattern
+                continue
+            existing["related_news_ids"] = list(dict.fromkeys(
+                existing["related_news_ids"] + pattern["related_news_ids"]
+            ))
+            if float(pattern.get("confidence_score", 0.5)) > float(existing.get("confidence_score", 0.5)):
+                existing["confidence_score"] = pattern.get("confidence_score")
+                existing["description"] = pattern.get("description", existing.get("description"))
+                existing["evidence"] = pattern.get("evidence", existing.get("evidence"))
+    return list(merged.values())
+
+
+async def analyze_patterns(days: int = 7) -> Dict[str, Any]:
+    """Run pattern analysis on news not analyzed yet.
+
+    Items without analyzed_at are sent (oldest first, up to
+    ANALYSIS_MAX_ITEMS) in chunks analyzed concurrently, together with a
+    summary of insights from the last `days` so known patterns are not
+    re-reported. Items are marked per row, and only for chunks that were
+    analyzed successfully; rows from a failed chunk are retried by the next
+    run however old they are.
+    """
+    if not settings.ANTHROPIC_API_KEY:
+        return {"error": "ANTHROPIC_API_KEY not configured", "insights": []}
+
+    async with AsyncSessionLocal() as db:
+        # Get news not analyzed yet
+        result = await db.execute(
+            select(SpaceNews).filter(
+                SpaceNews.analyzed_at.is_(None),
+            ).order_by(SpaceNews.created_at).limit(ANALYSIS_MAX_ITEMS)
         )
+        news_items = result.scalars().all()
 
-        # Parse response
-        response_text = message.content[0].text.strip()
-
-        # Extract JSON from response
-        try:
-            # Try to find JSON array in response
-            if "[" in response_text:
-                json_start = response_text.index("[")
-                json_end = response_text.rindex("]") + 1
-                json_str = response_text[json_start:json_end]
-                patterns = json.loads(json_str)
-            else:
-                patterns = []
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Error parsing Claude response: {e}")
-            patterns = []
-
-        # Store insights
+        if not news_items:
+            return {"message": "No new news items to analyze", "insights": []}
+
+        # Compact summary of what has already been found
+        result = await db.execute(
+            select(Insight.type, Insight.title).filter(
+                Insight.generated_at >= datetime.utcnow() - timedelta(days=days)
+            ).order_by(Insight.generated_at.desc()).limit(PRIOR_INSIGHTS_LIMIT)
+        )
+        prior = result.all()
+
+    prior_insights = "\n".join(f"- ({insight_type}) {title}" for insight_type, title in prior) or "None yet."
+    known_titles = {(insight_type, title.strip().lower()) for insight_type, title in prior}
+
+    # Map: analyze chunks concurrently
+    chunks = [
+        news_items[i:i + ANALYSIS_CHUNK_SIZE]
+        for i in range(0, len(news_items), ANALYSIS_CHUNK_SIZE)
+    ]
+    await report_progress("analyzing", news_items=len(news_items), chunks=len(chunks))
+    chunk_results = await asyncio.gather(
+        *(_analyze_chunk(chunk, prior_insights) for chunk in chunks),
+        return_exceptions=True,
+    )
+
+    # A failed chunk doesn't discard the others; its rows stay unanalyzed
+    chunk_patterns = []
+    analyzed_ids = []
+    errors = []
+    for chunk, patterns in zip(chunks, chunk_results):
+        if isinstance(patterns, BaseException):
+            print(f"[Intelligence] Analysis chunk of {len(chunk)} items failed: {patterns}")
+            errors.append(str(patterns))
+            continue
+        chunk_patterns.append(patterns)
+        analyzed_ids.extend(news.id for news in chunk)
+    if not analyzed_ids:
+        raise RuntimeError(f"All {len(chunks)} analysis chunks failed: {errors[0]}")
+
+    # Reduce: merge duplicates across chunks
+    patterns = _merge_patterns(chunk_patterns, known_titles)
+
+    # Store insights
+    async with AsyncSessionLocal() as db:
         stored_insights = []
         for pattern in patterns:
-            # Map news IDs back to UUIDs
-            related_ids = []
-            for news_id in pattern.get("related_news_ids", []):
-                if isinstance(news_id, int) and news_id in news_id_map:
-                    related_ids.append(news_id_map[news_id])
+            related_ids = pattern["related_news_ids"]
 
             insight = Insight(
                 type=pattern.get("type", "connection"),
@@ -141,7 +255,7 @@ Summary: {news.summary or news.content[:300] if news.content else 'No summary'}
             )
 
             db.add(insight)
-            db.flush()
+            await db.flush()
 
             # Create alert for high-confidence insights
             if insight.confidence_score >= 0.7:
@@ -153,51 +267,68 @@ Summary: {news.summary or news.content[:300] if news.content else 'No summary'}
 
             stored_insights.append(insight.to_dict())
 
-        db.commit()
+        # Marked in the same transaction as the insights they produced
+        await db.execute(
+            update(SpaceNews)
+            .where(SpaceNews.id.in_(analyzed_ids))
+            .values(analyzed_at=datetime.utcnow())
+        )
+        await db.commit()
 
-        return {
-            "analyzed_news_count": len(news_items),
-            "patterns_found": len(stored_insights),
-            "insights": stored_insights,
-        }
+    if stored_insights:
+        await invalidate_dashboard_stats()
 
-    except Exception as e:
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+    return {
+        "analyzed_news_count": len(analyzed_ids),
+        "chunks": len(chunks),
+        "failed_chunks": len(errors),
+        "errors": errors,
+        "patterns_found": len(stored_insights),
+        "insights": stored_insights,
+    }
 
 
 async def get_insights(
     insight_type: Optional[str] = None,
     category: Optional[str] = None,
     limit: int = 20,
-) -> List[Dict[str, Any]]:
-    """Get insights from database."""
-    db = SessionLocal()
-    try:
-        query = db.query(Insight)
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get insights by confidence, newest first; returns (insights, next_cursor).
+
+    List rows leave out evidence, which only the detail view shows. Raises
+    ValueError for a malformed cursor.
+    """
+    async with AsyncSessionLocal() as db:
+        query = select(*INSIGHT_LIST_COLUMNS)
 
         if insight_type:
             query = query.filter(Insight.type == insight_type)
         if category:
             query = query.filter(Insight.category == category)
 
-        insights = query.order_by(
-            Insight.confidence_score.desc(),
-            Insight.generated_at.desc()
-        ).limit(limit).all()
+        rows = (await db.execute(
+            keyset_page(query, INSIGHT_SORT_COLUMNS, limit, cursor)
+        )).all()
+        rows, cursor = next_cursor(
+            rows, limit, lambda row: (row.confidence_score, row.generated_at, row.id)
+        )
+
+        insights = []
+        for row in rows:
+            insight = row._asdict()
+            insight["id"] = str(row.id)
+            insight["related_news_ids"] = [str(id) for id in row.related_news_ids] if row.related_news_ids else []
+            insight["generated_at"] = row.generated_at.isoformat() if row.generated_at else None
+            insights.append(insight)
 
-        return [i.to_dict() for i in insights]
-    finally:
-        db.close()
+        return insights, cursor
 
 
 async def get_insight_by_id(insight_id: str) -> Optional[Dict[str, Any]]:
     """Get a single insight with related news."""
-    db = SessionLocal()
-    try:
-        insight = db.query(Insight).filter(Insight.id == insight_id).first()
+    async with AsyncSessionLocal() as db:
+        insight = await db.get(Insight, uuid.UUID(insight_id))
         if not insight:
             return None
 
@@ -205,90 +336,101 @@ async def get_insight_by_id(insight_id: str) -> Optional[Dict[str, Any]]:
 
         # Get related news
         if insight.related_news_ids:
-            related_news = db.query(SpaceNews).filter(
-                SpaceNews.id.in_(insight.related_news_ids)
-            ).all()
-            result["related_news"] = [n.to_dict() for n in related_news]
+            related_news = await db.execute(
+                select(SpaceNews).filter(SpaceNews.id.in_(insight.related_news_ids))
+            )
+            result["related_news"] = [n.to_dict() for n in related_news.scalars().all()]
 
         return result
-    finally:
-        db.close()
 
 
-async def get_alerts(unread_only: bool = True, limit: int = 20) -> List[Dict[str, Any]]:
-    """Get alerts."""
-    db = SessionLocal()
-    try:
-        query = db.query(Alert)
+async def get_alerts(
+    unread_only: bool = True,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get alerts newest first with their insights; returns (alerts, next_cursor).
+
+    Raises ValueError for a malformed cursor.
+    """
+    async with AsyncSessionLocal() as db:
+        query = select(Alert, Insight).outerjoin(Insight, Alert.insight_id == Insight.id)
 
         if unread_only:
             query = query.filter(Alert.seen == False)
 
-        alerts = query.order_by(
-            Alert.created_at.desc()
-        ).limit(limit).all()
+        rows = (await db.execute(
+            keyset_page(query, [Alert.created_at, Alert.id], limit, cursor)
+        )).all()
+        rows, cursor = next_cursor(rows, limit, lambda row: (row.Alert.created_at, row.Alert.id))
 
         result = []
-        for alert in alerts:
+        for alert, insight in rows:
             alert_dict = alert.to_dict()
 
             # Include insight info
-            if alert.insight_id:
-                insight = db.query(Insight).filter(Insight.id == alert.insight_id).first()
-                if insight:
-                    alert_dict["insight"] = insight.to_dict()
+            if insight:
+                alert_dict["insight"] = insight.to_dict()
 
             result.append(alert_dict)
 
-        return result
-    finally:
-        db.close()
+        return result, cursor
 
 
 async def mark_alert_seen(alert_id: str) -> bool:
     """Mark an alert as seen."""
-    db = SessionLocal()
-    try:
-        alert = db.query(Alert).filter(Alert.id == alert_id).first()
+    async with AsyncSessionLocal() as db:
+        alert = await db.get(Alert, uuid.UUID(alert_id))
         if not alert:
             return False
 
         alert.seen = True
-        db.commit()
-        return True
-    finally:
-        db.close()
+        await db.commit()
+
+    await invalidate_dashboard_stats()
+    return True
+
+
+async def invalidate_dashboard_stats() -> None:
+    """Drop cached dashboard stats after news, insights or alerts change."""
+    await invalidate(DASHBOARD_STATS_KEY)
 
 
 async def get_dashboard_stats() -> Dict[str, Any]:
-    """Get statistics for the dashboard."""
-    db = SessionLocal()
-    try:
-        # Get counts
-        total_news = db.query(SpaceNews).count()
-        total_insights = db.query(Insight).count()
-        unread_alerts = db.query(Alert).filter(Alert.seen == False).count()
-
-        # Get insight type breakdown
-        insight_types = {}
-        for insight_type in ["connection", "trend", "gap", "anomaly"]:
-            count = db.query(Insight).filter(Insight.type == insight_type).count()
-            insight_types[insight_type] = count
-
-        # Get category breakdown
-        categories = db.query(SpaceNews.category).distinct().all()
-        category_counts = {}
-        for (cat,) in categories:
-            if cat:
-                count = db.query(SpaceNews).filter(SpaceNews.category == cat).count()
-                category_counts[cat] = count
+    """Get statistics for the dashboard (cached until the next write)."""
+    return await cached_fetch(DASHBOARD_STATS_KEY, _load_dashboard_stats, ttl=DASHBOARD_STATS_TTL)
+
+
+async def _load_dashboard_stats() -> Dict[str, Any]:
+    """Compute dashboard statistics with one aggregate query per table."""
+    async with AsyncSessionLocal() as db:
+        # News totals per category
+        category_rows = (await db.execute(
+            select(SpaceNews.category, func.count()).group_by(SpaceNews.category)
+        )).all()
+        total_news = sum(count for _, count in category_rows)
+        category_counts = {cat: count for cat, count in category_rows if cat}
+
+        # Insight totals per type
+        type_rows = (await db.execute(
+            select(Insight.type, func.count()).group_by(Insight.type)
+        )).all()
+        total_insights = sum(count for _, count in type_rows)
+        insight_types = {insight_type: 0 for insight_type in ["connection", "trend", "gap", "anomaly"]}
+        insight_types.update({insight_type: count for insight_type, count in type_rows if insight_type in insight_types})
+
+        unread_alerts = await db.scalar(
+            select(func.count()).select_from(Alert).filter(Alert.seen == False)
+        )
 
         # Get recent high-confidence insights
-        recent_insights = db.query(Insight).filter(
-            Insight.confidence_score >= 0.7
-        ).order_by(
-            Insight.generated_at.desc()
-        ).limit(5).all()
+        recent_insights = (await db.execute(
+            select(Insight).filter(
+                Insight.confidence_score >= 0.7
+            ).order_by(
+                Insight.generated_at.desc()
+            ).limit(5)
+        )).scalars().all()
 
         return {
             "total_news": total_news,
@@ -298,5 +440,3 @@ async def get_dashboard_stats() -> Dict[str, Any]:
             "categories": category_counts,
             "recent_high_confidence": [i.to_dict() for i in recent_insights],
         }
-    finally:
-        db.close()
@@ -0,0 +1,248 @@
+"""ISS position engine - local SGP4 propagation from a periodically refreshed TLE."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sgp4.api import Satrec
+
+from core.cache import cached_fetch
+from core.http_clients import get_http_client
+
+ISS_NORAD_ID = 25544
+CELESTRAK_TLE_URL = "https://celestrak.org/NORAD/elements/gp.php"
+
+# TLEs for the ISS are published several times a day
+TLE_REFRESH_SECONDS = 6 * 3600
+
+# WGS84 ellipsoid
+EARTH_RADIUS_KM = 6378.137
+EARTH_FLATTENING = 1 / 298.257223563
+EARTH_E2 = EARTH_FLATTENING * (2 - EARTH_FLATTENING)
+
+MAX_TRACK_POINTS = 1000
+
+# Minimum gap between on-demand refresh attempts while no TLE is loaded
+RETRY_SECONDS = 60
+
+_last_attempt = 0.0
+
+_satellite: Optional[Satrec] = None
+_tle: Optional[Tuple[str, str]] = None
+_refresh_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _load_tle() -> Optional[List[str]]:
+    """Fetch the current ISS TLE from CelesTrak."""
+    client = get_http_client("celestrak")
+    response = await client.get(
+        CELESTRAK_TLE_URL,
+        params={"CATNR": ISS_NORAD_ID, "FORMAT": "TLE"},
+    )
+    response.raise_for_status()
+
+    lines = [line.strip() for line in response.text.splitlines() if line.strip()]
+    tle_lines = [line for line in lines if line.startswith(("1 ", "2 "))]
+    if len(tle_lines) != 2:
+        return None
+    return tle_lines
+
+
+async def refresh_tle() -> bool:
+    """Refresh the TLE (shared across workers via the cache) and rebuild the propagator."""
+    global _satellite, _tle, _last_attempt
+    _last_attempt = time.time()
+    try:
+        tle_lines = await cached_fetch(
+            "iss:tle",
+            _load_tle,
+            ttl=TLE_REFRESH_SECONDS,
+            stale_ttl=2 * 86400,
+        )
+    except Exception as e:
+        print(f"[ISS] TLE refresh failed: {e}")
+        return _satellite is not None
+
+    if not tle_lines:
+        return _satellite is not None
+
+    line1, line2 = tle_lines
+    if _tle != (line1, line2):
+        _satellite = Satrec.twoline2rv(line1, line2)
+        _tle = (line1, line2)
+    return True
+
+
+async def _refresh_loop() -> None:
+    """Keep the TLE current for the lifetime of the app."""
+    while True:
+        await refresh_tle()
+        await asyncio.sleep(TLE_REFRESH_SECONDS / 4)
+
+
+def start_tle_refresh() -> None:
+    """Start the background TLE refresh loop."""
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.ensure_future(_refresh_loop())
+
+
+async def stop_tle_refresh() -> None:
+    """Stop the background TLE refresh loop."""
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
+
+
+def is_ready() -> bool:
+    """Whether a TLE has been loaded and positions can be served locally."""
+    return _satellite is not None
+
+
+def should_retry() -> bool:
+    """Whether an on-demand TLE refresh may be attempted now."""
+    return time.time() - _last_attempt >= RETRY_SECONDS
+
+
+def _julian_dates(timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split Unix timestamps into SGP4's (whole, fraction) Julian date pair."""
+    jd = timestamps / 86400.0 + 2440587.5
+    whole = np.floor(jd)
+    return whole, jd - whole
+
+
+def _gmst(jd: np.ndarray) -> np.ndarray:
+    """Greenwich mean sidereal time in radians (IAU 1982)."""
+    t = (jd - 2451545.0) / 36525.0
+    seconds = (
+        67310.54841
+        + (876600.0 * 3600.0 + 8640184.812866) * t
+        + 0.093104 * t ** 2
+        - 6.2e-6 * t ** 3
+    )
+    return np.radians((seconds % 86400.0) / 240.0)
+
+
+def _sun_direction(jd: np.ndarray) -> np.ndarray:
+    """Low-precision unit vector to the Sun in the inertial frame."""
+    n = jd - 2451545.0
+    mean_long = np.radians((280.460 + 0.9856474 * n) % 360.0)
+    anomaly = np.radians((357.528 + 0.9856003 * n) % 360.0)
+    ecl_long = mean_long + np.radians(1.915) * np.sin(anomaly) + np.radians(0.020) * np.sin(2 * anomaly)
+    obliquity = np.radians(23.439 - 0.0000004 * n)
+    return np.stack([
+        np.cos(ecl_long),
+        np.cos(obliquity) * np.sin(ecl_long),
+        np.sin(obliquity) * np.sin(ecl_long),
+    ], axis=-1)
+
+
+def _to_geodetic(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convert Earth-fixed coordinates (km) to WGS84 latitude/longitude (deg) and altitude (km)."""
+    lon = np.arctan2(y, x)
+    p = np.hypot(x, y)
+    lat = np.arctan2(z, p * (1 - EARTH_E2))
+    for _ in range(4):
+        n = EARTH_RADIUS_KM / np.sqrt(1 - EARTH_E2 * np.sin(lat) ** 2)
+        alt = p / np.cos(lat) - n
+        lat = np.arctan2(z, p * (1 - EARTH_E2 * n / (n + alt)))
+    n = EARTH_RADIUS_KM / np.sqrt(1 - EARTH_E2 * np.sin(lat) ** 2)
+    alt = p / np.cos(lat) - n
+    return np.degrees(lat), np.degrees(lon), alt
+
+
+def _wrap_degrees(angle: np.ndarray) -> np.ndarray:
+    return (angle + 180.0) % 360.0 - 180.0
+
+
+def _propagate(timestamps: np.ndarray) -> Dict[str, np.ndarray]:
+    """Propagate the ISS to each timestamp in one vectorized SGP4 call."""
+    whole, frac = _julian_dates(timestamps)
+    errors, r, v = _satellite.sgp4_array(whole, frac)
+    if np.any(errors):
+        raise RuntimeError(f"SGP4 propagation error code {int(errors[errors != 0][0])}")
+
+    jd = whole + frac
+    theta = _gmst(jd)
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+
+    # TEME -> Earth-fixed (rotation about z by GMST; polar motion ignored)
+    x = cos_t * r[:, 0] + sin_t * r[:, 1]
+    y = -sin_t * r[:, 0] + cos_t * r[:, 1]
+    lat, lon, alt = _to_geodetic(x, y, r[:, 2])
+
+    sun = _sun_direction(jd)
+    along_sun = np.sum(r * sun, axis=1)
+    off_axis = np.linalg.norm(r - along_sun[:, None] * sun, axis=1)
+    eclipsed = (along_sun < 0) & (off_axis < EARTH_RADIUS_KM)
+
+    solar_lat = np.degrees(np.arcsin(sun[:, 2]))
+    solar_ra = np.degrees(np.arctan2(sun[:, 1], sun[:, 0]))
+
+    return {
+        "timestamp": timestamps,
+        "daynum": jd,
+        "latitude": lat,
+        "longitude": lon,
+        "altitude": alt,
+        "velocity": np.linalg.norm(v, axis=1) * 3600.0,  # km/h
+        "footprint": 2 * EARTH_RADIUS_KM * np.arccos(EARTH_RADIUS_KM / (EARTH_RADIUS_KM + alt)),
+        "eclipsed": eclipsed,
+        "solar_lat": solar_lat,
+        "solar_lon": _wrap_degrees(solar_ra - np.degrees(theta)),
+    }
+
+
+def get_position(timestamp: Optional[float] = None) -> Dict[str, Any]:
+    """Current ISS position in the same shape as api.wheretheiss.at."""
+    if _satellite is None:
+        raise RuntimeError("ISS TLE not loaded")
+
+    ts = time.time() if timestamp is None else timestamp
+    state = _propagate(np.array([ts], dtype=float))
+
+    return {
+        "name": "iss",
+        "id": ISS_NORAD_ID,
+        "latitude": float(state["latitude"][0]),
+        "longitude": float(state["longitude"][0]),
+        "altitude": float(state["altitude"][0]),
+        "velocity": float(state["velocity"][0]),
+        "visibility": "eclipsed" if state["eclipsed"][0] else "daylight",
+        "footprint": float(state["footprint"][0]),
+        "timestamp": int(ts),
+        "daynum": float(state["daynum"][0]),
+        "solar_lat": float(state["solar_lat"][0]),
+        "solar_lon": float(state["solar_lon"][0]),
+        "units": "kilometers",
+        "source": "sgp4",
+    }
+
+
+def get_ground_track(points: int, step_seconds: int = 60, start: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Future ISS positions at a fixed step, computed in a single vectorized call."""
+    if _satellite is None:
+        raise RuntimeError("ISS TLE not loaded")
+
+    points = max(1, min(points, MAX_TRACK_POINTS))
+    t0 = time.time() if start is None else start
+    timestamps = t0 + np.arange(points, dtype=float) * step_seconds
+    state = _propagate(timestamps)
+
+    return [
+        {
+            "timestamp": int(state["timestamp"][i]),
+            "latitude": round(float(state["latitude"][i]), 4),
+            "longitude": round(float(state["longitude"][i]), 4),
+            "altitude": round(float(state["altitude"][i]), 2),
+        }
+        for i in range(points)
+    ]
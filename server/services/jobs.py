@@ -0,0 +1,14 @@
+"""Background jobs run through the job queue."""
+
+from core.job_queue import register_job
+from services import intelligence_service, news_collector
+from services.enrichment_service import finish_enrichment_batches, run_daily_enrichment, trigger_enrichment
+
+
+def register_jobs() -> None:
+    """Register every job handler with the queue."""
+    register_job("collect_news", news_collector.collect_all_news)
+    register_job("analyze_patterns", intelligence_service.analyze_patterns)
+    register_job("daily_enrichment", run_daily_enrichment)
+    register_job("enrich_entity", trigger_enrichment)
+    register_job("finish_enrichment_batches", finish_enrichment_batches)
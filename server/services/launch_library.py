@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-import httpx
-
-from core.cache import get_cached, set_cache
+from core.cache import cached_fetch
+from core.http_clients import get_http_client
 
 LAUNCH_LIBRARY_BASE_URL = "https://ll.thespacedevs.com/2.2.0"
 
@@ -16,25 +15,27 @@ async def fetch_launch_by_id(launch_id: str) -> Optional[Dict[str, Any]]:
 
     cache_key = f"launch:detail:{launch_id}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 5 minutes, serve stale for up to 1 hour while refreshing
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_launch(launch_id),
+        ttl=300,
+        stale_ttl=3600,
+    )
+
 
+async def _load_launch(launch_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch and parse a single launch from Launch Library."""
     endpoint = f"{LAUNCH_LIBRARY_BASE_URL}/launch/{launch_id}/"
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(endpoint)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
+    client = get_http_client("launch_library")
+    response = await client.get(endpoint)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
 
     launch = response.json()
-    result = _parse_launch_detail(launch)
-
-    # Cache for 5 minutes
-    await set_cache(cache_key, result, expire=300)
-    return result
+    return _parse_launch_detail(launch)
 
 
 async def fetch_launch_by_slug(slug: str) -> Optional[Dict[str, Any]]:
@@ -209,11 +210,17 @@ async def fetch_upcoming_launches(limit: int = 10) -> List[Dict[str, Any]]:
 
     cache_key = f"launches:upcoming:{limit}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 5 minutes (launch data updates frequently), serve stale for up to 1 hour
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_upcoming_launches(limit),
+        ttl=300,
+        stale_ttl=3600,
+    )
+
 
+async def _load_upcoming_launches(limit: int) -> List[Dict[str, Any]]:
+    """Fetch and parse upcoming launches from Launch Library."""
     endpoint = f"{LAUNCH_LIBRARY_BASE_URL}/launch/upcoming/"
     params = {
         "mode": "detailed",
@@ -221,9 +228,9 @@ async def fetch_upcoming_launches(limit: int = 10) -> List[Dict[str, Any]]:
         "ordering": "net",
     }
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
+    client = get_http_client("launch_library")
+    response = await client.get(endpoint, params=params)
+    response.raise_for_status()
 
     data = response.json()
     launches = data.get("results", [])
@@ -250,8 +257,6 @@ async def fetch_upcoming_launches(limit: int = 10) -> List[Dict[str, Any]]:
         for launch in launches
     ]
 
-    # Cache for 5 minutes (launch data updates frequently)
-    await set_cache(cache_key, result, expire=300)
     return result
 
 
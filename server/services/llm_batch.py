@@ -0,0 +1,192 @@
+"""Batch LLM backends for offline jobs.
+
+A backend submits many single-prompt requests as one batch and later
+collects each response by custom_id. AnthropicBatchBackend uses the
+Message Batches API; LocalBatchBackend answers in-process and is meant for
+tests and local development.
+
+Batches can take hours, so callers don't wait on them: submit_batch
+records the batch in llm_batches with the caller's per-request metadata,
+and a scheduled job polls pending batches with collect_batch.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import uuid
+
+from sqlalchemy import select, update
+
+from core.claude import get_claude_client
+from core.config import settings
+from db.session import AsyncSessionLocal
+from db.models import LLMBatch
+
+DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
+
+class BatchBackend(ABC):
+    """Runs {"custom_id", "prompt", "model", "max_tokens"} requests as one batch."""
+
+    name: str
+
+    @abstractmethod
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """Submit the requests and return the backend's batch id."""
+
+    @abstractmethod
+    async def collect(self, batch_id: str) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        """Results by custom_id once the batch has ended, else None.
+
+        Each result is {"text", "tokens"}, or None for a request that failed.
+        """
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Message Batches API."""
+
+    name = "anthropic"
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        client = get_claude_client()
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": request["custom_id"],
+                    "params": {
+                        "model": request.get("model", DEFAULT_MODEL),
+                        "max_tokens": request.get("max_tokens", 2048),
+                        "messages": [{"role": "user", "content": request["prompt"]}],
+                    },
+                }
+                for request in requests
+            ]
+        )
+        print(f"[LLMBatch] Submitted batch {batch.id} with {len(requests)} requests")
+        return batch.id
+
+    async def collect(self, batch_id: str) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        client = get_claude_client()
+        batch = await client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        async for entry in await client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                message = entry.result.message
+                results[entry.custom_id] = {
+                    "text": message.content[0].text,
+                    "tokens": message.usage.input_tokens + message.usage.output_tokens,
+                }
+            else:
+                print(f"[LLMBatch] Request {entry.custom_id} {entry.result.type}")
+                results[entry.custom_id] = None
+        return results
+
+
+class LocalBatchBackend(BatchBackend):
+    """Answers every request in-process with a responder function (default: "{}").
+
+    Results live in this process only, so submit and collect must run in
+    the same worker.
+    """
+
+    name = "local"
+
+    def __init__(self, responder: Optional[Callable[[str], str]] = None):
+        self.responder = responder or (lambda prompt: "{}")
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        batch_id = f"local-{uuid.uuid4().hex}"
+        _local_results[batch_id] = {
+            request["custom_id"]: {"text": self.responder(request["prompt"]), "tokens": 0}
+            for request in requests
+        }
+        return batch_id
+
+    async def collect(self, batch_id: str) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+        return _local_results.pop(batch_id, {})
+
+
+_local_results: Dict[str, Dict[str, Optional[Dict[str, Any]]]] = {}
+
+
+def get_batch_backend(name: Optional[str] = None) -> BatchBackend:
+    """Backend by name ("anthropic" or "local"), defaulting to LLM_BATCH_BACKEND."""
+    name = name or settings.LLM_BATCH_BACKEND
+    if name == "local":
+        return LocalBatchBackend()
+    if name == "anthropic":
+        return AnthropicBatchBackend()
+    raise ValueError(f"Unknown LLM batch backend: {name}")
+
+
+async def submit_batch(purpose: str, requests: List[Dict[str, Any]], metadata: Dict[str, Any]) -> str:
+    """Submit requests and record the pending batch; metadata maps custom_id to caller data."""
+    backend = get_batch_backend()
+    batch_id = await backend.submit(requests)
+    async with AsyncSessionLocal() as db:
+        db.add(LLMBatch(
+            id=batch_id,
+            backend=backend.name,
+            purpose=purpose,
+            request_count=len(requests),
+            request_metadata=metadata,
+        ))
+        await db.commit()
+    return batch_id
+
+
+async def get_pending_batches(purpose: str) -> List[LLMBatch]:
+    """Batches for purpose that were submitted but not yet collected."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(LLMBatch).filter(
+                LLMBatch.purpose == purpose,
+                LLMBatch.status == "submitted",
+            ).order_by(LLMBatch.submitted_at)
+        )
+        return result.scalars().all()
+
+
+async def get_in_flight_metadata(purpose: str) -> List[Dict[str, Any]]:
+    """Per-request metadata of every batch for purpose whose results are not stored yet."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(LLMBatch.request_metadata).filter(
+                LLMBatch.purpose == purpose,
+                LLMBatch.status.in_(["submitted", "collecting"]),
+            )
+        )
+        return [
+            request
+            for metadata in result.scalars().all()
+            for request in (metadata or {}).values()
+        ]
+
+
+async def collect_batch(batch: LLMBatch) -> Optional[Dict[str, Optional[Dict[str, Any]]]]:
+    """Results of an ended batch, claimed for this caller; None if still running or claimed elsewhere."""
+    results = await get_batch_backend(batch.backend).collect(batch.id)
+    if results is None:
+        return None
+    async with AsyncSessionLocal() as db:
+        claimed = await db.execute(
+            update(LLMBatch)
+            .where(LLMBatch.id == batch.id, LLMBatch.status == "submitted")
+            .values(status="collecting")
+        )
+        await db.commit()
+    return results if claimed.rowcount else None
+
+
+async def finish_batch(batch_id: str, status: str, summary: Optional[Dict[str, Any]] = None) -> None:
+    """Mark a collected batch as ended/failed, or back to submitted so it is retried."""
+    async with AsyncSessionLocal() as db:
+        batch = await db.get(LLMBatch, batch_id)
+        batch.status = status
+        batch.summary = summary
+        if status != "submitted":
+            batch.finished_at = datetime.utcnow()
+        await db.commit()
@@ -0,0 +1,88 @@
+"""Response cache for Claude calls.
+
+Identical requests (same model, prompt and parameters) return the parsed
+result stored in Redis instead of calling the API again. Counters track
+hits, misses and the tokens saved per caller.
+"""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from core.cache import get_cached, set_cache
+from core.claude import get_claude_client
+
+DEFAULT_TTL = 24 * 3600
+
+# Per-caller counters for this worker
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def cache_key(model: str, messages: List[Dict[str, Any]], **params: Any) -> str:
+    """Content hash of everything that determines the response."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return f"llm:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+def _caller_stats(caller: str) -> Dict[str, int]:
+    return _stats.setdefault(caller, {"hits": 0, "misses": 0, "tokens_saved": 0, "tokens_used": 0})
+
+
+async def cached_completion(
+    caller: str,
+    parse: Callable[[str], Any],
+    model: str,
+    max_tokens: int,
+    messages: List[Dict[str, Any]],
+    system: Optional[str] = None,
+    ttl: int = DEFAULT_TTL,
+) -> Any:
+    """Call messages.create through the cache and return parse(response_text).
+
+    Only truthy parsed results are cached, so failed or empty parses are
+    retried on the next call.
+    """
+    params: Dict[str, Any] = {"max_tokens": max_tokens}
+    if system is not None:
+        params["system"] = system
+    key = cache_key(model, messages, **params)
+
+    cached = await lookup(caller, key)
+    if cached is not None:
+        return cached
+
+    client = get_claude_client()
+    message = await client.messages.create(model=model, messages=messages, **params)
+    tokens = message.usage.input_tokens + message.usage.output_tokens
+
+    result = parse(message.content[0].text.strip())
+    await store(caller, key, result, tokens, ttl)
+    return result
+
+
+async def lookup(caller: str, key: str) -> Optional[Any]:
+    """Cached parsed result for a cache_key, counting the hit or miss."""
+    stats = _caller_stats(caller)
+    cached = await get_cached(key)
+    if cached is not None:
+        stats["hits"] += 1
+        stats["tokens_saved"] += cached.get("tokens", 0)
+        return cached["result"]
+    stats["misses"] += 1
+    return None
+
+
+async def store(caller: str, key: str, result: Any, tokens: int, ttl: int = DEFAULT_TTL) -> None:
+    """Record the tokens a call used and cache its parsed result if truthy."""
+    _caller_stats(caller)["tokens_used"] += tokens
+    if result:
+        await set_cache(key, {"result": result, "tokens": tokens}, expire=ttl)
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Hit/miss and token counters per caller for this worker."""
+    return {caller: dict(stats) for caller, stats in _stats.items()}
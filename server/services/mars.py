@@ -4,9 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-import httpx
-
-from core.cache import get_cached, set_cache
+from core.cache import cached_fetch
+from core.http_clients import get_http_client
 from core.config import settings
 
 NASA_BASE_URL = "https://api.nasa.gov"
@@ -17,11 +16,17 @@ async def fetch_mars_rover_photos(rover: str = "curiosity", sol: int = 1000, lim
 
     cache_key = f"mars:rover:{rover}:{sol}:{limit}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 12 hours (historical data doesn't change), serve stale for a week
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_rover_photos(rover, sol, limit),
+        ttl=43200,
+        stale_ttl=604800,
+    )
+
 
+async def _load_rover_photos(rover: str, sol: int, limit: int) -> List[Dict[str, Any]]:
+    """Fetch and parse Mars Rover photos from the NASA API."""
     # Correct endpoint based on NASA API documentation
     endpoint = f"https://api.nasa.gov/mars-photos/api/v1/rovers/{rover}/photos"
     params = {
@@ -30,10 +35,10 @@ async def fetch_mars_rover_photos(rover: str = "curiosity", sol: int = 1000, lim
         "page": 1,
     }
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
-        data = response.json()
+    client = get_http_client("nasa")
+    response = await client.get(endpoint, params=params, timeout=30.0)
+    response.raise_for_status()
+    data = response.json()
 
     photos = data.get("photos", [])[:limit]
 
@@ -53,8 +58,6 @@ async def fetch_mars_rover_photos(rover: str = "curiosity", sol: int = 1000, lim
         for photo in photos
     ]
 
-    # Cache for 12 hours (historical data doesn't change)
-    await set_cache(cache_key, result, expire=43200)
     return result
 
 
@@ -63,11 +66,12 @@ async def fetch_mars_weather() -> Dict[str, Any]:
 
     cache_key = "mars:weather:insight"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 24 hours (InSight mission ended, historical data), serve stale for a week
+    return await cached_fetch(cache_key, _load_mars_weather, ttl=86400, stale_ttl=604800)
 
+
+async def _load_mars_weather() -> Dict[str, Any]:
+    """Fetch and parse InSight weather data from the NASA API."""
     endpoint = f"{NASA_BASE_URL}/insight_weather/"
     params = {
         "api_key": settings.NASA_API_KEY,
@@ -75,10 +79,10 @@ async def fetch_mars_weather() -> Dict[str, Any]:
         "ver": "1.0",
     }
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
-        data = response.json()
+    client = get_http_client("nasa")
+    response = await client.get(endpoint, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     # InSight mission ended, but we'll return the structure
     sol_keys = data.get("sol_keys", [])
@@ -101,8 +105,6 @@ async def fetch_mars_weather() -> Dict[str, Any]:
         "validity_checks": data.get("validity_checks", {}),
     }
 
-    # Cache for 24 hours (InSight mission ended, historical data)
-    await set_cache(cache_key, result, expire=86400)
     return result
 
 
@@ -111,20 +113,26 @@ async def fetch_epic_images(limit: int = 10) -> List[Dict[str, Any]]:
 
     cache_key = f"earth:epic:{limit}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 2 hours (EPIC updates approximately every 2 hours), serve stale for a day
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_epic_images(limit),
+        ttl=7200,
+        stale_ttl=86400,
+    )
+
 
+async def _load_epic_images(limit: int) -> List[Dict[str, Any]]:
+    """Fetch and parse EPIC image metadata from the NASA API."""
     endpoint = f"{NASA_BASE_URL}/EPIC/api/natural/images"
     params = {
         "api_key": settings.NASA_API_KEY,
     }
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
-        data = response.json()
+    client = get_http_client("nasa")
+    response = await client.get(endpoint, params=params)
+    response.raise_for_status()
+    data = response.json()
 
     images = data[:limit] if isinstance(data, list) else []
 
@@ -146,6 +154,4 @@ async def fetch_epic_images(limit: int = 10) -> List[Dict[str, Any]]:
         for img in images
     ]
 
-    # Cache for 2 hours (EPIC updates approximately every 2 hours)
-    await set_cache(cache_key, result, expire=7200)
     return result
@@ -5,36 +5,37 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import httpx
-
-from core.cache import get_cached, set_cache
+from core.cache import cached_fetch
+from core.http_clients import get_http_client
 from core.config import settings
 
 NASA_BASE_URL = "https://api.nasa.gov"
 
 
-async def _request(endpoint: str, params: Dict[str, Any] | None = None, cache_seconds: int = 300) -> Dict[str, Any]:
-    """Make cached request to NASA API."""
+async def _request(
+    endpoint: str,
+    params: Dict[str, Any] | None = None,
+    cache_seconds: int = 300,
+    stale_seconds: int = 0,
+) -> Dict[str, Any]:
+    """Make cached request to NASA API.
+
+    Responses are fresh for cache_seconds and may be served stale (while
+    refreshing in the background) for a further stale_seconds.
+    """
     params = dict(params or {})
     params.setdefault("api_key", settings.NASA_API_KEY)
 
     # Create cache key from endpoint and params
     cache_key = f"nasa:{endpoint}:{str(sorted(params.items()))}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
-
-    # Make API request
-    async with httpx.AsyncClient(timeout=15.0) as client:
+    async def load() -> Dict[str, Any]:
+        client = get_http_client("nasa")
         response = await client.get(f"{NASA_BASE_URL}{endpoint}", params=params)
         response.raise_for_status()
-        data = response.json()
+        return response.json()
 
-    # Cache the response
-    await set_cache(cache_key, data, expire=cache_seconds)
-    return data
+    return await cached_fetch(cache_key, load, ttl=cache_seconds, stale_ttl=stale_seconds)
 
 
 async def fetch_near_earth_objects(limit: int = 10) -> List[Dict[str, Any]]:
@@ -48,6 +49,7 @@ async def fetch_near_earth_objects(limit: int = 10) -> List[Dict[str, Any]]:
             "end_date": end_date.isoformat(),
         },
         cache_seconds=3600,  # Cache for 1 hour
+        stale_seconds=21600,  # Serve stale for up to 6 hours while refreshing
     )
 
     near_earth_objects = data.get("near_earth_objects", {})
@@ -80,21 +82,27 @@ async def fetch_asteroid_by_id(asteroid_id: str) -> Optional[Dict[str, Any]]:
     """Fetch detailed asteroid data by ID from NASA NeoWs API."""
     cache_key = f"nasa:asteroid:{asteroid_id}"
 
-    # Try cache first
-    cached = await get_cached(cache_key)
-    if cached:
-        return cached
+    # Cache for 1 hour, serve stale for up to a day while refreshing
+    return await cached_fetch(
+        cache_key,
+        lambda: _load_asteroid(asteroid_id),
+        ttl=3600,
+        stale_ttl=86400,
+    )
+
 
+async def _load_asteroid(asteroid_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch and parse a single asteroid from the NeoWs API."""
     params = {"api_key": settings.NASA_API_KEY}
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(
-            f"{NASA_BASE_URL}/neo/rest/v1/neo/{asteroid_id}",
-            params=params
-        )
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
+    client = get_http_client("nasa")
+    response = await client.get(
+        f"{NASA_BASE_URL}/neo/rest/v1/neo/{asteroid_id}",
+        params=params
+    )
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
 
     asteroid = response.json()
 
@@ -187,8 +195,6 @@ async def fetch_asteroid_by_id(asteroid_id: str) -> Optional[Dict[str, Any]]:
         ],
     }
 
-    # Cache for 1 hour
-    await set_cache(cache_key, result, expire=3600)
     return result
 
 
@@ -198,5 +204,10 @@ async def fetch_space_weather_data() -> Dict[str, Any]:
         "endDate": datetime.utcnow().strftime("%Y-%m-%d"),
     }
 
-    data = await _request("/DONKI/notifications", params=params, cache_seconds=600)  # Cache for 10 minutes
+    data = await _request(
+        "/DONKI/notifications",
+        params=params,
+        cache_seconds=600,  # Cache for 10 minutes
+        stale_seconds=3600,  # Serve stale for up to 1 hour while refreshing
+    )
     return {"notifications": data}
@@ -1,14 +1,32 @@
 """News collector service - aggregates news from NASA sources."""
 
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-import httpx
+from typing import Awaitable, Callable, List, Dict, Any, Optional, Tuple
+import asyncio
 import hashlib
+import re
+import time
+import uuid
+from sqlalchemy import String, cast, func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from core.config import settings
-from db.session import SessionLocal
+from core.http_clients import get_http_client
+from core.job_queue import report_progress
+from db.session import AsyncSessionLocal
 from db.models import SpaceNews
-from services import chromadb_service
+from db.pagination import keyset_page, next_cursor
+from services import chromadb_service, embedding_cache, feed_ingestor
+from services.intelligence_service import invalidate_dashboard_stats
+from services.news_items import COLLECT_TIMEOUT, categorize_content, parse_date
+from services.source_cursors import (
+    advance_watermark,
+    conditional_headers,
+    is_new,
+    load_cursors,
+    save_cursors,
+    update_validators,
+)
 
 
 # NASA API endpoints
@@ -16,299 +34,506 @@ NASA_IMAGE_LIBRARY = "https://images-api.nasa.gov/search"
 WEBB_TELESCOPE_NEWS = "https://webbtelescope.org/api/v1/news_releases"
 NASA_NEWS_API = "https://api.nasa.gov"
 
-
-def generate_content_hash(title: str, source: str) -> str:
-    """Generate a unique hash for deduplication."""
-    content = f"{source}:{title}".lower()
-    return hashlib.md5(content.encode()).hexdigest()
-
-
-async def collect_webb_news(limit: int = 20) -> List[Dict[str, Any]]:
-    """Collect news from Webb Telescope."""
+# Collectors in flight at once, and the wall-clock budget for each source
+COLLECT_CONCURRENCY = 8
+SOURCE_DEADLINE = 20.0
+
+# Rows per INSERT / lookup statement (keeps bind parameters under the driver limit)
+INSERT_BATCH_SIZE = 500
+
+# Previously failed embeddings retried per collection run
+EMBED_RETRY_LIMIT = 200
+
+# News list: every column except content, newest first (undated items by collection
+# time), matching idx_space_news_sort
+NEWS_LIST_COLUMNS = (
+    SpaceNews.id,
+    SpaceNews.source,
+    SpaceNews.external_id,
+    SpaceNews.title,
+    SpaceNews.summary,
+    SpaceNews.url,
+    SpaceNews.image_url,
+    SpaceNews.category,
+    SpaceNews.published_at,
+    SpaceNews.created_at,
+)
+NEWS_SORT_KEY = func.coalesce(SpaceNews.published_at, SpaceNews.created_at)
+
+
+def generate_content_hash(title: str, summary: Optional[str] = None) -> str:
+    """Hash of the normalized title and summary, shared by copies of a story across sources.
+
+    The content_hash backfill in db/init_db.py mirrors this normalization.
+    """
+    content = f"{title}\n{summary or ''}".lower()
+    content = re.sub(r"[^\w\s]", "", content)
+    content = re.sub(r"\s+", " ", content).strip()
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+async def collect_webb_news(limit: int = 20, cursor: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Collect news from Webb Telescope (only releases newer than the cursor)."""
     news_items = []
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                WEBB_TELESCOPE_NEWS,
-                params={"page": 1, "page_size": limit}
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                for item in data.get("results", []):
-                    news_items.append({
-                        "source": "webb_telescope",
-                        "external_id": str(item.get("id")),
-                        "title": item.get("title", ""),
-                        "summary": item.get("abstract", "")[:500] if item.get("abstract") else "",
-                        "content": item.get("abstract", ""),
-                        "url": f"https://webbtelescope.org{item.get('url', '')}",
-                        "image_url": item.get("thumbnail"),
-                        "category": categorize_content(item.get("title", ""), item.get("abstract", "")),
-                        "published_at": parse_date(item.get("release_date")),
-                    })
+        client = get_http_client("webbtelescope")
+        response = await client.get(
+            WEBB_TELESCOPE_NEWS,
+            params={"page": 1, "page_size": limit},
+            headers=conditional_headers(cursor),
+            timeout=COLLECT_TIMEOUT,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            for item in data.get("results", []):
+                published_at = parse_date(item.get("release_date"))
+                if not is_new(cursor, published_at):
+                    continue
+                news_items.append({
+                    "source": "webb_telescope",
+                    "external_id": str(item.get("id")),
+                    "title": item.get("title", ""),
+                    "summary": item.get("abstract", "")[:500] if item.get("abstract") else "",
+                    "content": item.get("abstract", ""),
+                    "url": f"https://webbtelescope.org{item.get('url', '')}",
+                    "image_url": item.get("thumbnail"),
+                    "category": categorize_content(item.get("title", ""), item.get("abstract", "")),
+                    "published_at": published_at,
+                })
+            update_validators(cursor, response)
     except Exception as e:
+        # Re-raise so the source is reported as failed and its cursor is not saved
         print(f"Error collecting Webb news: {e}")
+        raise
 
+    advance_watermark(cursor, news_items)
     return news_items
 
 
-async def collect_nasa_images(query: str = "space discovery", limit: int = 20) -> List[Dict[str, Any]]:
-    """Collect from NASA Image Library."""
+async def collect_nasa_images(
+    query: str = "space discovery",
+    limit: int = 20,
+    cursor: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Collect from NASA Image Library (only images newer than the cursor)."""
     news_items = []
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                NASA_IMAGE_LIBRARY,
-                params={
-                    "q": query,
-                    "media_type": "image",
-                    "year_start": str(datetime.now().year - 1),
-                }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get("collection", {}).get("items", [])[:limit]
+    # Narrow the search to the watermark's year once we have one
+    watermark = cursor.get("watermark") if cursor else None
+    year_start = watermark.year if watermark else datetime.now().year - 1
 
-                for item in items:
-                    item_data = item.get("data", [{}])[0]
-                    links = item.get("links", [])
-
-                    news_items.append({
-                        "source": "nasa_images",
-                        "external_id": item_data.get("nasa_id"),
-                        "title": item_data.get("title", ""),
-                        "summary": (item_data.get("description", "") or "")[:500],
-                        "content": item_data.get("description", ""),
-                        "url": f"https://images.nasa.gov/details/{item_data.get('nasa_id')}",
-                        "image_url": links[0].get("href") if links else None,
-                        "category": categorize_content(
-                            item_data.get("title", ""),
-                            item_data.get("description", ""),
-                            item_data.get("keywords", [])
-                        ),
-                        "published_at": parse_date(item_data.get("date_created")),
-                    })
+    try:
+        client = get_http_client("nasa_images")
+        response = await client.get(
+            NASA_IMAGE_LIBRARY,
+            params={
+                "q": query,
+                "media_type": "image",
+                "year_start": str(year_start),
+            },
+            headers=conditional_headers(cursor),
+            timeout=COLLECT_TIMEOUT,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            items = data.get("collection", {}).get("items", [])[:limit]
+
+            for item in items:
+                item_data = item.get("data", [{}])[0]
+                links = item.get("links", [])
+                published_at = parse_date(item_data.get("date_created"))
+                if not is_new(cursor, published_at):
+                    continue
+
+                news_items.append({
+                    "source": "nasa_images",
+                    "external_id": item_data.get("nasa_id"),
+                    "title": item_data.get("title", ""),
+                    "summary": (item_data.get("description", "") or "")[:500],
+                    "content": item_data.get("description", ""),
+                    "url": f"https://images.nasa.gov/details/{item_data.get('nasa_id')}",
+                    "image_url": links[0].get("href") if links else None,
+                    "category": categorize_content(
+                        item_data.get("title", ""),
+                        item_data.get("description", ""),
+                        item_data.get("keywords", [])
+                    ),
+                    "published_at": published_at,
+                })
+            update_validators(cursor, response)
     except Exception as e:
         print(f"Error collecting NASA images: {e}")
+        raise
 
+    advance_watermark(cursor, news_items)
     return news_items
 
 
-async def collect_apod(days: int = 7) -> List[Dict[str, Any]]:
-    """Collect Astronomy Picture of the Day."""
+async def collect_apod(days: int = 7, cursor: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Collect Astronomy Picture of the Day (only days after the cursor)."""
     news_items = []
 
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    watermark = cursor.get("watermark") if cursor else None
+    if watermark:
+        start_date = max(start_date, watermark + timedelta(days=1))
+        if start_date.date() > end_date.date():
+            return news_items
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
-
-            response = await client.get(
-                f"{NASA_NEWS_API}/planetary/apod",
-                params={
-                    "api_key": settings.NASA_API_KEY,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": end_date.strftime("%Y-%m-%d"),
-                }
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    for item in data:
-                        news_items.append({
-                            "source": "apod",
-                            "external_id": item.get("date"),
-                            "title": item.get("title", ""),
-                            "summary": (item.get("explanation", "") or "")[:500],
-                            "content": item.get("explanation", ""),
-                            "url": item.get("url"),
-                            "image_url": item.get("hdurl") or item.get("url"),
-                            "category": categorize_content(
-                                item.get("title", ""),
-                                item.get("explanation", "")
-                            ),
-                            "published_at": parse_date(item.get("date")),
-                        })
+        client = get_http_client("nasa")
+
+        response = await client.get(
+            f"{NASA_NEWS_API}/planetary/apod",
+            params={
+                "api_key": settings.NASA_API_KEY,
+                "start_date": start_date.strftime("%Y-%m-%d"),
+                "end_date": end_date.strftime("%Y-%m-%d"),
+            },
+            timeout=COLLECT_TIMEOUT,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            if isinstance(data, list):
+                for item in data:
+                    news_items.append({
+                        "source": "apod",
+                        "external_id": item.get("date"),
+                        "title": item.get("title", ""),
+                        "summary": (item.get("explanation", "") or "")[:500],
+                        "content": item.get("explanation", ""),
+                        "url": item.get("url"),
+                        "image_url": item.get("hdurl") or item.get("url"),
+                        "category": categorize_content(
+                            item.get("title", ""),
+                            item.get("explanation", "")
+                        ),
+                        "published_at": parse_date(item.get("date")),
+                    })
     except Exception as e:
         print(f"Error collecting APOD: {e}")
+        raise
 
+    advance_watermark(cursor, news_items)
     return news_items
 
 
-async def collect_space_weather() -> List[Dict[str, Any]]:
-    """Collect space weather notifications from DONKI."""
+async def collect_space_weather(cursor: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Collect space weather notifications from DONKI (only those after the cursor)."""
     news_items = []
 
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=7)
-
-            response = await client.get(
-                f"{NASA_NEWS_API}/DONKI/notifications",
-                params={
-                    "api_key": settings.NASA_API_KEY,
-                    "startDate": start_date.strftime("%Y-%m-%d"),
-                    "endDate": end_date.strftime("%Y-%m-%d"),
-                }
-            )
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=7)
+    watermark = cursor.get("watermark") if cursor else None
+    if watermark:
+        start_date = max(start_date, watermark)
 
-            if response.status_code == 200:
-                data = response.json()
-                for item in data:
-                    news_items.append({
-                        "source": "donki",
-                        "external_id": item.get("messageID"),
-                        "title": f"Space Weather: {item.get('messageType')}",
-                        "summary": (item.get("messageBody", "") or "")[:500],
-                        "content": item.get("messageBody", ""),
-                        "url": item.get("messageURL"),
-                        "image_url": None,
-                        "category": "space_weather",
-                        "published_at": parse_date(item.get("messageIssueTime")),
-                    })
+    try:
+        client = get_http_client("nasa")
+
+        response = await client.get(
+            f"{NASA_NEWS_API}/DONKI/notifications",
+            params={
+                "api_key": settings.NASA_API_KEY,
+                "startDate": start_date.strftime("%Y-%m-%d"),
+                "endDate": end_date.strftime("%Y-%m-%d"),
+            },
+            timeout=COLLECT_TIMEOUT,
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            for item in data:
+                published_at = parse_date(item.get("messageIssueTime"))
+                if not is_new(cursor, published_at):
+                    continue
+                news_items.append({
+                    "source": "donki",
+                    "external_id": item.get("messageID"),
+                    "title": f"Space Weather: {item.get('messageType')}",
+                    "summary": (item.get("messageBody", "") or "")[:500],
+                    "content": item.get("messageBody", ""),
+                    "url": item.get("messageURL"),
+                    "image_url": None,
+                    "category": "space_weather",
+                    "published_at": published_at,
+                })
     except Exception as e:
         print(f"Error collecting space weather: {e}")
+        raise
 
+    advance_watermark(cursor, news_items)
     return news_items
 
 
-def categorize_content(title: str, description: str = "", keywords: List[str] = None) -> str:
-    """Categorize content based on text analysis."""
-    text = f"{title} {description} {' '.join(keywords or [])}".lower()
-
-    categories = {
-        "exoplanets": ["exoplanet", "planet", "habitable", "biosignature", "transit", "atmosphere"],
-        "galaxies": ["galaxy", "galaxies", "quasar", "agn", "merger", "cosmic"],
-        "stars": ["star", "stellar", "supernova", "neutron", "pulsar", "dwarf"],
-        "nebulae": ["nebula", "nebulae", "cloud", "gas", "dust", "formation"],
-        "black_holes": ["black hole", "event horizon", "singularity", "gravitational"],
-        "solar_system": ["mars", "jupiter", "saturn", "asteroid", "comet", "moon"],
-        "cosmology": ["universe", "big bang", "dark matter", "dark energy", "expansion"],
-        "space_weather": ["solar", "flare", "cme", "geomagnetic", "radiation"],
+async def collect_all_news() -> Dict[str, Any]:
+    """Collect news from all sources and store in database."""
+    started = time.perf_counter()
+
+    # Collect from all sources concurrently, each from its own cursor
+    collectors = {
+        "news:webb_telescope": lambda cursor: collect_webb_news(20, cursor),
+        "news:nasa_images": lambda cursor: collect_nasa_images("space telescope discovery", 20, cursor),
+        "news:apod": lambda cursor: collect_apod(7, cursor),
+        "news:donki": lambda cursor: collect_space_weather(cursor),
     }
+    for feed_name in feed_ingestor.FEEDS:
+        collectors[f"feed:{feed_name}"] = lambda cursor, n=feed_name: feed_ingestor.collect_feed(n, cursor)
 
-    for category, keywords_list in categories.items():
-        if any(kw in text for kw in keywords_list):
-            return category
-
-    return "other"
-
-
-def parse_date(date_str: Optional[str]) -> Optional[datetime]:
-    """Parse various date formats."""
-    if not date_str:
-        return None
-
-    formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d",
-    ]
-
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str[:26], fmt)
-        except (ValueError, TypeError):
-            continue
-
-    return None
-
+    cursors = await load_cursors(collectors)
+    await report_progress("collecting", sources=len(collectors))
+    semaphore = asyncio.Semaphore(COLLECT_CONCURRENCY)
+    results = await asyncio.gather(*(
+        _run_collector(name, lambda c=collector, n=name: c(cursors[n]), semaphore)
+        for name, collector in collectors.items()
+    ))
 
-async def collect_all_news() -> Dict[str, Any]:
-    """Collect news from all sources and store in database."""
     all_news = []
+    sources = {}
+    for name, items, report in results:
+        all_news.extend(items)
+        sources[name] = report
+
+    collect_ms = _elapsed_ms(started)
+    await report_progress("storing", items=len(all_news))
+    # Retry earlier embedding failures before adding this run's items
+    embedded_retried = await embed_pending_news()
+    result = await store_news(all_news)
+    result["sources"] = sources
+    result["embedded_retried"] = embedded_retried
+
+    # Advance cursors only once their items are stored
+    await save_cursors({
+        name: cursors[name]
+        for name, report in sources.items()
+        if report["status"] == "ok"
+    })
+    result["timings_ms"] = {
+        "collect": collect_ms,
+        **result["timings_ms"],
+        "total": _elapsed_ms(started),
+    }
+    return result
 
-    # Collect from all sources
-    webb_news = await collect_webb_news(20)
-    nasa_images = await collect_nasa_images("space telescope discovery", 20)
-    apod_news = await collect_apod(7)
-    weather_news = await collect_space_weather()
 
-    all_news.extend(webb_news)
-    all_news.extend(nasa_images)
-    all_news.extend(apod_news)
-    all_news.extend(weather_news)
+async def _run_collector(
+    name: str,
+    collector: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    semaphore: asyncio.Semaphore,
+) -> Tuple[str, List[Dict[str, Any]], Dict[str, Any]]:
+    """Run one collector within its deadline; a slow or failing source yields no items."""
+    async with semaphore:
+        started = time.perf_counter()
+        try:
+            items = await asyncio.wait_for(collector(), timeout=SOURCE_DEADLINE)
+            status = "ok"
+        except asyncio.TimeoutError:
+            print(f"[Collector] {name} exceeded {SOURCE_DEADLINE}s deadline")
+            items, status = [], "timeout"
+        except Exception as e:
+            print(f"[Collector] {name} failed: {e}")
+            items, status = [], "error"
+
+    return name, items, {
+        "items": len(items),
+        "latency_ms": _elapsed_ms(started),
+        "status": status,
+    }
 
-    # Store in database
-    db = SessionLocal()
-    stored_count = 0
-    skipped_count = 0
 
-    try:
-        for news_item in all_news:
-            # Check if already exists
-            existing = db.query(SpaceNews).filter(
-                SpaceNews.source == news_item["source"],
-                SpaceNews.external_id == news_item["external_id"]
-            ).first()
-
-            if existing:
-                skipped_count += 1
-                continue
-
-            # Create new record
-            news_record = SpaceNews(
-                source=news_item["source"],
-                external_id=news_item["external_id"],
-                title=news_item["title"],
-                summary=news_item["summary"],
-                content=news_item["content"],
-                url=news_item["url"],
-                image_url=news_item["image_url"],
-                category=news_item["category"],
-                published_at=news_item["published_at"],
-            )
-
-            db.add(news_record)
-            db.flush()
-
-            # Add to ChromaDB for embeddings
-            document_text = f"{news_item['title']}\n\n{news_item['summary']}"
-            await chromadb_service.add_documents(
-                documents=[document_text],
-                metadatas=[{
-                    "source": news_item["source"],
-                    "category": news_item["category"],
-                    "title": news_item["title"],
-                    "date": news_item["published_at"].isoformat() if news_item["published_at"] else "",
-                }],
-                ids=[str(news_record.id)],
-            )
-
-            # Update embedding_id reference
-            news_record.embedding_id = str(news_record.id)
-            stored_count += 1
-
-        db.commit()
+async def store_news(news_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Store collected items in one batch, then embed the new ones in one Chroma call.
+
+    Duplicates are dropped within the batch, then against existing rows
+    with a single (source, external_id) lookup and a single content hash
+    lookup, which also catches the same story published by another
+    source; the insert itself skips anything a concurrent run stored in
+    the meantime.
+
+    Rows are committed before embedding, so the transaction isn't held
+    open during the model call; rows whose embedding fails keep a NULL
+    embedding_id and are retried by embed_pending_news.
+    """
+    timings = {}
+
+    # Dedupe within the batch
+    stage = time.perf_counter()
+    unique_items = []
+    seen = set()
+    seen_hashes = set()
+    for item in news_items:
+        key = (item["source"], item["external_id"])
+        content_hash = generate_content_hash(item["title"], item["summary"])
+        if (item["external_id"] is not None and key in seen) or content_hash in seen_hashes:
+            continue
+        seen.add(key)
+        seen_hashes.add(content_hash)
+        unique_items.append({**item, "content_hash": content_hash})
 
-    except Exception as e:
-        db.rollback()
-        raise e
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            # Existing rows in one query
+            keys = [(item["source"], item["external_id"]) for item in unique_items if item["external_id"] is not None]
+            existing = set()
+            for i in range(0, len(keys), INSERT_BATCH_SIZE):
+                result = await db.execute(
+                    select(SpaceNews.source, SpaceNews.external_id).where(
+                        tuple_(SpaceNews.source, SpaceNews.external_id).in_(keys[i:i + INSERT_BATCH_SIZE])
+                    )
+                )
+                existing.update(tuple(row) for row in result.all())
+            hashes = [item["content_hash"] for item in unique_items]
+            existing_hashes = set()
+            for i in range(0, len(hashes), INSERT_BATCH_SIZE):
+                result = await db.execute(
+                    select(SpaceNews.content_hash).where(
+                        SpaceNews.content_hash.in_(hashes[i:i + INSERT_BATCH_SIZE])
+                    )
+                )
+                existing_hashes.update(result.scalars().all())
+            new_items = [
+                item for item in unique_items
+                if (item["source"], item["external_id"]) not in existing
+                and item["content_hash"] not in existing_hashes
+            ]
+            timings["dedupe"] = _elapsed_ms(stage)
+
+            # Bulk insert; embedding_id is set once the row is in Chroma
+            stage = time.perf_counter()
+            now = datetime.utcnow()
+            rows = []
+            for item in new_items:
+                news_id = uuid.uuid4()
+                rows.append({
+                    "id": news_id,
+                    "source": item["source"],
+                    "external_id": item["external_id"],
+                    "title": item["title"],
+                    "summary": item["summary"],
+                    "content": item["content"],
+                    "url": item["url"],
+                    "image_url": item["image_url"],
+                    "category": item["category"],
+                    "published_at": item["published_at"],
+                    "content_hash": item["content_hash"],
+                    "created_at": now,
+                })
+
+            inserted_ids = set()
+            for i in range(0, len(rows), INSERT_BATCH_SIZE):
+                result = await db.execute(
+                    pg_insert(SpaceNews)
+                    .values(rows[i:i + INSERT_BATCH_SIZE])
+                    .on_conflict_do_nothing(index_elements=["source", "external_id"])
+                    .returning(SpaceNews.id)
+                )
+                inserted_ids.update(result.scalars().all())
+            await db.commit()
+            timings["insert"] = _elapsed_ms(stage)
+
+        except Exception as e:
+            await db.rollback()
+            raise e
+
+    stored = [row for row in rows if row["id"] in inserted_ids]
+    if stored:
+        await invalidate_dashboard_stats()
+
+    # Add to ChromaDB for embeddings in one pass
+    stage = time.perf_counter()
+    embedded = await embed_news(stored)
+    timings["embed"] = _elapsed_ms(stage)
 
     return {
-        "total_collected": len(all_news),
-        "stored": stored_count,
-        "skipped_duplicates": skipped_count,
+        "total_collected": len(news_items),
+        "stored": len(stored),
+        "embedded": embedded,
+        "skipped_duplicates": len(news_items) - len(stored),
+        "timings_ms": timings,
     }
 
 
-async def get_recent_news(limit: int = 50) -> List[Dict[str, Any]]:
-    """Get recent news from database."""
-    db = SessionLocal()
-    try:
-        news = db.query(SpaceNews).order_by(
-            SpaceNews.published_at.desc()
-        ).limit(limit).all()
+async def embed_news(rows: List[Dict[str, Any]]) -> int:
+    """Add stored news rows to ChromaDB and record their embedding_id.
 
-        return [n.to_dict() for n in news]
-    finally:
-        db.close()
+    Returns how many were embedded. A Chroma failure is logged and leaves
+    the rows pending for embed_pending_news instead of failing the caller.
+    """
+    if not rows:
+        return 0
+    documents = [f"{row['title']}\n\n{row['summary']}" for row in rows]
+    ids = [str(row["id"]) for row in rows]
+    try:
+        await chromadb_service.add_documents(
+            documents=documents,
+            metadatas=[
+                {
+                    "source": row["source"],
+                    "category": row["category"],
+                    "title": row["title"],
+                    "date": row["published_at"].isoformat() if row["published_at"] else "",
+                }
+                for row in rows
+            ],
+            ids=ids,
+            embeddings=await embedding_cache.get_embeddings(documents),
+        )
+    except Exception as e:
+        print(f"[NewsCollector] Embedding {len(rows)} items failed, will retry: {e}")
+        return 0
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(SpaceNews)
+            .where(SpaceNews.id.in_([row["id"] for row in rows]))
+            .values(embedding_id=cast(SpaceNews.id, String))
+        )
+        await db.commit()
+    return len(rows)
+
+
+async def embed_pending_news(limit: int = EMBED_RETRY_LIMIT) -> int:
+    """Embed stored news whose earlier embedding failed; returns how many succeeded."""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                SpaceNews.id, SpaceNews.title, SpaceNews.summary, SpaceNews.source,
+                SpaceNews.category, SpaceNews.published_at,
+            ).filter(SpaceNews.embedding_id.is_(None)).order_by(SpaceNews.created_at).limit(limit)
+        )
+        rows = [row._asdict() for row in result.all()]
+    return await embed_news(rows)
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 1)
+
+
+async def get_recent_news(limit: int = 50, cursor: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Get recent news, newest first; returns (news, next_cursor).
+
+    Undated items sort by when they were collected. List rows leave out
+    the full content. Raises ValueError for a malformed cursor.
+    """
+    sort_columns = [NEWS_SORT_KEY, SpaceNews.id]
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            keyset_page(select(*NEWS_LIST_COLUMNS, NEWS_SORT_KEY.label("sort_at")), sort_columns, limit, cursor)
+        )).all()
+        rows, cursor = next_cursor(rows, limit, lambda row: (row.sort_at, row.id))
+
+        return [news_row_to_dict(row) for row in rows], cursor
+
+
+def news_row_to_dict(row: Any) -> Dict[str, Any]:
+    """List-view dict for a row selected with NEWS_LIST_COLUMNS (extra columns are ignored)."""
+    item = {column.key: getattr(row, column.key) for column in NEWS_LIST_COLUMNS}
+    item["id"] = str(row.id)
+    item["published_at"] = row.published_at.isoformat() if row.published_at else None
+    item["created_at"] = row.created_at.isoformat() if row.created_at else None
+    return item
@@ -0,0 +1,51 @@
+"""Helpers shared by the news collectors and the feed ingestor for building SpaceNews items."""
+
+from datetime import datetime
+from typing import List, Optional
+
+# Per-request timeout for collection runs (longer than the interactive default)
+COLLECT_TIMEOUT = 15.0
+
+
+def categorize_content(title: str, description: str = "", keywords: List[str] = None) -> str:
+    """Categorize content based on text analysis."""
+    text = f"{title} {description} {' '.join(keywords or [])}".lower()
+
+    categories = {
+        "exoplanets": ["exoplanet", "planet", "habitable", "biosignature", "transit", "atmosphere"],
+        "galaxies": ["galaxy", "galaxies", "quasar", "agn", "merger", "cosmic"],
+        "stars": ["star", "stellar", "supernova", "neutron", "pulsar", "dwarf"],
+        "nebulae": ["nebula", "nebulae", "cloud", "gas", "dust", "formation"],
+        "black_holes": ["black hole", "event horizon", "singularity", "gravitational"],
+        "solar_system": ["mars", "jupiter", "saturn", "asteroid", "comet", "moon"],
+        "cosmology": ["universe", "big bang", "dark matter", "dark energy", "expansion"],
+        "space_weather": ["solar", "flare", "cme", "geomagnetic", "radiation"],
+    }
+
+    for category, keywords_list in categories.items():
+        if any(kw in text for kw in keywords_list):
+            return category
+
+    return "other"
+
+
+def parse_date(date_str: Optional[str]) -> Optional[datetime]:
+    """Parse various date formats."""
+    if not date_str:
+        return None
+
+    formats = [
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%Y-%m-%dT%H:%M:%S",
+        "%Y-%m-%dT%H:%MZ",
+        "%Y-%m-%d",
+    ]
+
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str[:26], fmt)
+        except (ValueError, TypeError):
+            continue
+
+    return None
@@ -0,0 +1,192 @@
+"""Live ISS/JWST position stream fanned out to all subscribers.
+
+One producer across the whole deployment (whichever worker holds a short
+Redis lease and has listeners) publishes a snapshot to a Redis channel.
+Every worker relays that channel to its own subscribers through bounded
+in-process queues, so upstream load does not grow with connected clients.
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from core.cache import get_redis
+from services import iss_tracker
+from services.mast_service import fetch_jwst_status
+
+CHANNEL = "stream:positions"
+PRODUCER_LEASE_KEY = "stream:positions:producer"
+PRODUCER_LEASE_MS = 15000
+
+# ISS moves ~38 km between snapshots at this interval
+PUBLISH_INTERVAL = 5.0
+SUBSCRIBER_QUEUE_SIZE = 10
+
+# Renew the lease only if we still own it
+_RENEW_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Release the lease only if we still own it (compare-and-delete)
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+WORKER_ID = uuid.uuid4().hex
+
+_subscribers: Set["asyncio.Queue[str]"] = set()
+_latest: Optional[str] = None
+_holds_lease = False
+_producer_task: Optional["asyncio.Task[None]"] = None
+_relay_task: Optional["asyncio.Task[None]"] = None
+
+
+async def build_snapshot() -> Dict[str, Any]:
+    """Current ISS position and JWST status."""
+    iss = iss_tracker.get_position() if iss_tracker.is_ready() else None
+    jwst = await fetch_jwst_status()
+    return {
+        "iss": iss,
+        "jwst": jwst,
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+def _broadcast(message: str) -> None:
+    """Push a message to every local subscriber, dropping the oldest if one lags."""
+    global _latest
+    _latest = message
+    for queue in list(_subscribers):
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(message)
+
+
+async def _hold_lease(redis: Any) -> bool:
+    """Acquire or renew the producer lease for this worker."""
+    if await redis.set(PRODUCER_LEASE_KEY, WORKER_ID, nx=True, px=PRODUCER_LEASE_MS):
+        return True
+    return bool(await redis.eval(_RENEW_LEASE_SCRIPT, 1, PRODUCER_LEASE_KEY, WORKER_ID, PRODUCER_LEASE_MS))
+
+
+async def _release_lease() -> None:
+    """Hand the producer lease back so a worker that still has listeners takes over."""
+    global _holds_lease
+    _holds_lease = False
+    redis = await get_redis()
+    await redis.eval(_RELEASE_LEASE_SCRIPT, 1, PRODUCER_LEASE_KEY, WORKER_ID)
+
+
+async def _produce_loop() -> None:
+    """Publish snapshots while this worker holds the lease and has listeners."""
+    global _holds_lease
+    while True:
+        try:
+            if not _subscribers:
+                # Last local listener left - don't sit on the lease until it expires
+                if _holds_lease:
+                    await _release_lease()
+            else:
+                try:
+                    redis = await get_redis()
+                    is_producer = _holds_lease = await _hold_lease(redis)
+                except Exception:
+                    redis = None
+                    is_producer = True
+
+                if is_producer:
+                    message = json.dumps(await build_snapshot())
+                    if redis is not None:
+                        await redis.publish(CHANNEL, message)
+                    else:
+                        # Redis unavailable - serve this worker's clients directly
+                        _broadcast(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[PositionStream] Producer error: {e}")
+        await asyncio.sleep(PUBLISH_INTERVAL)
+
+
+async def _relay_loop() -> None:
+    """Relay snapshots published by any worker to local subscribers."""
+    while True:
+        try:
+            redis = await get_redis()
+            pubsub = redis.pubsub()
+            await pubsub.subscribe(CHANNEL)
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        _broadcast(message["data"])
+            finally:
+                await pubsub.close()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[PositionStream] Relay error: {e}")
+        await asyncio.sleep(1)
+
+
+def _ensure_started() -> None:
+    global _producer_task, _relay_task
+    if _producer_task is None:
+        _producer_task = asyncio.ensure_future(_produce_loop())
+    if _relay_task is None:
+        _relay_task = asyncio.ensure_future(_relay_loop())
+
+
+async def subscribe() -> AsyncIterator[Optional[str]]:
+    """Yield snapshot messages for one client, starting with the latest one.
+
+    Yields None when no snapshot arrived within the keepalive interval so
+    the caller can send a keepalive.
+    """
+    queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    _subscribers.add(queue)
+    _ensure_started()
+    try:
+        if _latest is not None:
+            yield _latest
+        while True:
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=PUBLISH_INTERVAL * 3)
+            except asyncio.TimeoutError:
+                yield None
+    finally:
+        _subscribers.discard(queue)
+
+
+async def shutdown() -> None:
+    """Stop the producer and relay tasks and release the producer lease."""
+    global _producer_task, _relay_task
+    for task in (_producer_task, _relay_task):
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    _producer_task = None
+    _relay_task = None
+    if _holds_lease:
+        try:
+            await _release_lease()
+        except Exception:
+            pass
+
+
+def get_stream_stats() -> Dict[str, Any]:
+    """Local subscriber count for this worker and whether it is the producer."""
+    return {"subscribers": len(_subscribers), "worker_id": WORKER_ID, "producer": _holds_lease}
@@ -0,0 +1,122 @@
+"""Hybrid news search: Postgres full-text ranking merged with Chroma similarity.
+
+Keyword matches (mission names, instrument acronyms) come from the GIN
+indexed search_vector; semantic matches come from the embedding store.
+The two ranked lists are merged with reciprocal rank fusion, which needs
+no calibration between ts_rank scores and vector distances.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, select
+
+from db.session import AsyncSessionLocal
+from db.models import SpaceNews
+from services import chromadb_service
+from services.news_collector import NEWS_LIST_COLUMNS, NEWS_SORT_KEY, news_row_to_dict
+
+# Candidates taken from each ranker before fusion
+CANDIDATES_PER_RANKER = 50
+# Reciprocal rank fusion constant; damps the weight of the very top ranks
+RRF_K = 60
+
+
+def _apply_filters(
+    query: Any,
+    since: Optional[datetime],
+    until: Optional[datetime],
+    source: Optional[str],
+    category: Optional[str],
+) -> Any:
+    if since:
+        query = query.filter(NEWS_SORT_KEY >= since)
+    if until:
+        query = query.filter(NEWS_SORT_KEY < until)
+    if source:
+        query = query.filter(SpaceNews.source == source)
+    if category:
+        query = query.filter(SpaceNews.category == category)
+    return query
+
+
+async def _keyword_search(query_text: str, filters: Dict[str, Any]) -> List[Any]:
+    """News rows matching the query terms, best ts_rank first."""
+    ts_query = func.websearch_to_tsquery("english", query_text)
+    rank = func.ts_rank_cd(SpaceNews.search_vector, ts_query)
+    query = select(*NEWS_LIST_COLUMNS, rank.label("fts_rank")).filter(SpaceNews.search_vector.op("@@")(ts_query))
+    query = _apply_filters(query, **filters)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(query.order_by(rank.desc()).limit(CANDIDATES_PER_RANKER))
+        return result.all()
+
+
+async def _vector_search(query_text: str, filters: Dict[str, Any]) -> List[Any]:
+    """News rows nearest to the query embedding, closest first, with their distances."""
+    where_filter = {
+        key: value for key, value in (("source", filters["source"]), ("category", filters["category"])) if value
+    }
+    if len(where_filter) > 1:
+        where_filter = {"$and": [{key: value} for key, value in where_filter.items()]}
+    similar = await chromadb_service.query_similar(
+        query_text=query_text,
+        n_results=CANDIDATES_PER_RANKER,
+        where_filter=where_filter or None,
+    )
+    distances = dict(zip(similar["ids"], similar["distances"]))
+    if not distances:
+        return []
+
+    # Dates are filtered here, against the same sort key the keyword search uses
+    query = select(*NEWS_LIST_COLUMNS, SpaceNews.embedding_id).filter(
+        SpaceNews.embedding_id.in_(list(distances))
+    )
+    query = _apply_filters(query, **filters)
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(query)).all()
+    return sorted(
+        ({"row": row, "distance": distances[row.embedding_id]} for row in rows),
+        key=lambda match: match["distance"],
+    )
+
+
+async def search_news(
+    query_text: str,
+    limit: int = 20,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    source: Optional[str] = None,
+    category: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Search news by keywords and meaning, best matches first.
+
+    Each result carries its fused score plus the full-text rank and vector
+    distance it got from either ranker (None when only one matched).
+    """
+    filters = {"since": since, "until": until, "source": source, "category": category}
+    keyword_rows, vector_matches = await asyncio.gather(
+        _keyword_search(query_text, filters),
+        _vector_search(query_text, filters),
+    )
+
+    results: Dict[uuid.UUID, Dict[str, Any]] = {}
+
+    def entry(row: Any) -> Dict[str, Any]:
+        if row.id not in results:
+            results[row.id] = {**news_row_to_dict(row), "score": 0.0, "fts_rank": None, "vector_distance": None}
+        return results[row.id]
+
+    for position, row in enumerate(keyword_rows):
+        item = entry(row)
+        item["score"] += 1.0 / (RRF_K + position + 1)
+        item["fts_rank"] = row.fts_rank
+
+    for position, match in enumerate(vector_matches):
+        item = entry(match["row"])
+        item["score"] += 1.0 / (RRF_K + position + 1)
+        item["vector_distance"] = match["distance"]
+
+    ranked = sorted(results.values(), key=lambda item: item["score"], reverse=True)
+    return ranked[:limit]
@@ -0,0 +1,97 @@
+"""Per-source ingestion cursors: watermark plus HTTP validators for conditional GETs."""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from db.session import AsyncSessionLocal
+from db.models import SourceCursor
+
+
+def empty_cursor() -> Dict[str, Any]:
+    return {"watermark": None, "etag": None, "last_modified": None}
+
+
+async def load_cursors(names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Load cursors by name; unknown names get an empty cursor."""
+    names = list(names)
+    cursors = {name: empty_cursor() for name in names}
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(SourceCursor).where(SourceCursor.name.in_(names)))
+        for row in result.scalars().all():
+            cursors[row.name] = {
+                "watermark": row.watermark,
+                "etag": row.etag,
+                "last_modified": row.last_modified,
+            }
+    return cursors
+
+
+async def save_cursors(cursors: Dict[str, Dict[str, Any]]) -> None:
+    """Upsert cursors in one statement."""
+    if not cursors:
+        return
+    now = datetime.utcnow()
+    rows = [
+        {
+            "name": name,
+            "watermark": cursor.get("watermark"),
+            "etag": cursor.get("etag"),
+            "last_modified": cursor.get("last_modified"),
+            "updated_at": now,
+        }
+        for name, cursor in cursors.items()
+    ]
+    stmt = pg_insert(SourceCursor).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={
+            "watermark": stmt.excluded.watermark,
+            "etag": stmt.excluded.etag,
+            "last_modified": stmt.excluded.last_modified,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    async with AsyncSessionLocal() as db:
+        await db.execute(stmt)
+        await db.commit()
+
+
+def conditional_headers(cursor: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """If-None-Match / If-Modified-Since headers from a cursor's validators."""
+    headers = {}
+    if cursor:
+        if cursor.get("etag"):
+            headers["If-None-Match"] = cursor["etag"]
+        if cursor.get("last_modified"):
+            headers["If-Modified-Since"] = cursor["last_modified"]
+    return headers
+
+
+def update_validators(cursor: Optional[Dict[str, Any]], response: httpx.Response) -> None:
+    """Remember the response's validators for the next conditional request."""
+    if cursor is None:
+        return
+    cursor["etag"] = response.headers.get("etag") or cursor.get("etag")
+    cursor["last_modified"] = response.headers.get("last-modified") or cursor.get("last_modified")
+
+
+def is_new(cursor: Optional[Dict[str, Any]], published_at: Optional[datetime]) -> bool:
+    """Whether an item is newer than the cursor's watermark (undated items always are)."""
+    if cursor is None or cursor.get("watermark") is None or published_at is None:
+        return True
+    return published_at > cursor["watermark"]
+
+
+def advance_watermark(cursor: Optional[Dict[str, Any]], items: Iterable[Dict[str, Any]]) -> None:
+    """Move the watermark to the newest published_at among items."""
+    if cursor is None:
+        return
+    dates = [item["published_at"] for item in items if item.get("published_at")]
+    if cursor.get("watermark"):
+        dates.append(cursor["watermark"])
+    if dates:
+        cursor["watermark"] = max(dates)